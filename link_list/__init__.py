@@ -0,0 +1,43 @@
+'''Linked list data structures.
+
+    from link_list import Linkedlist, CSLinked_List
+
+Nothing is imported until a name is first used: `import link_list`
+only loads this file, and `link_list.Linkedlist` loads just the modules
+that Linkedlist needs. Importing never builds or prints anything; the
+demos run with python -m, for example:
+
+    python -m link_list.singly_llinked_list.insertion_in_ssl'''
+
+import importlib
+
+
+_LAZY = {
+    "Node": "link_list.singly_llinked_list.sll_nodesnLL",
+    "LinkedList": "link_list.singly_llinked_list.sll_nodesnLL",
+    "Linkedlist": "link_list.singly_llinked_list.insertion_in_ssl",
+    "CSLinked_List": "link_list.singly_llinked_list.circular_singly_ll",
+    "ArrayLinkedlist": "link_list.singly_llinked_list.array_backed_ll",
+    "PersistentList": "link_list.singly_llinked_list.persistent_ll",
+    "SharedLinkedlist": "link_list.singly_llinked_list.shared_ll",
+    "UnrolledLinkedlist": "link_list.singly_llinked_list.unrolled_ll",
+    "DoublyLinkedlist": "link_list.doubly_linked_list.doubly_ll",
+}
+# public name → module that defines it
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    # Called only for names not found in this module (PEP 562)
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    # Cache it, the next access does not come through __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,321 @@
+'''Benchmarks for the linked lists in this folder.
+
+Times the common operations of Linkedlist and CSLinked_List next to
+Python's list and collections.deque, for several list sizes, and reports
+the peak memory needed to build each structure.
+
+Run from the repository root:
+
+    python -m link_list.bench
+    python -m link_list.bench --sizes 100 10000 1000000 --output today.json
+    python -m link_list.bench --output today.json --compare yesterday.json
+    python -m link_list.bench --import-time
+
+--output writes all numbers as JSON. --compare prints how much slower or
+faster every (structure, operation, size) got compared with an older JSON
+file from the SAME machine.
+
+--import-time only checks that importing the list modules prints nothing
+and stays under --import-budget milliseconds (measured with
+python -X importtime). It exits with status 1 if the check fails.'''
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+from .singly_llinked_list.circular_singly_ll import CSLinked_List
+from .singly_llinked_list.insertion_in_ssl import Linkedlist
+
+
+DEFAULT_SIZES = [10**2, 10**3, 10**4, 10**5]
+
+OPERATIONS = [
+    "append", "prepend", "insert_head", "insert_middle", "insert_tail",
+    "get", "search", "pop", "pop_first",
+]
+# Growing operations run first and shrinking ones last,
+# so the size stays close to n during the whole run
+# search always looks for -1, which is never stored → one full scan
+
+
+def _list_operations():
+    return {
+        "append": lambda c, i: c.append(i),
+        "prepend": lambda c, i: c.insert(0, i),
+        "insert_head": lambda c, i: c.insert(0, i),
+        "insert_middle": lambda c, i: c.insert(len(c) // 2, i),
+        "insert_tail": lambda c, i: c.insert(len(c), i),
+        "get": lambda c, i: c[i % len(c)],
+        "search": lambda c, i: -1 in c,
+        "pop": lambda c, i: c.pop(),
+        "pop_first": lambda c, i: c.pop(0),
+    }
+
+
+def _deque_operations():
+    return {
+        "append": lambda c, i: c.append(i),
+        "prepend": lambda c, i: c.appendleft(i),
+        "insert_head": lambda c, i: c.insert(0, i),
+        "insert_middle": lambda c, i: c.insert(len(c) // 2, i),
+        "insert_tail": lambda c, i: c.insert(len(c), i),
+        "get": lambda c, i: c[i % len(c)],
+        "search": lambda c, i: -1 in c,
+        "pop": lambda c, i: c.pop(),
+        "pop_first": lambda c, i: c.popleft(),
+    }
+
+
+def _linkedlist_operations():
+    return {
+        "append": lambda c, i: c.append(i),
+        "prepend": lambda c, i: c.prepend(i),
+        "insert_head": lambda c, i: c.insert(0, i),
+        "insert_middle": lambda c, i: c.insert(c.length // 2, i),
+        "insert_tail": lambda c, i: c.insert(c.length, i),
+        "get": lambda c, i: c.get(i % c.length),
+        "search": lambda c, i: c.search(-1),
+        "pop": lambda c, i: c.pop(),
+        "pop_first": lambda c, i: c.pop_first(),
+    }
+
+
+def _cslinked_list_operations():
+    return _linkedlist_operations()
+    # CSLinked_List has the same positional API as Linkedlist
+
+
+def _build_list(values):
+    return list(values)
+
+
+def _build_deque(values):
+    return deque(values)
+
+
+def _build_linked(cls):
+    def build(values):
+        linked_list = cls()
+        for value in values:
+            linked_list.append(value)
+        return linked_list
+    return build
+
+
+STRUCTURES = {
+    "list": (_build_list, _list_operations),
+    "deque": (_build_deque, _deque_operations),
+    "Linkedlist": (_build_linked(Linkedlist), _linkedlist_operations),
+    "CSLinked_List": (_build_linked(CSLinked_List), _cslinked_list_operations),
+}
+
+
+def peak_memory(build, size):
+    # peak_memory() returns the peak bytes allocated while building
+    # a structure with size elements
+    tracemalloc.start()
+    structure = build(range(size))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del structure
+    return peak
+
+
+def time_operation(operation, structure, arguments, budget):
+    # time_operation() calls operation once per argument, stopping early
+    # when budget seconds are used up
+    # It returns the average seconds per call
+    calls = 0
+    start = time.perf_counter()
+    for argument in arguments:
+        operation(structure, argument)
+        calls += 1
+        if time.perf_counter() - start > budget:
+            break
+    return (time.perf_counter() - start) / calls
+
+
+def run(sizes, names, repeat, budget, seed):
+    # run() measures every structure / operation / size
+    # It returns a JSON-ready dictionary
+    results = {
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "sizes": sizes,
+        "seconds_per_call": {},
+        "peak_memory_bytes": {},
+    }
+    random_numbers = random.Random(seed)
+
+    for name in names:
+        build, make_operations = STRUCTURES[name]
+        operations = make_operations()
+        timings = results["seconds_per_call"].setdefault(name, {})
+        memory = results["peak_memory_bytes"].setdefault(name, {})
+
+        for size in sizes:
+            memory[str(size)] = peak_memory(build, size)
+            structure = build(range(size))
+
+            calls = max(1, min(repeat, size // 10))
+            # At most 10% of the elements are added or removed per operation
+            arguments = [random_numbers.randrange(size) for _ in range(calls)]
+
+            for operation_name in OPERATIONS:
+                operation = operations.get(operation_name)
+                if operation is None:
+                    continue
+                seconds = time_operation(operation, structure, arguments, budget)
+                timings.setdefault(operation_name, {})[str(size)] = seconds
+            del structure
+
+    return results
+
+
+def print_table(results):
+    # print_table() prints microseconds per call and peak memory
+    sizes = [str(size) for size in results["sizes"]]
+    header = f"{'structure':<15}{'operation':<15}" + "".join(f"{size:>13}" for size in sizes)
+    print(header)
+    print("-" * len(header))
+    for name, timings in results["seconds_per_call"].items():
+        for operation_name in OPERATIONS:
+            row = timings.get(operation_name)
+            if row is None:
+                continue
+            cells = "".join(
+                f"{row[size] * 1e6:>11.2f}us" if size in row else f"{'-':>13}"
+                for size in sizes
+            )
+            print(f"{name:<15}{operation_name:<15}{cells}")
+        memory = results["peak_memory_bytes"][name]
+        cells = "".join(f"{memory[size] / 1e6:>11.2f}MB" for size in sizes)
+        print(f"{name:<15}{'peak memory':<15}{cells}")
+        print()
+
+
+def compare(results, old_results, threshold):
+    # compare() prints every timing that changed by more than threshold
+    # ratio > 1 means the new run is slower
+    print(f"changes bigger than {threshold:.0%} against the old run:")
+    found = False
+    for name, timings in results["seconds_per_call"].items():
+        old_timings = old_results.get("seconds_per_call", {}).get(name, {})
+        for operation_name, row in timings.items():
+            old_row = old_timings.get(operation_name, {})
+            for size, seconds in row.items():
+                old_seconds = old_row.get(size)
+                if not old_seconds:
+                    continue
+                ratio = seconds / old_seconds
+                if abs(ratio - 1) > threshold:
+                    found = True
+                    label = "SLOWER" if ratio > 1 else "faster"
+                    print(f"  {name:<15}{operation_name:<15}{size:>10}  x{ratio:.2f} {label}")
+    if not found:
+        print("  none")
+    return found
+
+
+IMPORT_TIME_MODULES = [
+    "link_list",
+    "link_list.singly_llinked_list.sll_nodesnLL",
+    "link_list.singly_llinked_list.insertion_in_ssl",
+    "link_list.singly_llinked_list.circular_singly_ll",
+    "link_list.doubly_linked_list.doubly_ll",
+]
+# Modules a worker process typically imports
+
+
+IMPORT_TIME_BUDGET_MS = 50.0
+# Default budget for --import-time, also enforced by tests/test_import_time.py
+
+
+def measure_import_time(modules=IMPORT_TIME_MODULES, runs=3):
+    # measure_import_time() imports modules in a fresh interpreter with
+    # python -X importtime and returns (milliseconds, text printed to stdout)
+    # The best of `runs` runs is used, the first run may compile .pyc files
+
+    code = "import " + ", ".join(modules)
+    root = Path(__file__).resolve().parent.parent
+    best = None
+    printed = ""
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                capture_output=True, text=True, cwd=root, check=True)
+        printed = result.stdout
+        microseconds = 0
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line.split("|")
+            if name.startswith(" link_list") and cumulative.strip().isdigit():
+                microseconds += int(cumulative)
+                # Only top-level entries (no extra indent), their cumulative
+                # time already includes everything they imported
+        if best is None or microseconds < best:
+            best = microseconds
+    return best / 1000, printed
+
+
+def check_import_time(budget_ms):
+    # check_import_time() prints the result and returns True if it passed
+    milliseconds, printed = measure_import_time()
+    passed = milliseconds <= budget_ms and not printed
+    print(f"import time of {', '.join(IMPORT_TIME_MODULES)}: "
+          f"{milliseconds:.1f} ms (budget {budget_ms:.1f} ms)")
+    if printed:
+        print("importing printed to stdout, imports must have no side effects:")
+        print(printed)
+    print("PASS" if passed else "FAIL")
+    return passed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m link_list.bench", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="list sizes to test (up to 10**7 is practical)")
+    parser.add_argument("--structures", nargs="+", choices=list(STRUCTURES), default=list(STRUCTURES))
+    parser.add_argument("--repeat", type=int, default=1000, help="max calls per operation")
+    parser.add_argument("--budget", type=float, default=0.5, help="max seconds per operation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="older JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative change reported by --compare (default 0.10)")
+    parser.add_argument("--import-time", action="store_true",
+                        help="only check import side effects and import time")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_TIME_BUDGET_MS,
+                        help=f"import time budget in milliseconds (default {IMPORT_TIME_BUDGET_MS:g})")
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        sys.exit(0 if check_import_time(args.import_budget) else 1)
+
+    results = run(args.sizes, args.structures, args.repeat, args.budget, args.seed)
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(results, json.load(file), args.threshold)
+
+
+if __name__ == "__main__":
+    main()
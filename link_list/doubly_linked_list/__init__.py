@@ -0,0 +1 @@
+'''Doubly linked list.'''
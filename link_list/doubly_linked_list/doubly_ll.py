@@ -0,0 +1,285 @@
+'''In a doubly linked list every node stores TWO references:
+
+next → the node after it
+prev → the node before it
+
+Because of prev we can walk the list in both directions.
+
+Remove from the end (pop)
+
+In a singly linked list we must walk from head to find the node before tail.
+
+Here tail.prev already is that node, so pop() does not walk at all.
+
+Remove a node we already hold
+
+node.prev and node.next are both known, so we link them to each other.
+
+Get by index
+
+We can start from head OR from tail, whichever end is closer to the index.
+So we never walk more than half of the list.'''
+
+
+class Node:
+    def __init__(self, value):
+        # Node represents a single element in the doubly linked list
+        # It stores data and references to the next AND previous node
+
+        self.value = value
+        # Store the data inside the node
+        # Time: O(1), Space: O(1)
+
+        self.next = None
+        # Reference to the node after this one
+        # Time: O(1), Space: O(1)
+
+        self.prev = None
+        # Reference to the node before this one
+        # Time: O(1), Space: O(1)
+
+
+class DoublyLinkedlist:
+    # DoublyLinkedlist has the same methods and return values as Linkedlist
+    # so it can be used in its place without changing the caller
+
+    def __init__(self):
+        # Constructor initializes an empty doubly linked list
+        self.head = None      # head points to first node | Time: O(1), Space: O(1)
+        self.tail = None      # tail points to last node  | Time: O(1), Space: O(1)
+        self.length = 0       # stores number of nodes    | Time: O(1), Space: O(1)
+
+    # for printing the linked list
+    def __str__(self):
+        temp_node = self.head
+        result = ""
+        while temp_node is not None:
+            result += str(temp_node.value)
+            if temp_node.next is not None:
+                result += "<->"
+            temp_node = temp_node.next
+        return result
+
+    # for appending to the DLL
+    def append(self, value):
+        # append() adds a new node at the end of the list
+
+        new_node = Node(value)
+        # Time: O(1), Space: O(1)
+
+        if self.head is None:
+            # If list is empty, new node is both head and tail
+            self.head = new_node
+            self.tail = new_node
+        else:
+            self.tail.next = new_node
+            # Old last node points forward to the new node
+            # Time: O(1), Space: O(1)
+
+            new_node.prev = self.tail
+            # New node points back to the old last node
+            # Time: O(1), Space: O(1)
+
+            self.tail = new_node
+
+        self.length += 1
+        # Time: O(1), Space: O(1)
+
+    # for prepending to the DLL
+    def prepend(self, value):
+        # prepend() adds a new node at the beginning of the list
+
+        new_node = Node(value)
+        # Time: O(1), Space: O(1)
+
+        if self.head is None:
+            self.head = new_node
+            self.tail = new_node
+        else:
+            new_node.next = self.head
+            # New node points forward to the old first node
+            # Time: O(1), Space: O(1)
+
+            self.head.prev = new_node
+            # Old first node points back to the new node
+            # Time: O(1), Space: O(1)
+
+            self.head = new_node
+
+        self.length += 1
+        # Time: O(1), Space: O(1)
+
+    def get(self, index):
+        # get() returns the node present at a given index
+        # It returns:
+        #   Node object → if index is valid
+        #   None        → if index is invalid
+
+        if index == -1:
+            # Shortcut for the last node, same as Linkedlist.get(-1)
+            return self.tail
+
+        if index < 0 or index >= self.length:
+            return None
+
+        if index < self.length // 2:
+            # Index is in the first half, walk forward from head
+            temp_node = self.head
+            for _ in range(index):
+                temp_node = temp_node.next
+        else:
+            # Index is in the second half, walk backward from tail
+            temp_node = self.tail
+            for _ in range(self.length - 1 - index):
+                temp_node = temp_node.prev
+
+        return temp_node
+        # At most n/2 steps from the closer end
+        # Time: O(n), Space: O(1)
+
+    def set_value(self, index, value):
+        # set_value() updates the value of the node at a given index
+        # It returns:
+        #   True  → if update is successful
+        #   False → if index is invalid (node not found)
+
+        temp_node = self.get(index)
+        # Time: O(n), Space: O(1)
+
+        if temp_node:
+            temp_node.value = value
+            return True
+        return False
+
+    def insert(self, index, value):
+        # insert() adds a new node at a given index
+        # It returns:
+        #   True  → if insertion is successful
+        #   False → if insertion fails (invalid index)
+
+        if index < 0 or index > self.length:
+            return False
+
+        if index == 0:
+            self.prepend(value)
+            return True
+
+        if index == self.length:
+            self.append(value)
+            return True
+
+        after = self.get(index)
+        # Node that is currently at index, new node goes before it
+        # get() walks from the closer end
+        # Time: O(n), Space: O(1)
+
+        before = after.prev
+        new_node = Node(value)
+
+        new_node.prev = before
+        new_node.next = after
+        before.next = new_node
+        after.prev = new_node
+        # Four links change: two on the new node, one on each neighbour
+        # Time: O(1), Space: O(1)
+
+        self.length += 1
+        return True
+
+    def traversal(self):
+        # traversal() prints all values stored in the list from head to tail
+
+        temp_node = self.head
+        while temp_node is not None:
+            print(temp_node.value)
+            temp_node = temp_node.next
+        # Time: O(n), Space: O(1)
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+
+        current = self.head
+        index = 0
+        while current is not None:
+            if current.value == value:
+                return index
+            current = current.next
+            index += 1
+        return -1
+        # Time: O(n), Space: O(1)
+
+    def remove_node(self, node):
+        # remove_node() unlinks a node that we already hold a reference to
+        # The node must belong to this list
+        # It returns the removed node
+
+        if node.prev is None:
+            # Node is the first node
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            # Node is the last node
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.next = None
+        node.prev = None
+        # Disconnect removed node completely
+        # Time: O(1), Space: O(1)
+
+        self.length -= 1
+        return node
+
+    def pop_first(self):
+        # pop_first() removes and returns the first node
+        # It returns:
+        #   removed node → if deletion is successful
+        #   None         → if the list is empty
+
+        if self.length == 0:
+            return None
+        return self.remove_node(self.head)
+        # Time: O(1), Space: O(1)
+
+    def pop(self):
+        # pop() removes and returns the last node
+        # It returns:
+        #   removed node → if deletion is successful
+        #   None         → if the list is empty
+
+        if self.length == 0:
+            return None
+        return self.remove_node(self.tail)
+        # tail.prev is the second-last node, no walk from head needed
+        # Time: O(1), Space: O(1)
+
+    def remove(self, index):
+        # remove() deletes the node at a given index
+        # It returns:
+        #   removed node → if deletion is successful
+        #   None         → if index is invalid or list is empty
+
+        temp_node = self.get(index)
+        # Time: O(n), Space: O(1)
+
+        if temp_node is None:
+            return None
+        return self.remove_node(temp_node)
+
+
+if __name__ == "__main__":
+    new = DoublyLinkedlist()
+    new.append(103)
+    new.append(20)
+    new.append(134)
+    new.prepend(1)
+    print(new)
+    print(new.pop().value)
+    print(new.get(2).value)
+    print(new)
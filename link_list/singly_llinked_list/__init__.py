@@ -0,0 +1 @@
+'''Singly linked lists (plain, circular, array-backed and unrolled).'''
@@ -0,0 +1,323 @@
+'''Array-backed (struct-of-arrays) singly linked list.
+
+The Node based Linkedlist stores every element as a separate Python object.
+Each Node has its own __dict__, is tracked by the garbage collector and lives
+somewhere random on the heap.
+
+Here the same linked list is stored in columns instead of objects:
+
+values → one column with the data of every slot
+           array('d') / array('q') for numbers, a plain list for any object
+
+next   → array('q') with the INDEX of the next slot (-1 means None)
+
+head / tail are slot indices instead of Node references.
+
+Removed slots are not deleted from the arrays. They are chained into a
+free list (through the same next column) and reused by the next insertion.
+
+So a list with n elements is just two arrays of n items, not n objects.'''
+
+from array import array
+# array stores raw machine numbers (8 bytes each for 'q' and 'd')
+# Time: O(1), Space: O(1)
+
+
+NO_SLOT = -1
+# Marker used instead of None inside the next column
+# array('q') can only hold integers, so -1 means "no next node"
+
+
+class ArrayLinkedlist:
+    # ArrayLinkedlist has the same public API as Linkedlist
+    # append / prepend / insert / get / set_value / search / pop / pop_first
+    # but there are NO Node objects, only slot indices into arrays
+
+    def __init__(self, typecode=None):
+        # typecode → array typecode for the value column ('d', 'q', ...)
+        #            None means values can be any Python object (plain list)
+
+        self.typecode = typecode
+        self.values = array(typecode) if typecode else []
+        # value column, values[slot] is the data stored in that slot
+        # Time: O(1), Space: O(1)
+
+        self.next_slot = array('q')
+        # link column, next_slot[slot] is the index of the next slot
+        # Time: O(1), Space: O(1)
+
+        self.head = NO_SLOT       # slot of first element | Time: O(1), Space: O(1)
+        self.tail = NO_SLOT       # slot of last element  | Time: O(1), Space: O(1)
+        self.length = 0           # number of elements    | Time: O(1), Space: O(1)
+        self.free_slot = NO_SLOT  # first reusable slot   | Time: O(1), Space: O(1)
+
+    # for printing the linked list
+    def __str__(self):
+        parts = []
+        slot = self.head
+        while slot != NO_SLOT:
+            parts.append(str(self.values[slot]))
+            slot = self.next_slot[slot]
+        return "->".join(parts)
+        # join builds the string once instead of result += for every node
+        # Time: O(n), Space: O(n)
+
+    def _new_slot(self, value):
+        # _new_slot() gives back a slot holding value with next = NO_SLOT
+        # It reuses a freed slot if there is one, otherwise grows the arrays
+
+        slot = self.free_slot
+        if slot != NO_SLOT:
+            # Reuse a slot from the free list
+            # Time: O(1), Space: O(1)
+
+            self.free_slot = self.next_slot[slot]
+            self.values[slot] = value
+            self.next_slot[slot] = NO_SLOT
+        else:
+            # No free slot, add one at the end of both columns
+            # Time: O(1) amortized, Space: O(1)
+
+            slot = len(self.next_slot)
+            self.values.append(value)
+            self.next_slot.append(NO_SLOT)
+        return slot
+
+    def _free(self, slot):
+        # _free() puts a removed slot on the free list so it can be reused
+
+        self.next_slot[slot] = self.free_slot
+        self.free_slot = slot
+        if self.typecode is None:
+            self.values[slot] = None
+            # Drop the reference so the object can be garbage collected
+            # (numeric columns hold raw numbers, nothing to release)
+        # Time: O(1), Space: O(1)
+
+    def _slot_at(self, index):
+        # _slot_at() returns the slot number of the element at index
+        # index must already be checked by the caller
+
+        slot = self.head
+        for _ in range(index):
+            slot = self.next_slot[slot]
+        return slot
+        # Time: O(n), Space: O(1)
+
+    # for appending to the LL
+    def append(self, value):
+        # append() adds a new element at the end of the linked list
+
+        slot = self._new_slot(value)
+        # Time: O(1) amortized, Space: O(1)
+
+        if self.head == NO_SLOT:
+            # If list is empty, new slot is both head and tail
+            self.head = slot
+            self.tail = slot
+        else:
+            # Link last slot to the new slot and move tail
+            self.next_slot[self.tail] = slot
+            self.tail = slot
+
+        self.length += 1
+        # Time: O(1), Space: O(1)
+
+    # for prepending to the LL
+    def prepend(self, value):
+        # prepend() adds a new element at the beginning of the linked list
+
+        slot = self._new_slot(value)
+        # Time: O(1) amortized, Space: O(1)
+
+        if self.head == NO_SLOT:
+            self.head = slot
+            self.tail = slot
+        else:
+            self.next_slot[slot] = self.head
+            # New slot points to the old first slot
+            self.head = slot
+
+        self.length += 1
+        # Time: O(1), Space: O(1)
+
+    def insert(self, index, value):
+        # insert() adds a new element at a given index
+        # It returns:
+        #   True  → if insertion is successful
+        #   False → if insertion fails (invalid index)
+
+        if index < 0 or index > self.length:
+            return False
+            # Time: O(1), Space: O(1)
+
+        if index == 0:
+            self.prepend(value)
+            return True
+
+        if index == self.length:
+            self.append(value)
+            return True
+
+        previous = self._slot_at(index - 1)
+        # Slot just BEFORE the insertion position
+        # Time: O(n), Space: O(1)
+
+        slot = self._new_slot(value)
+        self.next_slot[slot] = self.next_slot[previous]
+        self.next_slot[previous] = slot
+        # Same pointer update as the Node version, only with integers
+        # Time: O(1), Space: O(1)
+
+        self.length += 1
+        return True
+
+    def get(self, index):
+        # get() returns the VALUE stored at a given index
+        # (there is no Node object to return in this layout)
+        # It returns:
+        #   value → if index is valid
+        #   None  → if index is invalid
+
+        if index == -1:
+            # Shortcut for the last element, same as Linkedlist.get(-1)
+            return self.values[self.tail] if self.length else None
+
+        if index < 0 or index >= self.length:
+            return None
+
+        return self.values[self._slot_at(index)]
+        # Time: O(n), Space: O(1)
+
+    def set_value(self, index, value):
+        # set_value() updates the value at a given index
+        # It returns:
+        #   True  → if update is successful
+        #   False → if index is invalid
+
+        if index == -1 and self.length:
+            index = self.length - 1
+
+        if index < 0 or index >= self.length:
+            return False
+
+        self.values[self._slot_at(index)] = value
+        # Only the value column changes, links stay the same
+        # Time: O(n), Space: O(1)
+        return True
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+
+        values = self.values
+        next_slot = self.next_slot
+        # Local names avoid an attribute lookup on every step
+        # Time: O(1), Space: O(1)
+
+        slot = self.head
+        index = 0
+        while slot != NO_SLOT:
+            if values[slot] == value:
+                return index
+            slot = next_slot[slot]
+            index += 1
+        return -1
+        # Time: O(n), Space: O(1)
+
+    def pop_first(self):
+        # pop_first() removes the first element and returns its value
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if the list is empty
+
+        if self.length == 0:
+            return None
+
+        slot = self.head
+        value = self.values[slot]
+
+        if self.length == 1:
+            self.head = NO_SLOT
+            self.tail = NO_SLOT
+        else:
+            self.head = self.next_slot[slot]
+            # Move head to the second slot
+            # Time: O(1), Space: O(1)
+
+        self._free(slot)
+        self.length -= 1
+        return value
+
+    def pop(self):
+        # pop() removes the last element and returns its value
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if the list is empty
+
+        if self.length == 0:
+            return None
+
+        slot = self.tail
+        value = self.values[slot]
+
+        if self.length == 1:
+            self.head = NO_SLOT
+            self.tail = NO_SLOT
+        else:
+            previous = self._slot_at(self.length - 2)
+            # Like the Node version we must walk to the second-last slot
+            # Time: O(n), Space: O(1)
+
+            self.next_slot[previous] = NO_SLOT
+            self.tail = previous
+
+        self._free(slot)
+        self.length -= 1
+        return value
+
+
+def compare(size=200_000):
+    # compare() builds the same list with Node objects and with arrays
+    # and prints memory used and time taken for a few operations
+
+    import time
+    import tracemalloc
+    from .insertion_in_ssl import Linkedlist
+
+    def measure(make):
+        # Build one list and return (list, peak bytes, build seconds)
+        tracemalloc.start()
+        start = time.perf_counter()
+        linked_list = make()
+        for i in range(size):
+            linked_list.append(float(i))
+        build_time = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return linked_list, peak, build_time
+
+    candidates = [
+        ("Node Linkedlist", Linkedlist),
+        ("ArrayLinkedlist('d')", lambda: ArrayLinkedlist('d')),
+        ("ArrayLinkedlist()", ArrayLinkedlist),
+    ]
+
+    print(f"{size} float elements")
+    print(f"{'backend':<22}{'memory MB':>12}{'append s':>12}{'search s':>12}")
+    for name, make in candidates:
+        linked_list, peak, build_time = measure(make)
+
+        start = time.perf_counter()
+        linked_list.search(-1.0)
+        # Value is missing, so search walks the whole list
+        search_time = time.perf_counter() - start
+
+        print(f"{name:<22}{peak / 1e6:>12.1f}{build_time:>12.3f}{search_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    import sys
+    compare(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
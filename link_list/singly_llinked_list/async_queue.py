@@ -0,0 +1,199 @@
+'''asyncio FIFO queue built on Linkedlist.
+
+Linkedlist already has the two O(1) operations a FIFO queue needs:
+
+append(value) → put at the tail
+pop_first()   → take from the head
+
+AsyncLinkedQueue adds waiting on top of them:
+
+await put(item)    waits while the queue is full (backpressure: a fast
+                   producer is slowed down to the speed of the consumer)
+await get()        waits while the queue is empty, no polling
+await get_many(n)  waits for at least one item, then takes up to n items
+                   in one wakeup (less task switching under fan-in)
+async for item in queue   gets items until close() was called and the
+                          queue is empty
+
+Waiting coroutines sleep on asyncio futures and are woken one at a time,
+the same way asyncio.Queue does it.'''
+
+import asyncio
+from collections import deque
+
+from .insertion_in_ssl import Linkedlist
+
+
+class QueueClosed(Exception):
+    # Raised by put() after close(), and by get() when closed and empty
+    pass
+
+
+class AsyncLinkedQueue:
+    # AsyncLinkedQueue is used from ONE event loop (not thread-safe)
+
+    def __init__(self, maxsize=0):
+        self.items = Linkedlist()   # queued values, head = oldest     | Time: O(1), Space: O(1)
+        self.maxsize = maxsize      # 0 → no limit                     | Time: O(1), Space: O(1)
+        self.getters = deque()      # futures of coroutines waiting in get()
+        self.putters = deque()      # futures of coroutines waiting in put()
+        self.closed = False
+
+    def __len__(self):
+        return self.items.length
+
+    def qsize(self):
+        return self.items.length
+
+    def empty(self):
+        return self.items.length == 0
+
+    def full(self):
+        return 0 < self.maxsize <= self.items.length
+
+    @staticmethod
+    def _wake_next(waiters):
+        # _wake_next() wakes the first waiter that is still waiting
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    @staticmethod
+    async def _wait(waiters):
+        # _wait() sleeps until a _wake_next() call wakes this coroutine
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            raise
+
+    def put_nowait(self, item):
+        # put_nowait() adds item at the tail or raises asyncio.QueueFull
+        if self.closed:
+            raise QueueClosed("put() on a closed queue")
+        if self.full():
+            raise asyncio.QueueFull
+        self.items.append(item)
+        # Time: O(1), Space: O(1)
+        self._wake_next(self.getters)
+
+    async def put(self, item):
+        # put() adds item at the tail, waiting while the queue is full
+        while self.full() and not self.closed:
+            try:
+                await self._wait(self.putters)
+            except BaseException:
+                if not self.full():
+                    self._wake_next(self.putters)
+                    # We were woken but cancelled, pass the free slot on
+                raise
+        self.put_nowait(item)
+
+    def get_nowait(self):
+        # get_nowait() takes the oldest item or raises asyncio.QueueEmpty
+        # (QueueClosed if the queue is closed and empty)
+        if self.items.length == 0:
+            if self.closed:
+                raise QueueClosed("get() on a closed, empty queue")
+            raise asyncio.QueueEmpty
+        item = self.items.pop_first().value
+        # Time: O(1), Space: O(1)
+        self._wake_next(self.putters)
+        return item
+
+    async def get(self):
+        # get() takes the oldest item, waiting while the queue is empty
+        while self.items.length == 0 and not self.closed:
+            try:
+                await self._wait(self.getters)
+            except BaseException:
+                if self.items.length:
+                    self._wake_next(self.getters)
+                raise
+        return self.get_nowait()
+
+    async def get_many(self, n):
+        # get_many() waits for at least one item, then takes up to n items
+        # It returns a Python list with 1..n items, oldest first
+        # Time: O(k) for k items, Space: O(k)
+
+        first = await self.get()
+        items = [first]
+        pop_first = self.items.pop_first
+        while len(items) < n and self.items.length:
+            items.append(pop_first().value)
+        for _ in range(len(items) - 1):
+            self._wake_next(self.putters)
+            # Every freed slot may let one waiting producer continue
+        return items
+
+    def close(self):
+        # close() stops new puts; waiting getters finish once it is empty
+        self.closed = True
+        while self.getters:
+            self._wake_next(self.getters)
+        while self.putters:
+            self._wake_next(self.putters)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        # async for item in queue → ends after close() once the queue is empty
+        try:
+            return await self.get()
+        except QueueClosed:
+            raise StopAsyncIteration from None
+
+
+async def _fan_in(make_queue, producers, items, batch):
+    # _fan_in() runs `producers` producer tasks that put `items` items each
+    # into one queue read by a single consumer; returns seconds taken
+
+    queue = make_queue()
+    total = producers * items
+
+    async def produce():
+        for i in range(items):
+            await queue.put(i)
+
+    async def consume():
+        received = 0
+        while received < total:
+            if batch > 1:
+                received += len(await queue.get_many(batch))
+            else:
+                await queue.get()
+                received += 1
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(consume(), *(produce() for _ in range(producers)))
+    return loop.time() - start
+
+
+def benchmark(producers=(1, 10, 100), items=2_000, maxsize=256):
+    # benchmark() compares AsyncLinkedQueue with asyncio.Queue under fan-in
+    print(f"{items} items per producer, maxsize {maxsize}, items per second")
+    print(f"{'producers':>10}{'asyncio.Queue':>16}{'linked get':>14}{'linked get_many(64)':>22}")
+    for count in producers:
+        rows = [
+            asyncio.run(_fan_in(lambda: asyncio.Queue(maxsize), count, items, 1)),
+            asyncio.run(_fan_in(lambda: AsyncLinkedQueue(maxsize), count, items, 1)),
+            asyncio.run(_fan_in(lambda: AsyncLinkedQueue(maxsize), count, items, 64)),
+        ]
+        total = count * items
+        print(f"{count:>10}" + "".join(f"{total / seconds:>{width}.0f}"
+                                       for seconds, width in zip(rows, (16, 14, 22))))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -13,10 +13,71 @@ class Node:
         # Time: O(1), Space: O(1)
 
 
+REPR_LIMIT = 10
+# repr() shows at most this many values, so repr of a huge list stays short
+
+
+class _OrderStatistics:
+    # _OrderStatistics keeps track of which positions 0..n-1 are still "alive"
+    # and finds the k-th alive position quickly
+    #
+    # It is a Fenwick (binary indexed) tree over 0/1 flags:
+    #   tree[i] holds the number of alive positions in a block ending at i
+    # Removing a position and finding the k-th alive one both touch
+    # only O(log n) blocks instead of walking the whole ring
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        for i in range(1, size + 1):
+            self.tree[i] += 1
+            parent = i + (i & -i)
+            if parent <= size:
+                self.tree[parent] += self.tree[i]
+        # Build with every position alive in one pass
+        # Time: O(n), Space: O(n)
+
+        self.top = 1
+        while self.top * 2 <= size:
+            self.top *= 2
+        # Largest power of two <= size, where the search starts
+
+    def remove(self, position):
+        # remove() marks position (0-based) as no longer alive
+        i = position + 1
+        while i <= self.size:
+            self.tree[i] -= 1
+            i += i & -i
+        # Time: O(log n), Space: O(1)
+
+    def kth(self, k):
+        # kth() returns the position of the k-th alive element (0-based k)
+        position = 0
+        step = self.top
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.tree[nxt] <= k:
+                position = nxt
+                k -= self.tree[nxt]
+            step //= 2
+        return position
+        # Walk down the tree, skipping whole blocks that are too small
+        # Time: O(log n), Space: O(1)
+
+
 class CSLinked_List:
-    def __init__(self):
+    _node_class = Node
+    # Class used for new nodes; instrumentation sets it on ONE list
+    # (see instrumentation.py), every other list keeps using Node
+
+    def __init__(self, capacity=None):
         # CSLinked_List represents a Circular Singly Linked List
         # In a circular list, the last node points back to the first node
+        #
+        # capacity=None → normal list, grows with every append
+        # capacity=k    → RING BUFFER mode: k nodes are created once, and
+        #                 when all k are used append overwrites the oldest
+        #                 value (see _make_ring)
 
         # new_node = Node(value)  
         # Create a new node in heap memory
@@ -41,6 +102,220 @@ class CSLinked_List:
         # Initialize list length as 1 (one node exists)
         # Time: O(1), Space: O(1)
 
+        self.capacity = capacity
+        # None in normal mode, number of preallocated nodes in ring mode
+        # Time: O(1), Space: O(1)
+
+        if capacity is not None:
+            self._make_ring(capacity)
+            # Time: O(k), Space: O(k)
+
+    def _make_ring(self, capacity):
+        # _make_ring() creates all nodes of a ring buffer ONCE
+        #
+        # The ring always looks like this (k = capacity):
+        #
+        #   head → used → used → tail → free → free → back to head
+        #
+        # used nodes: head ... tail, `length` of them, oldest at head
+        # free nodes: tail.next ... the node before head
+        # When empty, tail is the node just before head (tail.next == head)
+        # When full, there are no free nodes and again tail.next == head
+
+        if capacity < 1:
+            raise ValueError("ring buffer capacity must be at least 1")
+
+        first = self._node_class(None)
+        last = first
+        for _ in range(capacity - 1):
+            last.next = self._node_class(None)
+            last = last.next
+        last.next = first
+        # Close the circle
+        # Time: O(k), Space: O(k)
+
+        self.head = first
+        self.tail = last
+        # Empty ring: the first append moves tail to head
+        # Time: O(1), Space: O(1)
+
+    def _ring_append(self, value):
+        # _ring_append() writes value into the next slot of the ring
+        # No node is created and no link is changed, only head / tail move
+
+        if self.length < self.capacity:
+            self.tail = self.tail.next
+            # Use the first free node
+            # Time: O(1), Space: O(1)
+
+            self.length += 1
+        else:
+            self.head = self.head.next
+            self.tail = self.tail.next
+            # Ring is full: the oldest node (old head) becomes the newest
+            # Time: O(1), Space: O(1)
+
+        self.tail.value = value
+        # Time: O(1), Space: O(1)
+
+    def extend(self, values):
+        # extend() appends every value of an iterable
+        # In ring mode only the last `capacity` values stay
+
+        if self.capacity is None:
+            for value in values:
+                self.append(value)
+            return
+            # Time: O(k), Space: O(k)
+
+        head = self.head
+        tail = self.tail
+        length = self.length
+        capacity = self.capacity
+        for value in values:
+            tail = tail.next
+            if length < capacity:
+                length += 1
+            else:
+                head = head.next
+            tail.value = value
+        # Same steps as _ring_append, but with local variables
+        # (no attribute writes on self inside the loop)
+        # Time: O(k), Space: O(1)
+
+        self.head = head
+        self.tail = tail
+        self.length = length
+
+    def pop_first(self):
+        # pop_first() removes the first (oldest) element
+        # It returns:
+        #   removed node  → normal mode, like Linkedlist.pop_first
+        #   removed value → ring mode (the node stays in the ring
+        #                   and will be reused, so it is not handed out)
+        #   None          → if the list is empty
+
+        if self.length == 0:
+            return None
+
+        temp_node = self.head
+
+        if self.capacity is not None:
+            value = temp_node.value
+            temp_node.value = None
+            # Drop the reference so the value can be garbage collected
+            self.head = temp_node.next
+            # Node becomes the last free node, right before the new head
+            self.length -= 1
+            return value
+            # Time: O(1), Space: O(1)
+
+        if self.length == 1:
+            self.head = None
+            self.tail = None
+        else:
+            self.head = temp_node.next
+            self.tail.next = self.head
+            # Close the circle again without the removed node
+        temp_node.next = None
+        self.length -= 1
+        return temp_node
+        # Time: O(1), Space: O(1)
+
+    def rotate(self, k=1):
+        # rotate() moves head (and tail) k steps forward around the circle
+        # After rotate(k) the element that was at index k is the new head
+        # Negative k moves backwards, k is reduced modulo length first
+        # Example: 1->2->3->4, rotate(1) → 2->3->4->1
+
+        if self.length < 2:
+            return
+            # Nothing to rotate
+            # Time: O(1), Space: O(1)
+
+        steps = k % self.length
+        if steps == 0:
+            return
+
+        if self.capacity is not None and self.length < self.capacity:
+            for _ in range(steps):
+                self._ring_append(self.pop_first())
+            return
+            # Ring with free nodes: head..tail is only part of the circle,
+            # so values are moved instead of pointers (no allocation)
+            # Time: O(k), Space: O(1)
+
+        tail = self.tail
+        for _ in range(steps):
+            tail = tail.next
+        self.tail = tail
+        self.head = tail.next
+        # The list is the whole circle, so only head / tail move
+        # No link changes and no new nodes
+        # Time: O(k mod n), Space: O(1)
+
+    def eliminate_every(self, k):
+        # eliminate_every() yields the values in Josephus order:
+        # count k elements around the circle starting at head,
+        # take out the k-th, continue counting from the next one
+        # Example: 1->2->3->4->5, k=2 → 2, 4, 1, 5, 3
+        #
+        # The list itself is not changed
+        # Walking k nodes for every removal would be O(n * k),
+        # _OrderStatistics finds the next position in O(log n) instead
+
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        values = list(self)
+        alive = _OrderStatistics(len(values))
+        # Time: O(n), Space: O(n)
+
+        position = 0
+        for remaining in range(len(values), 0, -1):
+            position = (position + k - 1) % remaining
+            # Index of the next victim among the elements still alive
+            index = alive.kth(position)
+            alive.remove(index)
+            yield values[index]
+            # The next count starts at the element after the victim,
+            # which now has the same index among the alive elements
+        # Time: O(n log n), Space: O(n)
+
+    def middle(self):
+        # middle() returns the middle node with two pointers, stopping
+        # when the walk comes back around (see ll_algorithms.py)
+        from .ll_algorithms import middle
+        return middle(self)
+        # Time: O(n), Space: O(1)
+
+    def nth_from_end(self, k):
+        # nth_from_end() returns the k-th node from the end (1 → tail)
+        # or None if k is out of range
+        from .ll_algorithms import nth_from_end
+        return nth_from_end(self, k)
+        # Time: O(n), Space: O(1)
+
+    def has_cycle(self):
+        # has_cycle() runs Floyd's algorithm on the chain
+        # True for every non-empty circular list; False means the circle
+        # is broken somewhere (a next link is None)
+        from .ll_algorithms import has_cycle
+        return has_cycle(self)
+        # Time: O(n), Space: O(1)
+
+    def cycle_start(self):
+        # cycle_start() returns the first node of the loop found from
+        # head (head itself when the circle is intact), or None
+        from .ll_algorithms import cycle_start
+        return cycle_start(self)
+        # Time: O(n), Space: O(1)
+
+    def snapshot(self):
+        # snapshot() returns all values as a Python list, oldest first
+        return list(self)
+        # Time: O(n), Space: O(n)
+
 
 
     def append(self, value):
@@ -49,7 +324,12 @@ class CSLinked_List:
         #   - tail.next must always point to head
         # This function maintains that rule
 
-        new_node = Node(value)  
+        if self.capacity is not None:
+            self._ring_append(value)
+            return
+            # Ring mode: reuse a preallocated node, never allocate
+
+        new_node = self._node_class(value)
         # Create a new node in heap memory
         # This node will be added to the list
         # Time: O(1), Space: O(1)
@@ -98,45 +378,108 @@ class CSLinked_List:
     # This allows us to do: print(linked_list)
     # Example output: 10->20->30
 
-        result = ""  
-        # This string will store all node values in order
+        return "->".join(map(str, self))
+        # __iter__ already stops after one full circle
+        # join() copies every piece once (result += copied the whole string
+        # again for every node)
+        # Time: O(n), Space: O(n)
+
+    def __repr__(self):
+        # __repr__() shows at most REPR_LIMIT values
+        # Example: CSLinked_List([0, 1, 2, ...], length=1000000)
+
+        shown = []
+        for value in self:
+            if len(shown) == REPR_LIMIT:
+                break
+            shown.append(repr(value))
+        # Stop after REPR_LIMIT values, the circle is not walked completely
         # Time: O(1), Space: O(1)
 
-        temp_node = self.head  
-        # Start traversal from the first node (head)
-        # temp_node holds reference to the current node
+        if self.length > REPR_LIMIT:
+            shown.append("...")
+            return f"CSLinked_List([{', '.join(shown)}], length={self.length})"
+        return f"CSLinked_List([{', '.join(shown)}])"
+
+    def __len__(self):
+        # __len__() allows us to write: len(linked_list)
+        return self.length
         # Time: O(1), Space: O(1)
 
-        while temp_node is not None:
-            # Loop to traverse the circular linked list
-            # We CANNOT rely on temp_node becoming None
-            # because in a circular list there is NO None at the end
-            # Time: O(n), Space: O(1)
+    def __iter__(self):
+        # __iter__() allows us to write: for value in linked_list
+        # It yields every value ONCE, starting from head
 
-            result += str(temp_node.value)  
-            # Add current node's value to result string
-            # Time: O(1) per node (amortized), Space: O(1)
+        temp_node = self.head
+        # Start from the first node
+        # Time: O(1), Space: O(1)
 
-            temp_node = temp_node.next  
-            # Move to the next node using next reference
-            # Time: O(1), Space: O(1)
+        if self.capacity is not None:
+            for _ in range(self.length):
+                yield temp_node.value
+                temp_node = temp_node.next
+            return
+            # Ring mode: the circle also contains free nodes,
+            # so stop after `length` values instead of at head
 
-            if temp_node == self.head:
-                # If we have come back to the head again
-                # This means we have completed one full circle
-                # So we must STOP to avoid infinite loop
-                # Time: O(1), Space: O(1)
+        while temp_node is not None:
+            yield temp_node.value
 
+            temp_node = temp_node.next
+            if temp_node is self.head:
+                # Back at head → one full circle is done, stop
+                # (there is no None at the end of a circular list)
                 break
+        # Time: O(n), Space: O(1)
+
+    def __reversed__(self):
+        # __reversed__() allows us to write: reversed(linked_list)
+        # Nodes only know their next node, so values are collected first
+        values = list(self)
+        return reversed(values)
+        # Time: O(n), Space: O(n)
+
+    def __getitem__(self, index):
+        # __getitem__() allows linked_list[i] and linked_list[start:stop:step]
+        # It returns:
+        #   value             → for an integer index (negative counts from the end)
+        #   new CSLinked_List → for a slice, built in one walk
+
+        if isinstance(index, slice):
+            positions = range(self.length)[index]
+            # range does the slice arithmetic (negative, step, bounds) for us
+
+            result = CSLinked_List()
+            if not positions:
+                return result
+
+            low = min(positions[0], positions[-1])
+            high = max(positions[0], positions[-1])
+            step = abs(positions.step)
+
+            picked = []
+            temp_node = self.head
+            for position in range(high + 1):
+                if position >= low and (position - low) % step == 0:
+                    picked.append(temp_node.value)
+                temp_node = temp_node.next
+            # One walk from head to the last wanted position
+            # Time: O(n), Space: O(k)
 
-            result += "->"  
-            # Add arrow separator between node values
-            # This makes output readable: 10->20->30
-            # Time: O(1), Space: O(1)
+            if positions.step < 0:
+                picked.reverse()
+            for value in picked:
+                result.append(value)
+            return result
 
-        return result  
-        # Return the final string representation of the list
-        # Time: O(1), Space: O(1)
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("CSLinked_List index out of range")
+            # Same error as a Python list
+
+        return self._node_at(index).value
+        # Time: O(n), O(1) for the last node, Space: O(1)
 
 
     def prepend(self, value):
@@ -145,7 +488,11 @@ class CSLinked_List:
         #   - tail.next must always point to head
         # This function maintains that rule while inserting at front
 
-        new_node = Node(value)  
+        if self.capacity is not None:
+            raise ValueError("prepend() is not supported in ring buffer mode")
+            # A ring buffer only adds at the newest end
+
+        new_node = self._node_class(value)
         # Create a new node in heap memory
         # This node will become the new head
         # Time: O(1), Space: O(1)
@@ -190,26 +537,191 @@ class CSLinked_List:
         # Increase size of linked list because one node is added
         # Time: O(1), Space: O(1)
 
-    def insert(self,index,value):
-        new_node = Node(value)
+    def insert(self, index, value):
+        # insert() adds a new node so that it ends up at position index
+        # index == length appends, other indices are reduced modulo length
+        # (so -1 inserts before the last node, like a Python list)
+        # It returns:
+        #   True → insertion is always possible in a circle
+
+        if self.capacity is not None:
+            raise ValueError("insert() is not supported in ring buffer mode")
+            # A ring buffer only adds at the newest end
+
+        if index == self.length or self.length == 0:
+            self.append(value)
+            return True
+            # append() already counts the new node
+            # Time: O(1), Space: O(1)
+
+        index %= self.length
+
+        if index == 0:
+            self.prepend(value)
+            return True
+            # Time: O(1), Space: O(1)
+
+        previous_node = self._node_at(index - 1)
+        # Node just BEFORE the insertion position
+        # Time: O(n), Space: O(1)
+
+        new_node = self._node_class(value)
+        new_node.next = previous_node.next
+        previous_node.next = new_node
+        # Link the new node in, head and tail stay the same
+        # Time: O(1), Space: O(1)
+
+        self.length += 1
+        return True
+
+    def _node_at(self, index):
+        # _node_at() returns the node at index (0 <= index < length)
+        # index must already be reduced by the caller
+
+        if index == self.length - 1:
+            return self.tail
+            # Last node is known, no walk needed
+            # Time: O(1), Space: O(1)
+
         temp_node = self.head
+        for _ in range(index):
+            temp_node = temp_node.next
+        return temp_node
+        # Never more than one pass around the circle
+        # Time: O(n), Space: O(1)
+
+    def get(self, index):
+        # get() returns the node at a given index
+        # index is reduced modulo length, so -1 is the last node and
+        # length + 2 is the same node as 2
+        # It returns:
+        #   Node object → if the list is not empty
+        #   None        → if the list is empty
+
+        if self.length == 0:
+            return None
+
+        return self._node_at(index % self.length)
+        # Time: O(n), O(1) for the last node, Space: O(1)
+
+    def set_value(self, index, value):
+        # set_value() updates the value of the node at a given index
+        # It returns:
+        #   True  → if update is successful
+        #   False → if the list is empty
+
+        temp_node = self.get(index)
+        if temp_node is None:
+            return False
+
+        temp_node.value = value
+        return True
+        # Time: O(n), O(1) for the last node, Space: O(1)
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1              → if value is not present in the list
+
+        for index, node_value in enumerate(self):
+            if node_value == value:
+                return index
+        return -1
+        # __iter__ stops after one circle, so a missing value is not
+        # searched for forever
+        # Time: O(n), Space: O(1)
+
+    def pop(self):
+        # pop() removes the last node
+        # It returns:
+        #   removed node  → normal mode
+        #   removed value → ring mode (the node stays in the ring)
+        #   None          → if the list is empty
+
         if self.length == 0:
-            self.head = temp_node
-            self.tail = temp_node
-            new_node.next = new_node
+            return None
+
+        temp_node = self.tail
+
+        if self.capacity is not None:
+            value = temp_node.value
+            temp_node.value = None
+            if self.length == 1:
+                self.head = temp_node.next
+                # Empty ring: tail stays, head is the slot after it
+            else:
+                self.tail = self._node_at(self.length - 2)
+                # Old tail becomes the first free node
+            self.length -= 1
+            return value
+            # Time: O(n), Space: O(1)
+
+        if self.length == 1:
+            self.head = None
+            self.tail = None
+        else:
+            previous_node = self._node_at(self.length - 2)
+            # A singly linked circle can only reach the second-last
+            # node by walking from head
+            # Time: O(n), Space: O(1)
+
+            previous_node.next = self.head
+            self.tail = previous_node
+            # Close the circle again without the removed node
+
+        temp_node.next = None
+        self.length -= 1
+        return temp_node
+        # Time: O(n), Space: O(1)
+
+    def remove(self, index):
+        # remove() deletes the node at a given index
+        # index is reduced modulo length, like get()
+        # It returns:
+        #   removed node  → normal mode
+        #   removed value → ring mode
+        #   None          → if the list is empty
+
+        if self.length == 0:
+            return None
+
+        index %= self.length
+
         if index == 0:
-            self.prepend(value)
-        elif index == self.length:
-            self.append(value)
-        else:   
-            for _ in range(index-1):
-                temp_node = temp_node.next
-            new_node.next = temp_node.next
-            temp_node.next = new_node
-        self.length += 1 
-
-new = CSLinked_List()
-new.insert(0,78)
-# new.append(89)
-# new.prepend(6777)
-print(new)
\ No newline at end of file
+            return self.pop_first()
+            # Time: O(1), Space: O(1)
+
+        if index == self.length - 1:
+            return self.pop()
+            # Time: O(n), Space: O(1)
+
+        previous_node = self._node_at(index - 1)
+        temp_node = previous_node.next
+        previous_node.next = temp_node.next
+        # Bypass the removed node
+        # Time: O(n), Space: O(1)
+
+        self.length -= 1
+
+        if self.capacity is not None:
+            value = temp_node.value
+            temp_node.value = None
+            temp_node.next = self.tail.next
+            self.tail.next = temp_node
+            # Ring mode: put the node back as a free node right after
+            # tail, so the ring keeps all `capacity` nodes
+            # Time: O(1), Space: O(1)
+            return value
+
+        temp_node.next = None
+        return temp_node
+
+
+if __name__ == "__main__":
+    # Demo only runs with: python -m link_list.singly_llinked_list.circular_singly_ll
+    new = CSLinked_List()
+    new.insert(0,78)
+    # new.append(89)
+    # new.prepend(6777)
+    print(new)
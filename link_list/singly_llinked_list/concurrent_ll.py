@@ -0,0 +1,371 @@
+'''Thread-safe singly linked list with hand-over-hand locking.
+
+One big lock around Linkedlist would let only one thread use the list
+at a time. Here every node has its OWN lock:
+
+sentinel → [A] → [B] → [C] → None
+             ^tail is C
+
+Hand-over-hand (lock coupling) walk:
+    lock sentinel, lock A, unlock sentinel, lock B, unlock A, ...
+A thread always holds the lock of the node it stands on, so nobody can
+unlink that node or change its next link under it. Two threads walking
+the same list only wait for each other when they touch the same node.
+
+The list always starts with a sentinel (dummy) node, so the first node
+has a predecessor like every other node. The sentinel lock works as the
+HEAD lock: pop_first() needs only the sentinel and the first node.
+
+append() works at the other end under a separate TAIL lock plus the
+lock of the last node. So producers (append) and consumers (pop_first)
+only meet when the list has a single node.
+
+Deadlock rule: locks are taken in list order (sentinel → ... → tail).
+The tail lock is taken FIRST by append, but LAST by operations that
+walk to the end; those only try it without waiting and, if it is busy,
+release everything and start again.
+
+get / pop / pop_first / remove return VALUES, not nodes: a node handed
+out to the caller could be changed by another thread at any moment.'''
+
+import threading
+
+
+RETRY = object()
+# Returned by an attempt that had to give up its locks and must start again
+
+
+class Node:
+    # Node of the concurrent list: value, next and its own lock
+    __slots__ = ("value", "next", "lock")
+
+    def __init__(self, value):
+        self.value = value                # Time: O(1), Space: O(1)
+        self.next = None                  # Time: O(1), Space: O(1)
+        self.lock = threading.Lock()      # Time: O(1), Space: O(1)
+
+
+class ConcurrentLinkedlist:
+    # ConcurrentLinkedlist can be shared by many threads without extra locking
+
+    def __init__(self):
+        self.sentinel = Node(None)        # dummy first node, its lock is the head lock
+        self.tail = self.sentinel         # last node (sentinel when empty)
+        self.tail_lock = threading.Lock() # protects self.tail
+        self.length = 0
+        self.length_lock = threading.Lock()
+        # length is changed by threads holding different node locks,
+        # so it gets its own small lock
+
+    def _add_length(self, step):
+        with self.length_lock:
+            self.length += step
+
+    def __len__(self):
+        return self.length
+        # Reading an int is atomic, but the value may already be outdated
+
+    def _lock_until(self, index):
+        # _lock_until() walks hand-over-hand and returns (previous, current)
+        # both LOCKED, where current is the node at index (None past the end)
+        # and previous is the node before it (the sentinel for index 0)
+        # It returns None (and holds no lock) if index is past the end
+        # Time: O(index), Space: O(1)
+
+        previous = self.sentinel
+        previous.lock.acquire()
+        for _ in range(index):
+            current = previous.next
+            if current is None:
+                previous.lock.release()
+                return None
+            current.lock.acquire()
+            previous.lock.release()
+            # Lock the next node BEFORE letting go of the current one
+            previous = current
+
+        current = previous.next
+        if current is not None:
+            current.lock.acquire()
+        return previous, current
+
+    @staticmethod
+    def _release(previous, current):
+        if current is not None:
+            current.lock.release()
+        previous.lock.release()
+
+    def append(self, value):
+        # append() adds a value at the end
+        # Only the tail lock and the last node are locked
+        # Time: O(1), Space: O(1)
+
+        new_node = Node(value)
+        with self.tail_lock:
+            last = self.tail
+            with last.lock:
+                last.next = new_node
+                self.tail = new_node
+        self._add_length(1)
+
+    def prepend(self, value):
+        # prepend() adds a value at the beginning
+        self.insert(0, value)
+        # Time: O(1), Space: O(1)
+
+    def _try_insert(self, index, value):
+        locked = self._lock_until(index)
+        if locked is None:
+            return False
+        previous, current = locked
+        try:
+            if current is None and not self.tail_lock.acquire(blocking=False):
+                return RETRY
+                # New node would become the tail, but an append holds the
+                # tail lock → give everything back and try again
+
+            new_node = Node(value)
+            new_node.next = current
+            previous.next = new_node
+            if current is None:
+                self.tail = new_node
+                self.tail_lock.release()
+            self._add_length(1)
+            return True
+        finally:
+            self._release(previous, current)
+
+    def insert(self, index, value):
+        # insert() adds a value at a given index
+        # It returns:
+        #   True  → if insertion is successful
+        #   False → if insertion fails (invalid index)
+        # Time: O(n), Space: O(1)
+
+        if index < 0:
+            return False
+        while True:
+            result = self._try_insert(index, value)
+            if result is not RETRY:
+                return result
+
+    def get(self, index):
+        # get() returns the VALUE at a given index
+        # It returns:
+        #   value → if index is valid
+        #   None  → if index is invalid
+        # Time: O(n), Space: O(1)
+
+        if index < 0:
+            return None
+        locked = self._lock_until(index)
+        if locked is None:
+            return None
+        previous, current = locked
+        try:
+            return None if current is None else current.value
+        finally:
+            self._release(previous, current)
+
+    def set_value(self, index, value):
+        # set_value() updates the value at a given index
+        # It returns:
+        #   True  → if update is successful
+        #   False → if index is invalid
+        # Time: O(n), Space: O(1)
+
+        if index < 0:
+            return False
+        locked = self._lock_until(index)
+        if locked is None:
+            return False
+        previous, current = locked
+        try:
+            if current is None:
+                return False
+            current.value = value
+            return True
+        finally:
+            self._release(previous, current)
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+        # Time: O(n), Space: O(1)
+
+        previous = self.sentinel
+        previous.lock.acquire()
+        index = 0
+        while True:
+            current = previous.next
+            if current is None:
+                previous.lock.release()
+                return -1
+            current.lock.acquire()
+            previous.lock.release()
+            if current.value == value:
+                current.lock.release()
+                return index
+            previous = current
+            index += 1
+
+    def _try_remove(self, previous, current):
+        # _try_remove() unlinks current (previous and current are locked)
+        # It returns the removed value, or RETRY if the tail lock is busy
+        if current.next is None:
+            if not self.tail_lock.acquire(blocking=False):
+                return RETRY
+            previous.next = None
+            self.tail = previous
+            self.tail_lock.release()
+        else:
+            previous.next = current.next
+        current.next = None
+        self._add_length(-1)
+        return current.value
+
+    def remove(self, index):
+        # remove() deletes the value at a given index
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if index is invalid or list is empty
+        # Time: O(n), Space: O(1)
+
+        if index < 0:
+            return None
+        while True:
+            locked = self._lock_until(index)
+            if locked is None:
+                return None
+            previous, current = locked
+            try:
+                if current is None:
+                    return None
+                result = self._try_remove(previous, current)
+            finally:
+                self._release(previous, current)
+            if result is not RETRY:
+                return result
+
+    def pop_first(self):
+        # pop_first() removes the first value and returns it (None if empty)
+        # Needs only the head (sentinel) lock and the first node
+        # Time: O(1), Space: O(1)
+        return self.remove(0)
+
+    def pop(self):
+        # pop() removes the last value and returns it (None if empty)
+        # A singly linked list must walk to the node before the tail
+        # Time: O(n), Space: O(1)
+
+        while True:
+            previous = self.sentinel
+            previous.lock.acquire()
+            current = previous.next
+            if current is None:
+                previous.lock.release()
+                return None
+            current.lock.acquire()
+            while current.next is not None:
+                following = current.next
+                following.lock.acquire()
+                previous.lock.release()
+                previous, current = current, following
+            try:
+                result = self._try_remove(previous, current)
+            finally:
+                self._release(previous, current)
+            if result is not RETRY:
+                return result
+
+    def snapshot(self):
+        # snapshot() returns all values as a Python list, walking
+        # hand-over-hand, so every value was in the list when it was read
+        # Time: O(n), Space: O(n)
+
+        values = []
+        previous = self.sentinel
+        previous.lock.acquire()
+        while True:
+            current = previous.next
+            if current is None:
+                previous.lock.release()
+                return values
+            current.lock.acquire()
+            previous.lock.release()
+            values.append(current.value)
+            previous = current
+
+    def __iter__(self):
+        # __iter__() iterates over a snapshot, so no lock is held while
+        # the caller's loop body runs
+        return iter(self.snapshot())
+
+    def __str__(self):
+        return "->".join(map(str, self.snapshot()))
+
+
+def benchmark(threads=(1, 2, 4, 8), operations=20_000, size=1_000):
+    # benchmark() runs a mixed workload on many threads:
+    #   1/3 of the threads append (producers), 1/3 pop_first (consumers),
+    #   the rest do get() / search() in the first `size` positions
+    # and compares ConcurrentLinkedlist with a Linkedlist behind ONE lock
+
+    import sys
+    import time
+    from .insertion_in_ssl import Linkedlist
+
+    class LockedLinkedlist:
+        # Linkedlist with one global lock around every call
+        def __init__(self):
+            self.linked_list = Linkedlist()
+            self.lock = threading.Lock()
+
+        def __getattr__(self, name):
+            method = getattr(self.linked_list, name)
+
+            def locked(*args):
+                with self.lock:
+                    return method(*args)
+            return locked
+
+    def worker(linked_list, role, count):
+        if role == 0:
+            for i in range(count):
+                linked_list.append(i)
+        elif role == 1:
+            for _ in range(count):
+                linked_list.pop_first()
+        else:
+            for i in range(count):
+                if i % 8:
+                    linked_list.get(i % size)
+                else:
+                    linked_list.search(-1 if i % 16 else i % size)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled (free-threaded build)'}, "
+          f"{operations} operations per thread")
+    print(f"{'threads':>8}{'one lock ops/s':>18}{'hand-over-hand ops/s':>24}")
+
+    for count in threads:
+        row = []
+        for make in (LockedLinkedlist, ConcurrentLinkedlist):
+            linked_list = make()
+            for i in range(size * 2):
+                linked_list.append(i)
+            workers = [threading.Thread(target=worker, args=(linked_list, n % 3, operations))
+                       for n in range(count)]
+            start = time.perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            row.append(count * operations / (time.perf_counter() - start))
+        print(f"{count:>8}{row[0]:>18.0f}{row[1]:>24.0f}")
+
+
+if __name__ == "__main__":
+    benchmark()
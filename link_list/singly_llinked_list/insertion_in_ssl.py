@@ -34,32 +34,258 @@ Update the tail to point to the new node.
 
 In all cases, insertion works by changing references (links) between nodes, not by shifting memory.'''
 
-from sll_nodesnLL import Node  
+from math import isqrt
+# Integer square root, used to space the checkpoints about sqrt(n) apart
+# Time: O(1), Space: O(1)
+
+from .sll_nodesnLL import Node  
 # Import Node class (no runtime cost in algorithm analysis)
 # Time: O(1), Space: O(1)
 
+from .value_index import ValueIndex
+# Optional value → nodes index that makes search / in O(1)
+# Time: O(1), Space: O(1)
+
+from . import ll_numpy
+# Optional NumPy helpers (NumPy itself is only imported on first use)
+# Time: O(1), Space: O(1)
+
+
+REPR_LIMIT = 10
+# repr() shows at most this many values, so repr of a huge list stays short
+
 
 class Linkedlist:
     # LinkedList class manages nodes (HAS-A relationship)
     # Time: O(1), Space: O(1)
 
+    _node_class = Node
+    # Class used for new nodes; instrumentation sets it on ONE list
+    # (see instrumentation.py), every other list keeps using Node
+
     def __init__(self):
         # Constructor initializes an empty linked list
         self.head = None      # head points to first node | Time: O(1), Space: O(1)
         self.tail = None      # tail points to last node  | Time: O(1), Space: O(1)
         self.length = 0       # stores number of nodes    | Time: O(1), Space: O(1)
+        self.position_index = None  # optional SkipIndex, off by default | Time: O(1), Space: O(1)
+        self.value_index = None     # optional ValueIndex, off by default | Time: O(1), Space: O(1)
+
+        self.finger_node = None     # last node reached by get()           | Time: O(1), Space: O(1)
+        self.finger_index = 0       # position of finger_node              | Time: O(1), Space: O(1)
+
+        self.checkpoint_every = None  # None → checkpoints off, 0 → every sqrt(n) nodes
+        self.checkpoint_step = 0      # distance between checkpoints in the current table
+        self.checkpoints = None       # checkpoints[j] is the node at j * checkpoint_step
+                                      # None → must be rebuilt before next use
 
     # for printing the linked list
     def __str__(self):
+        return "->".join(map(str, self))
+        # join() computes the final size once and copies every piece once
+        # (result += ... copied the whole string again for every node)
+        # Time: O(n), Space: O(n)
+
+    def __repr__(self):
+        # __repr__() shows at most REPR_LIMIT values
+        # Example: Linkedlist([0, 1, 2, ...], length=1000000)
+
+        shown = []
+        for value in self:
+            if len(shown) == REPR_LIMIT:
+                break
+            shown.append(repr(value))
+        # Stop the walk early, huge lists are not visited completely
+        # Time: O(1), Space: O(1)
+
+        if self.length > REPR_LIMIT:
+            shown.append("...")
+            return f"{type(self).__name__}([{', '.join(shown)}], length={self.length})"
+        return f"{type(self).__name__}([{', '.join(shown)}])"
+
+    def __len__(self):
+        # __len__() allows us to write: len(linked_list)
+        return self.length
+        # length is kept up to date, no walk needed
+        # Time: O(1), Space: O(1)
+
+    def __iter__(self):
+        # __iter__() allows us to write: for value in linked_list
+        # It is a generator, so values are produced one at a time
+
         temp_node = self.head
-        result = ""
         while temp_node is not None:
-            result += str(temp_node.value)
-            if temp_node.next is not None:
-                result += "->"
+            yield temp_node.value
             temp_node = temp_node.next
-        return result
-    
+        # Time: O(n), Space: O(1)
+
+    def __reversed__(self):
+        # __reversed__() allows us to write: reversed(linked_list)
+        # Nodes only know their next node, so values are collected first
+        values = list(self)
+        return reversed(values)
+        # Time: O(n), Space: O(n)
+
+    def __getitem__(self, index):
+        # __getitem__() allows linked_list[i] and linked_list[start:stop:step]
+        # It returns:
+        #   value         → for an integer index (negative counts from the end)
+        #   new list      → for a slice, built in one walk
+
+        if isinstance(index, slice):
+            positions = range(self.length)[index]
+            # range does the slice arithmetic (negative, step, bounds) for us
+            # Time: O(1), Space: O(1)
+
+            if not positions:
+                return type(self).from_iterable(())
+
+            low = min(positions[0], positions[-1])
+            high = max(positions[0], positions[-1])
+            step = abs(positions.step)
+
+            temp_node = self.get(low)
+            # One walk to the first wanted position (finger / checkpoints help)
+            # Time: O(n), Space: O(1)
+
+            picked = []
+            for position in range(low, high + 1):
+                if (position - low) % step == 0:
+                    picked.append(temp_node.value)
+                temp_node = temp_node.next
+            # Continue the same walk to the last wanted position
+            # Time: O(n), Space: O(k)
+
+            if positions.step < 0:
+                picked.reverse()
+            return type(self).from_iterable(picked)
+
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("Linkedlist index out of range")
+            # Same error as a Python list
+
+        return self.get(index).value
+        # Time: O(n), Space: O(1)
+
+    def enable_position_index(self):
+        # enable_position_index() attaches a skip list index to the list
+        # After this get / set_value / insert / remove reach a position
+        # in O(log n) expected time instead of walking from head
+        # Every append / prepend / pop then also costs O(log n)
+
+        from .skip_index import SkipIndex
+        # Imported here, not at the top, so importing this module stays cheap
+        # for programs that never use the index
+
+        self.position_index = SkipIndex(self)
+        # Index is built from the current chain in one walk
+        # Time: O(n), Space: O(n)
+
+    def disable_position_index(self):
+        # disable_position_index() drops the index, the list walks from head again
+        self.position_index = None
+        # Time: O(1), Space: O(1)
+
+    def enable_checkpoints(self, every=0):
+        # enable_checkpoints() remembers every k-th node in a small table
+        # get() then starts from the closest checkpoint instead of head
+        # every = 0 picks k = sqrt(n) so get() walks O(sqrt n) nodes
+        # The table is rebuilt lazily (on the next get) after a change
+        # that moves nodes to other positions
+
+        self.checkpoint_every = every
+        self.checkpoints = None
+        # Time: O(1), Space: O(1)
+
+    def disable_checkpoints(self):
+        # disable_checkpoints() drops the table
+        self.checkpoint_every = None
+        self.checkpoints = None
+        # Time: O(1), Space: O(1)
+
+    def _build_checkpoints(self):
+        # _build_checkpoints() fills the checkpoint table in one walk
+        # Time: O(n), Space: O(n / k)
+
+        step = self.checkpoint_every or max(1, isqrt(self.length))
+        table = []
+        temp_node = self.head
+        position = 0
+        while temp_node is not None:
+            if position % step == 0:
+                table.append(temp_node)
+            temp_node = temp_node.next
+            position += 1
+        self.checkpoint_step = step
+        self.checkpoints = table
+
+    def _step_drifted(self):
+        # _step_drifted() tells whether the automatic step (every = 0) is
+        # more than 2x away from sqrt(length): the list grew or shrank a
+        # lot since the table was built, so the table would hold O(n)
+        # entries or get() would walk O(n) nodes
+        # Time: O(1), Space: O(1)
+
+        if self.checkpoint_every:
+            return False
+        target = max(1, isqrt(self.length))
+        return target > 2 * self.checkpoint_step or self.checkpoint_step > 2 * target
+
+    def _add_checkpoint(self, node, position):
+        # _add_checkpoint() is called for a new LAST node at position
+        # It joins the table when it lands on a checkpoint position
+        # Time: O(1), Space: O(1)
+
+        if position % self.checkpoint_step == 0:
+            self.checkpoints.append(node)
+            if self._step_drifted():
+                self.checkpoints = None
+                # Too many entries for this length, rebuild on the next get()
+
+    def _positions_shifted(self, index, step):
+        # _positions_shifted() is called when the node at index (and every
+        # node after it) moved by step positions:
+        #   step = +1 → a node was inserted at index
+        #   step = -1 → the node at index was removed
+        # It keeps the finger correct and marks stale checkpoints
+        # Time: O(1), Space: O(1)
+
+        if self.finger_node is not None and self.finger_index >= index:
+            if step < 0 and self.finger_index == index:
+                self.finger_node = None
+                # The finger node itself was removed
+            else:
+                self.finger_index += step
+                # Same node, it just has a new position
+
+        if self.checkpoints and (len(self.checkpoints) - 1) * self.checkpoint_step >= index:
+            self.checkpoints = None
+            # Some checkpoint now sits at the wrong position
+
+        elif (self.checkpoints and step > 0 and index < self.length - 1
+              and len(self.checkpoints) * self.checkpoint_step <= self.length - 1):
+            self.checkpoints = None
+            # A node after the last checkpoint moved onto the next
+            # checkpoint position, which has no entry in the table
+            # (length is already updated; index == length - 1 is an insert
+            # at the end, where nothing moved and the caller adds the entry)
+
+    def enable_value_index(self):
+        # enable_value_index() attaches a value → nodes hash index
+        # After this search / in / find_all do not compare node by node
+        # Every change to the list also updates the index in O(1)
+        # (O(d) when a value is stored d times)
+
+        self.value_index = ValueIndex(self)
+        # Index is built from the current chain in one walk
+        # Time: O(n), Space: O(n)
+
+    def disable_value_index(self):
+        # disable_value_index() drops the index, search walks from head again
+        self.value_index = None
+        # Time: O(1), Space: O(1)
 
 
 
@@ -67,7 +293,7 @@ class Linkedlist:
     def append(self, value):
         # append() adds a new node at the end of the linked list
 
-        new_node = Node(value)  
+        new_node = self._node_class(value)  
         # Create a new node in heap memory
         # Time: O(1), Space: O(1)
 
@@ -99,12 +325,26 @@ class Linkedlist:
         # Increment the size of linked list
         # Time: O(1), Space: O(1)
 
+        if self.checkpoints is not None:
+            self._add_checkpoint(new_node, self.length - 1)
+            # Time: O(1), Space: O(1)
+
+        if self.position_index is not None:
+            self.position_index.inserted(self.length - 1, new_node)
+            # Keep the skip list index in sync
+            # Time: O(log n), Space: O(1) expected
+
+        if self.value_index is not None:
+            self.value_index.inserted(new_node, self.length - 1)
+            # Keep the value index in sync
+            # Time: O(1), Space: O(1)
+
 
     # for prepending to the LL
     def prepend(self, value):
         # prepend() adds a new node at the beginning of the linked list
 
-        new_node = Node(value)  
+        new_node = self._node_class(value)  
         # Create a new node in heap memory
         # Time: O(1), Space: O(1)
 
@@ -138,13 +378,27 @@ class Linkedlist:
         # Increase the size of the linked list
         # Time: O(1), Space: O(1)
 
+        self._positions_shifted(0, 1)
+        # Every old node moved one position right
+        # Time: O(1), Space: O(1)
+
+        if self.position_index is not None:
+            self.position_index.inserted(0, new_node)
+            # Keep the skip list index in sync
+            # Time: O(log n), Space: O(1) expected
+
+        if self.value_index is not None:
+            self.value_index.inserted(new_node, 0)
+            # Keep the value index in sync
+            # Time: O(1), Space: O(1)
+
     def insert(self, index, value):
         # insert() adds a new node at a given index in the linked list
         # It returns:
         #   True  → if insertion is successful
         #   False → if insertion fails (invalid index)
 
-        new_node = Node(value)  
+        new_node = self._node_class(value)  
         # Create a new node in memory
         # Time: O(1), Space: O(1)
 
@@ -185,19 +439,11 @@ class Linkedlist:
         else:
             # If inserting in the middle or at the end (not index 0)
 
-            temp_node = self.head  
-            # Start traversal from head
-            # Time: O(1), Space: O(1)
-
-            for _ in range(index - 1):
-                # Move to the node just BEFORE the insertion position
-                # We must reach the correct place before linking
-                # Loop runs (index-1) times
-                # Time: O(n), Space: O(1)
-
-                temp_node = temp_node.next  
-                # Move one node forward using next reference
-                # Time: O(1), Space: O(1)
+            temp_node = self.get(index - 1)  
+            # Reach the node just BEFORE the insertion position
+            # get() starts from the skip list index, the finger or the
+            # closest checkpoint when they are available, else from head
+            # Time: O(n), Space: O(1)
 
             new_node.next = temp_node.next  
             # New node now points to the next node in the list
@@ -221,6 +467,31 @@ class Linkedlist:
         # Increase size of linked list because insertion succeeded
         # Time: O(1), Space: O(1)
 
+        self._positions_shifted(index, 1)
+        # Nodes from index onwards moved one position right
+        # Time: O(1), Space: O(1)
+
+        if self.checkpoints is not None and new_node.next is None:
+            self._add_checkpoint(new_node, index)
+            # Inserted at the end: nothing moved, but the new last node may
+            # sit on a checkpoint position, exactly like append()
+            # Time: O(1), Space: O(1)
+
+        self.finger_node = new_node
+        self.finger_index = index
+        # Next insert at index + 1 continues from the new node
+        # Time: O(1), Space: O(1)
+
+        if self.position_index is not None:
+            self.position_index.inserted(index, new_node)
+            # Keep the skip list index in sync
+            # Time: O(log n), Space: O(1) expected
+
+        if self.value_index is not None:
+            self.value_index.inserted(new_node, index)
+            # Keep the value index in sync
+            # Time: O(1), Space: O(1)
+
         # return True means:
         # - Insertion was COMPLETED successfully
         # - All pointer updates worked correctly
@@ -228,36 +499,467 @@ class Linkedlist:
         # Time: O(1), Space: O(1)
         return True
 
-    def traversal(self):
-    # traversal() prints all values stored in the linked list
-    # It visits each node one by one starting from head
+    def extend(self, iterable):
+        # extend() appends every value of iterable at the end of the list
+        # The new nodes are linked in one loop and length is updated once
+
+        if self.position_index is not None or self.value_index is not None:
+            if iterable is self:
+                iterable = list(self)
+                # extend(self) would keep walking the nodes it just
+                # appended and never end, so copy the values first
+                # Time: O(n), Space: O(n)
+            for value in iterable:
+                self.append(value)
+            return
+            # Indexes must see every new node, use the normal append
+            # Time: O(k log n) with a skip list index, O(k) otherwise
+
+        node_class = self._node_class
+        values = iter(iterable)
+        first = None
+        for value in values:
+            first = node_class(value)
+            break
+        if first is None:
+            return
+            # Nothing to add
+        # The first new node is made separately so the main loop
+        # never has to check whether the list is empty
+        # Time: O(1), Space: O(1)
 
-        temp_node = self.head  
-        # Start traversal from the first node of the linked list
-        # temp_node holds a reference to the current node
+        last = first
+        count = 1
+        for value in values:
+            last.next = last = node_class(value)
+            # Targets are assigned left to right:
+            #   1. old last.next = new node
+            #   2. last = new node
+            # Time: O(1), Space: O(1)
+
+            count += 1
+
+        old_length = self.length
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.length += count
+        # Attach the whole new chain at once, write tail and length once
         # Time: O(1), Space: O(1)
 
-        while temp_node is not None:
-            # Loop continues as long as the current node exists
-            # This ensures we visit every node including the last one
-            # The loop will run once for each node
-            # Time: O(n), Space: O(1)
+        if self.checkpoints is not None:
+            temp_node = first
+            for position in range(old_length, self.length):
+                if position % self.checkpoint_step == 0:
+                    self.checkpoints.append(temp_node)
+                temp_node = temp_node.next
+            # New nodes landing on checkpoint positions join the table
+            # Time: O(k), Space: O(k / step)
+
+            if self._step_drifted():
+                self.checkpoints = None
+                # Too many entries for this length, rebuild on the next get()
+
+        # Total Time: O(k), Space: O(k) for k new values
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        # from_iterable() builds a new linked list from any iterable
+        # Example: Linkedlist.from_iterable(range(10))
+
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+        # Time: O(k), Space: O(k)
+
+    def __reduce__(self):
+        # pickle stores the values as one flat list, not the Node chain
+        # (the default pickles node.next inside node.next ... and hits
+        # the recursion limit after a few hundred nodes)
+        # The list is rebuilt with from_iterable, indexes are not kept
+        return (type(self).from_iterable, (list(self),))
+        # Time: O(n), Space: O(n)
+
+    def insert_many(self, items):
+        # insert_many() inserts many (index, value) pairs in ONE walk
+        # Every index refers to the list BEFORE any of these insertions:
+        #   value goes in front of the node that is at index now
+        #   index == length means at the end
+        # Pairs with the same index keep their given order
+        # It returns:
+        #   True  → if all insertions are done
+        #   False → if any index is invalid (then nothing is inserted)
 
-            print(temp_node.value)  
-            # Print the value stored in the current node
+        items = sorted(items, key=lambda item: item[0])
+        # Sorting lets us reach every position with one forward walk
+        # sorted() is stable, so equal indexes keep their order
+        # Time: O(k log k), Space: O(k)
+
+        if not items:
+            return True
+
+        if items[0][0] < 0 or items[-1][0] > self.length:
+            return False
             # Time: O(1), Space: O(1)
 
-            temp_node = temp_node.next  
-            # Move to the next node using the next reference
-            # This follows the links between nodes
+        previous = None
+        current = self.head
+        position = 0
+        # previous → node before the gap we insert into (None = before head)
+        # current  → node after the gap, currently at `position`
+        # Time: O(1), Space: O(1)
+
+        for index, value in items:
+            while position < index:
+                previous = current
+                current = current.next
+                position += 1
+                # Move forward only, never restart from head
+                # Time: O(n) in total over the whole loop
+
+            new_node = self._node_class(value)
+            new_node.next = current
+            if previous is None:
+                self.head = new_node
+            else:
+                previous.next = new_node
+            previous = new_node
+            # Splice the new node into the gap
+            # Time: O(1), Space: O(1)
+
+        if current is None:
+            self.tail = previous
+            # Something was inserted after the old last node
+
+        self.length += len(items)
+
+        self._chain_changed()
+        # Positions changed in many places
+
+        return True
+        # Total Time: O(n + k log k), Space: O(k)
+
+    def _chain_changed(self):
+        # _chain_changed() is called after nodes were moved around in
+        # many places at once (insert_many, sort, merge_sorted)
+        # It forgets the finger and the checkpoint table and rebuilds
+        # the indexes once, one more walk, O(n)
+
+        self.finger_node = None
+        self.checkpoints = None
+
+        if self.position_index is not None:
+            self.position_index.rebuild()
+        if self.value_index is not None:
+            self.value_index.rebuild()
+
+    def sort(self, key=None, reverse=False):
+        # sort() sorts the list IN PLACE, like list.sort()
+        # Nodes are not copied, only their next links change
+        # Equal values keep their order (stable), also with reverse=True
+        #
+        # Bottom-up merge sort, no recursion:
+        #   pass 1 merges runs of 1 node into sorted runs of 2,
+        #   pass 2 merges runs of 2 into runs of 4, and so on
+        # Every pass is one walk over the list, there are log n passes
+
+        if self.length < 2:
+            return
             # Time: O(1), Space: O(1)
 
+        width = 1
+        while width < self.length:
+            new_head = None
+            new_tail = None
+            rest = self.head
+
+            while rest is not None:
+                left = rest
+                right = _cut(left, width)
+                rest = _cut(right, width)
+                # Detach the next two runs of `width` nodes
+                # Time: O(width), Space: O(1)
+
+                head, tail = _merge(left, right, key, reverse)
+                if new_tail is None:
+                    new_head = head
+                else:
+                    new_tail.next = head
+                new_tail = tail
+                # Append the merged run to the result of this pass
+                # Time: O(width), Space: O(1)
+
+            self.head = new_head
+            self.tail = new_tail
+            width *= 2
+        # Time: O(n log n), Space: O(1)
+
+        self._chain_changed()
+
+    def reverse(self):
+        # reverse() reverses the list IN PLACE by turning every next link
+        # around in one walk; old head becomes tail and old tail becomes head
+
+        if self.length < 2:
+            return
+
+        previous_node = None
+        temp_node = self.head
+        self.tail = temp_node
+        while temp_node is not None:
+            next_node = temp_node.next
+            temp_node.next = previous_node
+            previous_node = temp_node
+            temp_node = next_node
+        self.head = previous_node
+        # Time: O(n), Space: O(1)
+
+        self._chain_changed()
+
+    def reverse_groups(self, k):
+        # reverse_groups() reverses every group of k nodes IN PLACE
+        # A last group with fewer than k nodes stays as it is
+        # Example: 1->2->3->4->5, k=2 → 2->1->4->3->5
+
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if k == 1 or self.length < k:
+            return
+
+        group_tail = None
+        # Last node of the groups done so far
+        temp_node = self.head
+
+        for _ in range(self.length // k):
+            # length tells how many full groups there are, so there is
+            # no need to look k nodes ahead before every group
+            first = temp_node
+            previous_node = None
+            for _ in range(k):
+                next_node = temp_node.next
+                temp_node.next = previous_node
+                previous_node = temp_node
+                temp_node = next_node
+            # previous_node is now the first node of the reversed group
+            # and first is its last node
+
+            if group_tail is None:
+                self.head = previous_node
+            else:
+                group_tail.next = previous_node
+            group_tail = first
+
+        group_tail.next = temp_node
+        # Attach the short last group (or None)
+        if temp_node is None:
+            self.tail = group_tail
+        # Time: O(n), Space: O(1)
+
+        self._chain_changed()
+
+    def middle(self):
+        # middle() returns the middle node with two pointers
+        # (the second of the two middle nodes for an even length)
+        from .ll_algorithms import middle
+        return middle(self)
+        # Time: O(n), Space: O(1)
+
+    def nth_from_end(self, k):
+        # nth_from_end() returns the k-th node from the end (1 → tail)
+        # or None if k is out of range
+        from .ll_algorithms import nth_from_end
+        return nth_from_end(self, k)
+        # Time: O(n), Space: O(1)
+
+    def has_cycle(self):
+        # has_cycle() checks with Floyd's algorithm whether the chain loops
+        # back on itself (a Linkedlist never should; this catches bugs)
+        from .ll_algorithms import has_cycle
+        return has_cycle(self)
+        # Time: O(n), Space: O(1)
+
+    def cycle_start(self):
+        # cycle_start() returns the first node of the loop, or None
+        from .ll_algorithms import cycle_start
+        return cycle_start(self)
+        # Time: O(n), Space: O(1)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        # merge_sorted() moves every node of other into this list
+        # Both lists must already be sorted (with the same key / reverse)
+        # The result is sorted, equal values from self come first
+        # No node is created, other is empty afterwards
+
+        if other is self:
+            raise ValueError("cannot merge a list with itself")
+
+        self.head, tail = _merge(self.head, other.head, key, reverse)
+        if tail is not None:
+            self.tail = tail
+        self.length += other.length
+        # One walk over both lists
+        # Time: O(n + m), Space: O(1)
+
+        other.head = None
+        other.tail = None
+        other.length = 0
+        other._chain_changed()
+        self._chain_changed()
+
+    def save(self, path):
+        # save() writes all values to a compact binary file
+        # ints / floats are stored as raw 8 byte numbers,
+        # other values as size-prefixed pickles (see ll_storage.py)
+        from . import ll_storage
+        # Imported on first use: it pulls in pickle and mmap
+        ll_storage.save(self, path)
+        # Time: O(n), Space: O(1)
+
+    @classmethod
+    def load(cls, path, lazy=False):
+        # load() reads a file written by save()
+        # It returns:
+        #   new Linkedlist → by default (values copied into nodes)
+        #   MappedList     → if lazy=True, a read-only view that reads
+        #                    values from the mmap-ed file only when used
+
+        from . import ll_storage
+
+        if lazy:
+            return ll_storage.open_mapped(path)
+            # Time: O(1) for numbers, O(n) size prefixes for objects
+        return ll_storage.load(path, cls)
+        # Time: O(n), Space: O(n)
+
+    def freeze(self):
+        # freeze() returns an immutable PersistentList with the same values
+        # Later snapshots of the frozen list are free (see persistent_ll.py)
+        from .persistent_ll import freeze
+        return freeze(self)
+        # Time: O(n), Space: O(n)
+
+    def view(self, start=0, stop=None):
+        # view() returns a lazy ListView of positions start ... stop - 1
+        # Nothing is copied; chain .map(fn) / .filter(pred) on the view
+        # and call .materialize() for a real list (see ll_view.py)
+        # The view's map / filter call fn / pred once per value, unlike
+        # the eager NumPy map_inplace / filter below
+        from .ll_view import ListView
+        return ListView(self, start, stop)
+        # Time: O(1), Space: O(1)
+
+    def memory_usage(self, deep=True, traced=False):
+        # memory_usage() reports node count, bytes per node and value
+        # bytes as a dict (see ll_memory.py)
+        from . import ll_memory
+        return ll_memory.memory_usage(self, deep, traced)
+        # Time: O(n + d), Space: O(d) for d different objects in the values
+
+    def compact(self):
+        # compact() copies every node into a NEW node, in list order
+        # After a lot of insert / remove / sort the nodes are spread over
+        # the heap in random order; new nodes made one after another sit
+        # next to each other, so the next walks touch memory in order
+        # Nodes held by the caller (from get()) are no longer in the list
+
+        if self.head is None:
+            return
+
+        node_class = self._node_class
+        first = node_class(self.head.value)
+        last = first
+        temp_node = self.head.next
+        while temp_node is not None:
+            last.next = last = node_class(temp_node.value)
+            temp_node = temp_node.next
+        # The whole new chain is built before the old one is dropped, so
+        # the new nodes do not land in the scattered holes of the old ones
+        # Time: O(n), Space: O(n) extra until the old nodes are freed
+
+        self.head = first
+        self.tail = last
+        self._chain_changed()
+        # The indexes pointed at the old nodes
+
+    def to_numpy(self, dtype=None):
+        # to_numpy() copies all values into a NumPy array in one walk
+        return ll_numpy.to_numpy(self, dtype)
+        # Time: O(n), Space: O(n)
+
+    @classmethod
+    def from_numpy(cls, array):
+        # from_numpy() builds a linked list from a 1-D NumPy array
+        return ll_numpy.from_numpy(cls, array)
+        # Time: O(n), Space: O(n)
+
+    def map_inplace(self, function, dtype=None):
+        # map_inplace() applies a vectorized function to all values
+        # Example: linked_list.map_inplace(lambda x: x * 2)
+        # One walk to gather, NumPy computes, one walk to write back
+        ll_numpy.map_inplace(self, function, dtype)
+        # Time: O(n), Space: O(n)
+
+    def filter(self, predicate, dtype=None):
+        # filter() returns a new list with the values where the
+        # vectorized predicate is True
+        # predicate gets the whole NumPy array and returns one bool per
+        # value; for a lazy, per-value filter use view().filter(pred)
+        # Example: linked_list.filter(lambda x: x % 2 == 0)
+        return ll_numpy.filter_values(self, predicate, dtype)
+        # Time: O(n), Space: O(n)
+
+    def reduce(self, function, dtype=None):
+        # reduce() combines all values with NumPy
+        # Example: linked_list.reduce(numpy.add) → sum of all values
+        return ll_numpy.reduce(self, function, dtype)
+        # Time: O(n), Space: O(n)
+
+    def argmax(self, dtype=None):
+        # argmax() returns the position of the largest value (-1 if empty)
+        return ll_numpy.argmax(self, dtype)
+        # Time: O(n), Space: O(n)
+
+    def parallel_map(self, function, workers=None, chunk_size=None, executor=None):
+        # parallel_map() replaces every value with function(value) using
+        # worker processes (see ll_parallel.py), function must be picklable
+        from . import ll_parallel
+        ll_parallel.parallel_map(self, function, workers, chunk_size, executor)
+        # Time: O(n) walk, O(n / workers) function calls per process
+
+    def parallel_reduce(self, function, initial, workers=None, chunk_size=None, executor=None):
+        # parallel_reduce() combines all values with an associative function
+        # using worker processes (see ll_parallel.py)
+        from . import ll_parallel
+        return ll_parallel.parallel_reduce(self, function, initial, workers, chunk_size, executor)
+        # Time: O(n) walk, O(n / workers) function calls per process
+
+    def traversal(self):
+    # traversal() prints all values stored in the linked list
+    # It visits each node one by one starting from head
+
+        if self.length:
+            print("\n".join(map(str, self)))
+            # Same output as one print() per node (one value per line)
+            # but written with a single print call
+            # Time: O(n), Space: O(n)
+
     def search(self, value):
     # search() finds the position (index) of a given value in the linked list
     # It returns:
     #   index (0-based) → if value is found
     #   -1             → if value is not present in the list
 
+        if self.value_index is not None and self.value_index.usable:
+            try:
+                return self.value_index.search(value)
+                # Dictionary lookup instead of comparing every node
+                # Time: O(1), Space: O(1) (O(n) once after a shifting change)
+            except TypeError:
+                pass
+                # value cannot be hashed (list, dict ...), do the normal walk
+
         current = self.head  
         # Start searching from the first node (head)
         # current holds reference to the current node
@@ -298,6 +1000,43 @@ class Linkedlist:
         # This is a standard convention in searching algorithms
         # Time: O(1), Space: O(1)
 
+    def __contains__(self, value):
+        # __contains__() allows us to write: value in linked_list
+        # It returns True if at least one node holds value
+
+        if self.value_index is not None and self.value_index.usable:
+            try:
+                return self.value_index.contains(value)
+                # Time: O(1), Space: O(1)
+            except TypeError:
+                pass
+
+        return self.search(value) != -1
+        # Time: O(n), Space: O(1)
+
+    def find_all(self, value):
+        # find_all() returns the positions of EVERY node holding value
+        # It returns:
+        #   list of indexes (0-based, increasing) → empty list if not found
+
+        if self.value_index is not None and self.value_index.usable:
+            try:
+                return self.value_index.find_all(value)
+                # Time: O(d log d) for d copies, no walk over the list
+            except TypeError:
+                pass
+
+        positions = []
+        current = self.head
+        index = 0
+        while current is not None:
+            if current.value == value:
+                positions.append(index)
+            current = current.next
+            index += 1
+        return positions
+        # Time: O(n), Space: O(d)
+
     def get(self, index):
     # get() returns the node present at a given index in the linked list
     # It returns:
@@ -312,27 +1051,58 @@ class Linkedlist:
 
             return self.tail
 
-        if index < 0 or index > self.length:
-            # If index is invalid (negative or greater than list length)
+        if index < 0 or index >= self.length:
+            # If index is invalid (negative or not smaller than list length)
             # We cannot access a node at this position
             # Time: O(1), Space: O(1)
 
             return None
 
+        if self.position_index is not None:
+            return self.position_index.node_at(index)
+            # Use the skip list lanes instead of walking from head
+            # Time: O(log n), Space: O(1) expected
+
         temp_node = self.head  
+        position = 0
         # Start traversal from the first node (head)
         # temp_node holds reference to the current node
         # Time: O(1), Space: O(1)
 
-        for _ in range(index):
-            # Move forward 'index' times to reach the desired node
-            # Loop runs index times
-            # Time: O(n), Space: O(1)
+        if self.checkpoint_every is not None:
+            if not self.checkpoints or self._step_drifted():
+                self._build_checkpoints()
+                # Table was stale (or its step no longer fits the length),
+                # rebuild it once
+                # Time: O(n), Space: O(sqrt n)
+
+            slot = min(index // self.checkpoint_step, len(self.checkpoints) - 1)
+            temp_node = self.checkpoints[slot]
+            position = slot * self.checkpoint_step
+            # Closest checkpoint at or before index
+            # Time: O(1), Space: O(1)
+
+        if self.finger_node is not None and position < self.finger_index <= index:
+            temp_node = self.finger_node
+            position = self.finger_index
+            # Last visited node is even closer, continue from there
+            # Time: O(1), Space: O(1)
+
+        for _ in range(index - position):
+            # Move forward to reach the desired node
+            # Loop runs index - position times
+            # Time: O(n), O(sqrt n) with checkpoints, O(1) for the next index
+            # Space: O(1)
 
             temp_node = temp_node.next  
             # Move to the next node using next reference
             # Time: O(1), Space: O(1)
 
+        self.finger_node = temp_node
+        self.finger_index = index
+        # Remember where we stopped for the next call
+        # Time: O(1), Space: O(1)
+
         return temp_node  
         # Return the node found at the given index
         # This allows the caller to access its value or next pointer
@@ -366,11 +1136,20 @@ class Linkedlist:
             # This means index is within range and node exists
             # Time: O(1), Space: O(1)
 
+            old_value = temp_node.value
+            # Remember the old value so the value index can forget it
+            # Time: O(1), Space: O(1)
+
             temp_node.value = value  
             # Update the value stored in the node
             # This changes data but NOT the structure of the linked list
             # Time: O(1), Space: O(1)
 
+            if self.value_index is not None:
+                self.value_index.changed(temp_node, old_value)
+                # Move the node to the bucket of its new value
+                # Time: O(1), Space: O(1)
+
             return True  
             # Return True to indicate update was successful
             # This tells the caller the operation SUCCEEDED
@@ -434,6 +1213,20 @@ class Linkedlist:
             # Prevents accidental memory access
             # Time: O(1), Space: O(1)
 
+        if self.position_index is not None:
+            self.position_index.removed(0)
+            # Keep the skip list index in sync
+            # Time: O(log n), Space: O(1) expected
+
+        if self.value_index is not None:
+            self.value_index.removed(temp_node, 0)
+            # Keep the value index in sync
+            # Time: O(1), Space: O(1)
+
+        self._positions_shifted(0, -1)
+        # Every remaining node moved one position left
+        # Time: O(1), Space: O(1)
+
         self.length -= 1  
         # Decrease size of linked list because one node is removed
         # Time: O(1), Space: O(1)
@@ -480,18 +1273,11 @@ class Linkedlist:
             # We must find the SECOND-LAST node
             # Time: O(1), Space: O(1) for setup
 
-            temp_node = self.head  
-            # Start traversal from head to reach second-last node
-            # Time: O(1), Space: O(1)
-
-            while temp_node.next is not self.tail:
-                # Move forward until we reach the node just before tail
-                # Loop runs (n-1) times in worst case
-                # Time: O(n), Space: O(1)
-
-                temp_node = temp_node.next  
-                # Move to next node using next reference
-                # Time: O(1), Space: O(1)
+            temp_node = self.get(self.length - 2)  
+            # Reach the second-last node
+            # get() uses the skip list index or the closest checkpoint
+            # when they are available, else walks from head
+            # Time: O(n), Space: O(1)
 
             self.tail = temp_node  
             # Update tail to the second-last node
@@ -503,6 +1289,26 @@ class Linkedlist:
             # Prevents accidental memory access
             # Time: O(1), Space: O(1)
 
+        if self.position_index is not None:
+            self.position_index.removed(self.length - 1)
+            # Keep the skip list index in sync
+            # Time: O(log n), Space: O(1) expected
+
+        if self.value_index is not None:
+            self.value_index.removed(pop_value, self.length - 1)
+            # Keep the value index in sync
+            # Time: O(1), Space: O(1)
+
+        if self.finger_node is pop_value:
+            self.finger_node = None
+            # Finger was on the removed last node
+            # Time: O(1), Space: O(1)
+
+        if self.checkpoints and (len(self.checkpoints) - 1) * self.checkpoint_step >= self.length - 1:
+            self.checkpoints.pop()
+            # Removed node was a checkpoint, the others did not move
+            # Time: O(1), Space: O(1)
+
         self.length -= 1  
         # Decrease size of linked list because one node is removed
         # Time: O(1), Space: O(1)
@@ -514,6 +1320,72 @@ class Linkedlist:
 
 
 
+def _cut(node, count):
+    # _cut() ends the chain after `count` nodes starting at node
+    # It returns the first node after the cut (None if the chain was shorter)
+    # Time: O(count), Space: O(1)
+
+    for _ in range(count - 1):
+        if node is None:
+            return None
+        node = node.next
+    if node is None:
+        return None
+    rest = node.next
+    node.next = None
+    return rest
+
+
+def _merge(left, right, key=None, reverse=False):
+    # _merge() merges two sorted None-terminated chains into one
+    # It returns (head, tail) of the merged chain
+    # A node from right only goes first if it is strictly "smaller"
+    # (strictly larger with reverse), that keeps the merge stable
+    # Time: O(len(left) + len(right)), Space: O(1)
+
+    head = None
+    tail = None
+
+    while left is not None and right is not None:
+        if key is None:
+            left_key = left.value
+            right_key = right.value
+        else:
+            left_key = key(left.value)
+            right_key = key(right.value)
+
+        if reverse:
+            right_first = left_key < right_key
+        else:
+            right_first = right_key < left_key
+
+        if right_first:
+            node = right
+            right = right.next
+        else:
+            node = left
+            left = left.next
+
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+
+    rest = left if left is not None else right
+    if rest is not None:
+        if tail is None:
+            head = rest
+        else:
+            tail.next = rest
+        while rest.next is not None:
+            rest = rest.next
+        tail = rest
+        # The leftover run is already sorted, link it and find its end
+
+    return head, tail
+
+
 def remove(self, index):
     # remove() deletes the node at a given index in the linked list
     # It returns:
@@ -548,7 +1420,7 @@ def remove(self, index):
 
     previous_node = self.get(index - 1)  
     # Get the node just BEFORE the one we want to remove
-    # Time: O(n), Space: O(1)
+    # Time: O(n), Space: O(1)  (O(log n) with a position index)
 
     temp_node = previous_node.next  
     # Store the node to be removed
@@ -564,6 +1436,20 @@ def remove(self, index):
     # Prevents accidental memory access
     # Time: O(1), Space: O(1)
 
+    if self.position_index is not None:
+        self.position_index.removed(index)
+        # Keep the skip list index in sync
+        # Time: O(log n), Space: O(1) expected
+
+    if self.value_index is not None:
+        self.value_index.removed(temp_node, index)
+        # Keep the value index in sync
+        # Time: O(1), Space: O(1)
+
+    self._positions_shifted(index, -1)
+    # Nodes after index moved one position left
+    # Time: O(1), Space: O(1)
+
     self.length -= 1  
     # Decrease size of linked list because one node is removed
     # Time: O(1), Space: O(1)
@@ -579,21 +1465,25 @@ def remove(self, index):
 
     
 
-# Adding nodes to the linked list
-new = Linkedlist()
-new.append(103)
-new.append(20)
-new.append(20)
-new.append(134)
-print(new)
-print(new.pop())
-print(new)
-# new.prepend(1)
-# print(new.insert(3,17))
-# print(new)
-# print(new.search(19990))
-# Printing the value stored in the last node
-# print(new.tail.value)
-# in the end for whole the space and time complexity is O(1) and O(1)
+if __name__ == "__main__":
+    # Demo only runs with: python -m link_list.singly_llinked_list.insertion_in_ssl
+    # Importing this module builds and prints nothing
+
+    # Adding nodes to the linked list
+    new = Linkedlist()
+    new.append(103)
+    new.append(20)
+    new.append(20)
+    new.append(134)
+    print(new)
+    print(new.pop())
+    print(new)
+    # new.prepend(1)
+    # print(new.insert(3,17))
+    # print(new)
+    # print(new.search(19990))
+    # Printing the value stored in the last node
+    # print(new.tail.value)
+    # in the end for whole the space and time complexity is O(1) and O(1)
 
 
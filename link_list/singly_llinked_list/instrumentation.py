@@ -0,0 +1,249 @@
+'''Opt-in instrumentation for Linkedlist and CSLinked_List.
+
+For every method call it records:
+
+calls        → how many times the method was called
+hops         → how many steps from a node to its next node were taken
+               (reading node.next several times in a row counts once)
+allocations  → how many new nodes were created
+latency      → total time and a histogram of call times
+
+Nothing is measured (and nothing costs extra) until instrument() is called:
+
+instrument(linked_list)
+    1. linked_list.__class__ is swapped to a subclass whose methods are
+       wrapped with timing code (the original class is NOT changed)
+    2. every node of the list is swapped to a node subclass whose `next`
+       is a property that counts steps
+    3. linked_list._node_class is set on THIS list only, so the nodes it
+       creates are counting nodes too; other lists (and other threads)
+       keep allocating plain nodes
+
+uninstrument(linked_list) undoes all three, so the list runs the original
+code again at full speed. Lists made from an instrumented list
+(slices, from_iterable, filter ...) are plain lists of the original class.
+
+Usage:
+
+    with instrumented(linked_list) as recorder:
+        ... use linked_list ...
+    print(recorder.stats())
+
+Only the OUTERMOST call is recorded: when insert() calls get() inside,
+the hops of get() are counted for insert().
+The counters are shared module globals, so measure one thread at a time.'''
+
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+
+
+COUNTERS = [0, 0]
+# COUNTERS[0] → hops, COUNTERS[1] → nodes created
+# Wrappers take the difference before / after a call
+
+LAST_NODE = [None]
+# Node whose next was read last; reading it again is not a new hop
+
+EXTRA_METHODS = ("__getitem__", "__contains__", "__str__", "__repr__")
+# Dunder methods that walk the list and are worth measuring
+
+_counting_classes = {}
+_instrumented_classes = {}
+
+
+def _counting_node_class(node_class):
+    # _counting_node_class() returns a subclass of node_class that counts
+    # every read of node.next and every new node
+    # Classes are made once per node class and then reused
+
+    counting_class = _counting_classes.get(node_class)
+    if counting_class is not None:
+        return counting_class
+
+    def get_next(node):
+        if node is not LAST_NODE[0]:
+            COUNTERS[0] += 1
+            LAST_NODE[0] = node
+            # `if node.next is None: ... node = node.next` reads next twice
+            # for one step, only the first read counts
+        return node.__dict__["next"]
+
+    def set_next(node, value):
+        node.__dict__["next"] = value
+
+    def __init__(node, value):
+        COUNTERS[1] += 1
+        node_class.__init__(node, value)
+
+    counting_class = type("Counting" + node_class.__name__, (node_class,), {
+        "next": property(get_next, set_next),
+        "__init__": __init__,
+    })
+    # property is a data descriptor, so it wins over the "next"
+    # stored in the node's __dict__
+    _counting_classes[node_class] = counting_class
+    return counting_class
+
+
+class Recorder:
+    # Recorder keeps the numbers of ONE instrumented list
+
+    def __init__(self, linked_list):
+        self.original_class = type(linked_list)
+        self.node_class = self.original_class._node_class
+        self.counting_class = _counting_node_class(self.node_class)
+        self.depth = 0
+        self.methods = {}
+
+    def record(self, name, elapsed_ns, hops, allocations):
+        # record() adds one finished call to the numbers of method name
+        entry = self.methods.get(name)
+        if entry is None:
+            entry = self.methods[name] = {
+                "calls": 0, "hops": 0, "allocations": 0,
+                "total_ns": 0, "max_ns": 0, "histogram": {},
+            }
+        entry["calls"] += 1
+        entry["hops"] += hops
+        entry["allocations"] += allocations
+        entry["total_ns"] += elapsed_ns
+        if elapsed_ns > entry["max_ns"]:
+            entry["max_ns"] = elapsed_ns
+
+        bucket = 1 << elapsed_ns.bit_length()
+        # Power of two buckets: bucket b counts calls with b/2 <= ns < b
+        entry["histogram"][bucket] = entry["histogram"].get(bucket, 0) + 1
+
+    def stats(self):
+        # stats() returns a snapshot (a copy) of the numbers per method
+        # histogram maps bucket upper bound in ns → number of calls
+        snapshot = {}
+        for name, entry in self.methods.items():
+            copy = dict(entry)
+            copy["histogram"] = dict(sorted(entry["histogram"].items()))
+            copy["mean_ns"] = entry["total_ns"] / entry["calls"]
+            snapshot[name] = copy
+        return snapshot
+
+    def reset(self):
+        # reset() forgets everything recorded so far
+        self.methods = {}
+
+
+def _wrap(name, method):
+    # _wrap() returns method with timing and counting around it
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        recorder = self.__dict__.get("_recorder")
+        if recorder is None or recorder.depth:
+            return method(self, *args, **kwargs)
+            # Nested call (the outer call is already measuring)
+
+        recorder.depth = 1
+        LAST_NODE[0] = None
+        hops = COUNTERS[0]
+        allocations = COUNTERS[1]
+        start = time.perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            LAST_NODE[0] = None
+            # Do not keep the node alive after the call
+            recorder.depth = 0
+            recorder.record(name, elapsed, COUNTERS[0] - hops, COUNTERS[1] - allocations)
+
+    return wrapper
+
+
+def _instrumented_class(cls):
+    # _instrumented_class() builds (once) the subclass of cls with every
+    # public method and EXTRA_METHODS wrapped
+
+    instrumented_class = _instrumented_classes.get(cls)
+    if instrumented_class is not None:
+        return instrumented_class
+
+    namespace = {"stats": lambda self: self._recorder.stats()}
+    # linked_list.stats() works while the list is instrumented
+    for name in dir(cls):
+        if name.startswith("_") and name not in EXTRA_METHODS:
+            continue
+        attribute = inspect.getattr_static(cls, name)
+        if isinstance(attribute, classmethod):
+            namespace[name] = getattr(cls, name)
+            # Bound to the ORIGINAL class: type(self).from_iterable(...)
+            # inside a method makes a plain list, not an instrumented one
+            continue
+        if isinstance(attribute, (staticmethod, property)) or not callable(attribute):
+            continue
+        namespace[name] = _wrap(name, attribute)
+
+    instrumented_class = type("Instrumented" + cls.__name__, (cls,), namespace)
+    _instrumented_classes[cls] = instrumented_class
+    return instrumented_class
+
+
+def _nodes(linked_list):
+    # _nodes() yields every node once (works for circular lists too)
+    temp_node = linked_list.head
+    while temp_node is not None:
+        yield temp_node
+        temp_node = temp_node.next
+        if temp_node is linked_list.head:
+            break
+
+
+def instrument(linked_list):
+    # instrument() switches a list to instrumented mode
+    # It returns the Recorder (also available as linked_list.stats())
+    # Time: O(n) once (every node is swapped), Space: O(1)
+
+    recorder = getattr(linked_list, "_recorder", None)
+    if recorder is not None:
+        return recorder
+        # Already instrumented
+
+    recorder = Recorder(linked_list)
+    for node in _nodes(linked_list):
+        if type(node) is recorder.node_class:
+            node.__class__ = recorder.counting_class
+    linked_list._recorder = recorder
+    linked_list._node_class = recorder.counting_class
+    # Only this list creates counting nodes
+    linked_list.__class__ = _instrumented_class(recorder.original_class)
+    return recorder
+
+
+def uninstrument(linked_list):
+    # uninstrument() switches a list back to the original class
+    # It returns the Recorder with everything recorded so far
+    # Time: O(n) (every node is swapped back), Space: O(1)
+
+    recorder = linked_list.__dict__.pop("_recorder", None)
+    if recorder is None:
+        return None
+    linked_list.__class__ = recorder.original_class
+    del linked_list._node_class
+    # Back to the class attribute, plain nodes again
+    for node in _nodes(linked_list):
+        if type(node) is recorder.counting_class:
+            node.__class__ = recorder.node_class
+    return recorder
+
+
+@contextmanager
+def instrumented(linked_list):
+    # instrumented() measures a list only inside a with block
+    # Example:
+    #   with instrumented(linked_list) as recorder:
+    #       linked_list.get(5)
+    #   print(recorder.stats()["get"]["hops"])
+    recorder = instrument(linked_list)
+    try:
+        yield recorder
+    finally:
+        uninstrument(linked_list)
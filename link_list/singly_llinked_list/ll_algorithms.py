@@ -0,0 +1,207 @@
+'''Two-pointer algorithms on singly linked lists.
+
+Every function here walks the chain ONCE and keeps only two node
+references, O(1) extra space.
+
+middle and nth_from_end need to know where the list ends. That is the
+node after tail: None for a Linkedlist, head for a CSLinked_List (the
+first free node in ring-buffer mode). So they work for both, as long as
+the list is intact.
+
+has_cycle and cycle_start only follow head and node.next, so they also
+work on a chain that is broken by a bug (a Linkedlist whose last node
+points back into the list).
+
+middle       slow moves 1 node, fast moves 2; when fast reaches the
+             end, slow is in the middle
+nth_from_end lead starts k nodes ahead; when lead reaches the end,
+             the trailing pointer is k nodes from the end
+has_cycle    Floyd: slow moves 1, fast moves 2; in a cycle fast catches
+             up with slow, without a cycle fast reaches None
+cycle_start  after they meet, a pointer from head and one from the
+             meeting point, both moving 1, meet at the first node of
+             the cycle
+
+benchmark() compares them with the naive versions (count the length
+first, or remember every visited node in a set).'''
+
+
+def _end(linked_list):
+    # _end() returns the "node" right after the last one:
+    # None for a Linkedlist, head for a circular list
+    return linked_list.tail.next
+    # Time: O(1), Space: O(1)
+
+
+def middle(linked_list):
+    # middle() returns the middle node (the second of two for an even length)
+    # It returns:
+    #   Node object → if the list is not empty
+    #   None        → if the list is empty
+    # Time: O(n), Space: O(1)
+
+    if linked_list.length == 0:
+        return None
+
+    end = _end(linked_list)
+    slow = fast = linked_list.head
+    while True:
+        after = fast.next
+        if after is end:
+            return slow
+            # Odd length: fast is on the last node
+        slow = slow.next
+        if after.next is end:
+            return slow
+            # Even length: slow is on the second of the two middle nodes
+        fast = after.next
+    # head can itself be the end marker of a circle, so the checks look
+    # one node ahead of fast instead of comparing fast with end
+
+
+def nth_from_end(linked_list, k):
+    # nth_from_end() returns the k-th node from the end (k = 1 → last node)
+    # It returns:
+    #   Node object → if 1 <= k <= number of nodes
+    #   None        → otherwise
+    # Time: O(n), Space: O(1)
+
+    if k < 1 or linked_list.length == 0:
+        return None
+
+    end = _end(linked_list)
+    lead = linked_list.head
+    for _ in range(k - 1):
+        if lead.next is end:
+            return None
+            # Fewer than k nodes
+        lead = lead.next
+    # lead is k - 1 nodes ahead of head
+
+    trail = linked_list.head
+    while lead.next is not end:
+        lead = lead.next
+        trail = trail.next
+    return trail
+    # lead is on the last node, so trail is k - 1 nodes before it
+
+
+def _meeting_node(head):
+    # _meeting_node() runs Floyd's slow / fast walk from head
+    # It returns the node where they meet, or None if there is no cycle
+    slow = fast = head
+    while fast is not None and fast.next is not None:
+        slow = slow.next
+        fast = fast.next.next
+        if slow is fast:
+            return slow
+    return None
+
+
+def has_cycle(linked_list):
+    # has_cycle() returns True if following next from head never ends
+    # (always True for a non-empty CSLinked_List)
+    # Time: O(n), Space: O(1)
+    return _meeting_node(linked_list.head) is not None
+
+
+def cycle_start(linked_list):
+    # cycle_start() returns the first node that is part of the cycle
+    # It returns:
+    #   Node object → if there is a cycle (head for a CSLinked_List)
+    #   None        → if the chain ends with None
+    # Time: O(n), Space: O(1)
+
+    meeting = _meeting_node(linked_list.head)
+    if meeting is None:
+        return None
+
+    temp_node = linked_list.head
+    while temp_node is not meeting:
+        temp_node = temp_node.next
+        meeting = meeting.next
+    return temp_node
+    # head → start is a steps, start → meeting is b steps, the cycle has
+    # c nodes; fast went twice as far as slow, so a + b is a multiple of
+    # c, and a more steps from the meeting point land on the start
+
+
+def _naive_middle(linked_list):
+    # Two walks: count, then walk half way
+    count = 0
+    temp_node = linked_list.head
+    while temp_node is not None:
+        count += 1
+        temp_node = temp_node.next
+    temp_node = linked_list.head
+    for _ in range(count // 2):
+        temp_node = temp_node.next
+    return temp_node
+
+
+def _naive_nth_from_end(linked_list, k):
+    # Two walks: count, then walk to count - k
+    count = 0
+    temp_node = linked_list.head
+    while temp_node is not None:
+        count += 1
+        temp_node = temp_node.next
+    if k < 1 or k > count:
+        return None
+    temp_node = linked_list.head
+    for _ in range(count - k):
+        temp_node = temp_node.next
+    return temp_node
+
+
+def _naive_cycle_start(linked_list):
+    # One walk, but remembers every node: O(n) extra space
+    seen = set()
+    temp_node = linked_list.head
+    while temp_node is not None:
+        if id(temp_node) in seen:
+            return temp_node
+        seen.add(id(temp_node))
+        temp_node = temp_node.next
+    return None
+
+
+def _naive_reverse(linked_list):
+    # Copy the values out and build a new reversed list
+    return type(linked_list).from_iterable(reversed(list(linked_list)))
+
+
+def benchmark(size=1_000_000):
+    # benchmark() times each algorithm against its naive version
+
+    import time
+    from .insertion_in_ssl import Linkedlist
+
+    linked_list = Linkedlist.from_iterable(range(size))
+
+    def timed(function):
+        start = time.perf_counter()
+        result = function()
+        return time.perf_counter() - start, result
+
+    cases = [
+        ("middle", lambda: middle(linked_list), lambda: _naive_middle(linked_list)),
+        ("nth_from_end", lambda: nth_from_end(linked_list, 10), lambda: _naive_nth_from_end(linked_list, 10)),
+        ("cycle_start", lambda: cycle_start(linked_list), lambda: _naive_cycle_start(linked_list)),
+        ("reverse", linked_list.reverse, lambda: _naive_reverse(linked_list)),
+    ]
+
+    print(f"{size} nodes")
+    print(f"{'algorithm':<16}{'two-pointer s':>15}{'naive s':>10}")
+    for name, fast, naive in cases:
+        fast_time, fast_result = timed(fast)
+        naive_time, naive_result = timed(naive)
+        if name != "reverse":
+            assert fast_result is naive_result
+        print(f"{name:<16}{fast_time:>15.3f}{naive_time:>10.3f}")
+
+
+if __name__ == "__main__":
+    # Run with: python -m link_list.singly_llinked_list.ll_algorithms
+    import sys
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,184 @@
+'''Memory accounting for Linkedlist.
+
+memory_usage() answers "what does this list cost?":
+
+nodes           number of nodes
+bytes_per_node  what ONE node object really takes on the heap
+                (object header, attribute storage, GC header), measured
+                once per node class with tracemalloc
+node_bytes      nodes * bytes_per_node
+value_bytes     sys.getsizeof of every DIFFERENT object reachable from
+                the values (deep=True): list / tuple / set / frozenset /
+                dict items and instance attributes are followed too
+                objects shared by many nodes or containers (small ints,
+                interned strings, the same object appended twice) count once
+total_bytes     node_bytes + value_bytes
+
+sys.getsizeof(node) alone is not enough: it leaves out the GC header and,
+on newer Pythons, the attribute values stored next to the object. Asking
+for node.__dict__ would even create a dict that was not there before.
+
+With traced=True the report also lists the source lines that allocated
+the most memory. That needs tracemalloc to be running BEFORE the list is
+built (tracemalloc.start() or python -X tracemalloc).'''
+
+import sys
+
+
+SAMPLE = 1_000
+# Nodes allocated to measure bytes_per_node
+
+_node_sizes = {}
+# node class → measured bytes per node (measured once, then reused)
+
+
+def node_size(node_class):
+    # node_size() returns the heap bytes of one node_class(None) object
+    # Time: O(SAMPLE) the first time per class, then O(1)
+
+    size = _node_sizes.get(node_class)
+    if size is not None:
+        return size
+
+    import tracemalloc
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sample = [node_class(None) for _ in range(SAMPLE)]
+    after = tracemalloc.get_traced_memory()[0]
+    if started:
+        tracemalloc.stop()
+
+    size = (after - before - sys.getsizeof(sample)) // SAMPLE
+    # The list holding the sample is not part of a node
+    _node_sizes[node_class] = size
+    return size
+
+
+def _deep_size(value, seen):
+    # _deep_size() returns the bytes of value and everything it contains
+    # that is not in seen yet (seen holds ids and is updated)
+    # Uses a stack instead of recursion, so deeply nested values can not
+    # hit the recursion limit
+    # Time: O(objects reached), Space: O(objects reached)
+
+    total = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        # id() is only unique while the object lives; every object here is
+        # kept alive by a node or by its container, so ids can not repeat
+
+        if isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif type(current).__module__ != "builtins" and hasattr(current, "__dict__"):
+            stack.append(vars(current))
+            # Attributes of an instance of a user class
+            # (classes, modules and functions are shared, not followed)
+    return total
+
+
+def memory_usage(linked_list, deep=True, traced=False, limit=10):
+    # memory_usage() returns a dict with the numbers described above
+    # deep=False skips the values (value_bytes is 0)
+    # traced=True adds "traced": the `limit` source lines that allocated
+    # the most memory that is still alive, as (file:line, bytes) pairs
+    # Time: O(n + d), Space: O(d) for d different objects in the values
+
+    nodes = 0
+    node_classes = {}
+    value_bytes = 0
+    seen = set()
+
+    temp_node = linked_list.head
+    while temp_node is not None:
+        nodes += 1
+        node_class = type(temp_node)
+        node_classes[node_class] = node_classes.get(node_class, 0) + 1
+
+        if deep:
+            value_bytes += _deep_size(temp_node.value, seen)
+
+        temp_node = temp_node.next
+        if temp_node is linked_list.head:
+            break
+            # Circular list: back at head
+
+    node_bytes = sum(node_size(node_class) * count for node_class, count in node_classes.items())
+
+    usage = {
+        "nodes": nodes,
+        "bytes_per_node": node_bytes / nodes if nodes else 0,
+        "node_bytes": node_bytes,
+        "value_bytes": value_bytes,
+        "total_bytes": node_bytes + value_bytes,
+    }
+
+    if traced:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("traced=True needs tracemalloc running before the list is built "
+                               "(tracemalloc.start() or python -X tracemalloc)")
+        statistics = tracemalloc.take_snapshot().statistics("lineno")
+        usage["traced"] = [(str(stat.traceback[0]), stat.size) for stat in statistics[:limit]]
+
+    return usage
+
+
+def _walk_time(linked_list, repeat=3):
+    # _walk_time() returns the best time of a plain next-pointer walk
+    import time
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        temp_node = linked_list.head
+        while temp_node is not None:
+            temp_node = temp_node.next
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(size=1_000_000, seed=0):
+    # benchmark() churns a list, then compares traversal time before and
+    # after compact()
+    #
+    # Churn: random values are appended (nodes sit in the heap in list
+    # order), then sort() relinks the nodes in value order. The nodes
+    # stay where they were, so after sorting the walk jumps around the
+    # heap in random order, like a list after hours of insert / remove
+
+    import random
+    from .insertion_in_ssl import Linkedlist
+
+    rng = random.Random(seed)
+    linked_list = Linkedlist.from_iterable(rng.random() for _ in range(size))
+    fresh = _walk_time(linked_list)
+
+    linked_list.sort()
+    churned = _walk_time(linked_list)
+
+    linked_list.compact()
+    compacted = _walk_time(linked_list)
+
+    usage = memory_usage(linked_list)
+    print(f"{size} nodes, {usage['bytes_per_node']:.0f} bytes per node, "
+          f"{usage['total_bytes'] / 1e6:.1f} MB with values")
+    print(f"{'walk':<16}{'seconds':>10}")
+    print(f"{'fresh':<16}{fresh:>10.3f}")
+    print(f"{'churned':<16}{churned:>10.3f}")
+    print(f"{'compacted':<16}{compacted:>10.3f}")
+
+
+if __name__ == "__main__":
+    # Run with: python -m link_list.singly_llinked_list.ll_memory
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,129 @@
+'''NumPy helpers for Linkedlist.
+
+Every helper does the same three steps:
+
+1. gather  → walk the nodes ONCE and copy the values into a NumPy array
+2. compute → let NumPy do the math in C (sum, max, x * 2, x > 0 ...)
+3. scatter → if values changed, walk the nodes ONCE more and write them back
+
+That is two walks in total, instead of one get() / set_value() walk
+per element.
+
+NumPy is optional. Linkedlist works without it; only these helpers
+raise ImportError when NumPy is not installed.'''
+
+from itertools import compress
+
+np = None
+# NumPy is imported on the first call of a helper, not when this module
+# is imported: importing NumPy takes a noticeable time and most users of
+# Linkedlist never need it
+
+
+def _require_numpy():
+    # _require_numpy() imports NumPy once, or raises a clear error if it is missing
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("NumPy is required for this Linkedlist method (pip install numpy)") from None
+        np = numpy
+
+
+def to_numpy(linked_list, dtype=None):
+    # to_numpy() returns a 1-D array with every value in order
+    # dtype=None lets NumPy choose the type from the values
+    # Time: O(n), Space: O(n)
+
+    _require_numpy()
+    if dtype is None:
+        return np.array(list(linked_list))
+        # NumPy can only guess the dtype after seeing all values
+    return np.fromiter(linked_list, dtype=dtype, count=linked_list.length)
+    # fromiter fills a preallocated array straight from the walk
+
+
+def from_numpy(cls, array):
+    # from_numpy() builds a new linked list from a 1-D array
+    # Values become plain Python numbers (int, float ...)
+    # Time: O(n), Space: O(n)
+
+    _require_numpy()
+    array = np.asarray(array)
+    if array.ndim != 1:
+        raise ValueError(f"expected a 1-D array, got {array.ndim} dimensions")
+    return cls.from_iterable(array.tolist())
+    # tolist() converts all elements in C, faster than one at a time
+
+
+def scatter(linked_list, values):
+    # scatter() writes values back into the existing nodes in one walk
+    # values must have exactly linked_list.length items
+    # Time: O(n), Space: O(1)
+
+    if len(values) != linked_list.length:
+        raise ValueError(f"expected {linked_list.length} values, got {len(values)}")
+
+    temp_node = linked_list.head
+    for value in values:
+        temp_node.value = value
+        temp_node = temp_node.next
+
+    if linked_list.value_index is not None:
+        linked_list.value_index.rebuild()
+        # Every value may have changed, rebuild once instead of per node
+
+
+def map_inplace(linked_list, function, dtype=None):
+    # map_inplace() replaces every value with function(array)[i]
+    # function gets the whole array, e.g. lambda x: x * 2 + 1
+    # Time: O(n), Space: O(n)
+
+    _require_numpy()
+    result = np.asarray(function(to_numpy(linked_list, dtype)))
+    scatter(linked_list, result.tolist())
+
+
+def filter_values(linked_list, predicate, dtype=None):
+    # filter_values() returns a NEW list with the values where
+    # predicate(array) is True, e.g. lambda x: x > 0
+    # The original Python objects are kept (no NumPy scalars)
+    # Time: O(n), Space: O(n)
+
+    _require_numpy()
+    mask = np.asarray(predicate(to_numpy(linked_list, dtype)), dtype=bool)
+    if mask.shape != (linked_list.length,):
+        raise ValueError("predicate must return one bool per value")
+    return type(linked_list).from_iterable(compress(linked_list, mask.tolist()))
+
+
+def _python_scalar(value):
+    # NumPy scalars (np.int64 ...) become normal Python numbers
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def reduce(linked_list, function, dtype=None):
+    # reduce() combines all values with a NumPy ufunc or array function
+    # Examples: reduce(np.add) → sum, reduce(np.maximum) → max,
+    #           reduce(np.mean) → average
+    # Time: O(n), Space: O(n)
+
+    _require_numpy()
+    array = to_numpy(linked_list, dtype)
+    if isinstance(function, np.ufunc):
+        return _python_scalar(function.reduce(array))
+    return _python_scalar(function(array))
+
+
+def argmax(linked_list, dtype=None):
+    # argmax() returns the position of the largest value
+    # It returns:
+    #   index (0-based) → first position of the maximum
+    #   -1             → if the list is empty
+    # Time: O(n), Space: O(n)
+
+    _require_numpy()
+    if linked_list.length == 0:
+        return -1
+    return int(np.argmax(to_numpy(linked_list, dtype)))
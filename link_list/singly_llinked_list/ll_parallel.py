@@ -0,0 +1,178 @@
+'''Parallel map / reduce helpers for Linkedlist.
+
+A walk over the nodes runs on one core. For CPU-heavy per-element work
+these helpers spread the work over several processes:
+
+1. split  → walk the nodes ONCE, cut the chain into contiguous segments
+            of chunk_size values (the sizes follow from length) and
+            remember the first node of every segment
+2. work   → send each segment's values to a ProcessPoolExecutor
+3. write  → results come back in segment order; each segment is written
+            back starting at its remembered first node, so no segment
+            walks from head again
+
+function must be picklable (a module-level def, not a lambda), because
+it is sent to the worker processes. Starting processes and pickling
+values costs time too, so this only pays off when function is
+expensive compared to that.'''
+
+from functools import reduce
+
+
+def _map_segment(function, values):
+    # Runs in a worker: apply function to every value of one segment
+    return [function(value) for value in values]
+
+
+def _reduce_segment(function, values):
+    # Runs in a worker: combine the values of one segment (never empty)
+    return reduce(function, values)
+
+
+def _chunk_size(length, workers, chunk_size):
+    # _chunk_size() picks the segment size
+    # Default: 4 segments per worker, so a slow segment does not leave
+    # the other workers idle at the end
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return chunk_size
+    return max(1, -(-length // (4 * workers)))
+    # -(-a // b) is a / b rounded up
+
+
+def segments(linked_list, chunk_size):
+    # segments() cuts the list into contiguous pieces in one walk
+    # It returns a list of (first node, values) pairs in list order
+    # Time: O(n), Space: O(n)
+
+    pieces = []
+    temp_node = linked_list.head
+    remaining = linked_list.length
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        first = temp_node
+        values = []
+        for _ in range(size):
+            values.append(temp_node.value)
+            temp_node = temp_node.next
+        pieces.append((first, values))
+        remaining -= size
+    return pieces
+
+
+def _run(linked_list, task, function, workers, chunk_size, executor):
+    # _run() splits the list and yields (first node, result) per segment,
+    # in list order, using the given executor or a new one
+    from concurrent.futures import ProcessPoolExecutor
+    # Imported on first use, most Linkedlist users never need it
+
+    if workers is None:
+        import os
+        workers = os.cpu_count() or 1
+        # With an executor, workers only decides the default chunk_size
+
+    pieces = segments(linked_list, _chunk_size(linked_list.length, workers, chunk_size))
+    firsts = [first for first, _ in pieces]
+    chunks = [values for _, values in pieces]
+    functions = [function] * len(chunks)
+
+    if executor is not None:
+        yield from zip(firsts, executor.map(task, functions, chunks))
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        yield from zip(firsts, pool.map(task, functions, chunks))
+        # map() returns results in submission order, i.e. list order
+
+
+def parallel_map(linked_list, function, workers=None, chunk_size=None, executor=None):
+    # parallel_map() replaces every value with function(value), in place
+    # workers    → number of processes (default: all cores)
+    # chunk_size → values per segment (default: length / (4 * workers))
+    # executor   → reuse an existing ProcessPoolExecutor instead of
+    #              starting a new one for this call
+    # Time: O(n) walks + O(n / workers) function calls per process
+
+    for temp_node, results in _run(linked_list, _map_segment, function, workers, chunk_size, executor):
+        for value in results:
+            temp_node.value = value
+            temp_node = temp_node.next
+        # Write one segment starting at its own first node
+
+    if linked_list.value_index is not None:
+        linked_list.value_index.rebuild()
+        # Every value may have changed, rebuild once instead of per node
+
+
+def parallel_reduce(linked_list, function, initial, workers=None, chunk_size=None, executor=None):
+    # parallel_reduce() combines all values with function, like
+    # functools.reduce(function, linked_list, initial)
+    # Each segment is reduced in a worker, then the partial results are
+    # combined in list order, so function must be associative
+    # (a + b, max, min, ...) for the result to match the serial reduce
+    # It returns initial for an empty list
+
+    partials = [partial for _, partial in _run(linked_list, _reduce_segment, function, workers, chunk_size, executor)]
+    return reduce(function, partials, initial)
+    # Time: O(n) walk + O(n / workers) function calls per process
+
+
+def _busy(value):
+    # CPU-heavy example function used by benchmark()
+    total = value
+    for step in range(2_000):
+        total = (total * 31 + step) % 1_000_003
+    return total
+
+
+def _add(left, right):
+    return left + right
+
+
+def benchmark(size=20_000, max_workers=None):
+    # benchmark() runs parallel_map(_busy) with 1, 2, 4, ... workers up
+    # to max_workers (default: all cores) and prints the speedup over a
+    # plain serial loop
+
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from .insertion_in_ssl import Linkedlist
+
+    max_workers = max_workers or os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+
+    linked_list = Linkedlist.from_iterable(range(size))
+    start = time.perf_counter()
+    temp_node = linked_list.head
+    while temp_node is not None:
+        temp_node.value = _busy(temp_node.value)
+        temp_node = temp_node.next
+    serial = time.perf_counter() - start
+    expected = list(linked_list)
+
+    print(f"{size} values, {os.cpu_count()} cores")
+    print(f"{'workers':<10}{'map s':>10}{'speedup':>10}")
+    print(f"{'serial':<10}{serial:>10.3f}{1.0:>10.2f}")
+    for workers in counts:
+        linked_list = Linkedlist.from_iterable(range(size))
+        with ProcessPoolExecutor(workers) as pool:
+            pool.submit(abs, 0).result()
+            # Start the processes before timing
+            start = time.perf_counter()
+            parallel_map(linked_list, _busy, executor=pool)
+            elapsed = time.perf_counter() - start
+            assert list(linked_list) == expected
+            assert parallel_reduce(linked_list, _add, 0, executor=pool) == sum(expected)
+        print(f"{workers:<10}{elapsed:>10.3f}{serial / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    # Run with: python -m link_list.singly_llinked_list.ll_parallel
+    import sys
+    benchmark(*(int(arg) for arg in sys.argv[1:3]))
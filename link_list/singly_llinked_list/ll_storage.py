@@ -0,0 +1,280 @@
+'''Binary file format for saving and loading Linkedlist values.
+
+File layout (all numbers little-endian):
+
+header  (16 bytes)
+    4 bytes  magic   b"LLST"
+    1 byte   version 1
+    1 byte   kind    0 → int64 values, 1 → float64 values, 2 → any objects
+    2 bytes  zero (reserved)
+    8 bytes  count   number of values
+
+payload
+    kind 0 / 1 → count * 8 bytes, the raw numbers one after another
+    kind 2     → for every value: 4 byte size + that many bytes of pickle
+
+Numeric payloads have a fixed size per value, so value i sits at byte
+16 + 8 * i. open_mapped() maps the file with mmap and reads a value only
+when it is asked for: the operating system loads just the pages we touch,
+so even files larger than RAM open instantly.
+
+NOTE: kind 2 uses pickle, only load files that you wrote yourself.'''
+
+import mmap
+import os
+import pickle
+import struct
+import sys
+from array import array
+
+
+MAGIC = b"LLST"
+VERSION = 1
+
+KIND_INT = 0
+KIND_FLOAT = 1
+KIND_OBJECT = 2
+
+TYPECODES = {KIND_INT: "q", KIND_FLOAT: "d"}
+# array / memoryview typecode for each numeric kind (8 bytes each)
+
+HEADER = struct.Struct("<4sBBxxQ")
+# magic, version, kind, 2 padding bytes, count → 16 bytes
+SIZE = struct.Struct("<I")
+# size prefix of one pickled value
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _kind_of(values):
+    # _kind_of() picks the most compact kind that can hold every value
+    # bool is a subclass of int, but it must come back as bool → objects
+    # Time: O(n), Space: O(1)
+
+    kind = None
+    for value in values:
+        if type(value) is int and INT64_MIN <= value <= INT64_MAX:
+            this = KIND_INT
+        elif type(value) is float:
+            this = KIND_FLOAT
+        else:
+            return KIND_OBJECT
+        if kind is None:
+            kind = this
+        elif kind != this:
+            return KIND_OBJECT
+            # ints and floats mixed → keep the exact types
+    return KIND_INT if kind is None else kind
+
+
+def save(linked_list, path):
+    # save() writes every value of linked_list to path
+    # Time: O(n), Space: O(1) extra for objects, O(chunk) for numbers
+
+    kind = _kind_of(linked_list)
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, kind, linked_list.length))
+
+        if kind == KIND_OBJECT:
+            for value in linked_list:
+                data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                file.write(SIZE.pack(len(data)))
+                file.write(data)
+            return
+
+        chunk = array(TYPECODES[kind])
+        for value in linked_list:
+            chunk.append(value)
+            if len(chunk) == 65536:
+                _write_numbers(file, chunk)
+                chunk = array(TYPECODES[kind])
+        _write_numbers(file, chunk)
+        # Numbers are written in blocks of 64k, the whole list is never copied
+
+
+def _write_numbers(file, chunk):
+    # _write_numbers() writes one array block in little-endian order
+    if not LITTLE_ENDIAN:
+        chunk.byteswap()
+    chunk.tofile(file)
+
+
+def _read_header(data, path):
+    # _read_header() checks the 16 byte header and returns (kind, count)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: file is too short to be a saved linked list")
+    magic, version, kind, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a saved linked list (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"{path}: unsupported format version {version}")
+    if kind not in (KIND_INT, KIND_FLOAT, KIND_OBJECT):
+        raise ValueError(f"{path}: unknown value kind {kind}")
+    return kind, count
+
+
+def _check_size(kind, count, file_size, path):
+    # _check_size() raises ValueError if the file is too short for count values
+    # Objects need at least their 4 byte size prefixes, the rest is
+    # checked record by record when the offsets are read
+    record = SIZE.size if kind == KIND_OBJECT else 8
+    needed = HEADER.size + record * count
+    if file_size < needed:
+        raise ValueError(f"{path}: file is truncated ({file_size} bytes, "
+                         f"{count} values need at least {needed})")
+
+
+def _truncated(path, index):
+    return ValueError(f"{path}: file is truncated (record {index} does not fit)")
+
+
+class MappedList:
+    # MappedList is a READ-ONLY list view over a saved file
+    # Numbers are read straight from the mapped file, nothing is copied
+    # For objects only the position of every record is remembered, each
+    # value is unpickled when it is read
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.kind, self.length = _read_header(file.read(HEADER.size), path)
+            file_size = os.fstat(file.fileno()).st_size
+            _check_size(self.kind, self.length, file_size, path)
+            # Checked before mapping, so an empty or cut-off file gives a
+            # clear error (mmap can not map an empty file at all)
+
+            self.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            # The mapping stays valid after the file is closed
+            # Time: O(1), Space: O(1) (pages are loaded on demand)
+
+        self.buffer = memoryview(self.mapping)
+
+        if self.kind == KIND_OBJECT:
+            self.values = None
+            try:
+                self.offsets = self._read_offsets(file_size, path)
+            except ValueError:
+                self.close()
+                raise
+
+        elif LITTLE_ENDIAN:
+            self.values = self.buffer[HEADER.size:HEADER.size + 8 * self.length].cast(TYPECODES[self.kind])
+            # Zero-copy: values[i] reads 8 bytes from the mapped file
+            # Time: O(1), Space: O(1)
+
+        else:
+            self.values = array(TYPECODES[self.kind])
+            self.values.frombytes(self.buffer[HEADER.size:HEADER.size + 8 * self.length])
+            self.values.byteswap()
+            # Big-endian machine: the numbers must be converted, so copy them
+            # Time: O(n), Space: O(n)
+
+    def _read_offsets(self, file_size, path):
+        # _read_offsets() returns the start of every object record
+        # Only the 4 byte size prefixes are read, not the values
+        # Time: O(n), Space: O(n) (8 bytes per value)
+
+        offsets = array("q")
+        position = HEADER.size
+        for index in range(self.length):
+            if position + SIZE.size > file_size:
+                raise _truncated(path, index)
+            (size,) = SIZE.unpack_from(self.mapping, position)
+            offsets.append(position)
+            position += SIZE.size + size
+            if position > file_size:
+                raise _truncated(path, index)
+        return offsets
+
+    def _object_at(self, index):
+        # _object_at() unpickles the value of record index
+        start = self.offsets[index] + SIZE.size
+        (size,) = SIZE.unpack_from(self.mapping, self.offsets[index])
+        return pickle.loads(self.buffer[start:start + size])
+        # Time: O(size of value), Space: O(size of value)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        # __iter__() yields every value in order
+        if self.values is not None:
+            yield from self.values
+            return
+        for index in range(self.length):
+            yield self._object_at(index)
+        # Time: O(n), Space: O(1)
+
+    def __getitem__(self, index):
+        # __getitem__() returns the value at index (negative counts from the end)
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("MappedList index out of range")
+        if self.values is not None:
+            return self.values[index]
+        return self._object_at(index)
+        # Time: O(1), Space: O(1)
+
+    def get(self, index):
+        # get() returns the VALUE at index, like ArrayLinkedlist.get
+        # It returns:
+        #   value → if index is valid
+        #   None  → if index is invalid
+        if index == -1:
+            index = self.length - 1
+        if index < 0 or index >= self.length:
+            return None
+        return self[index]
+        # Time: O(1), Space: O(1)
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+        for index, current in enumerate(self):
+            if current == value:
+                return index
+        return -1
+        # Time: O(n), Space: O(1)
+
+    def to_linkedlist(self, cls=None):
+        # to_linkedlist() copies the values into a normal (editable) Linkedlist
+        if cls is None:
+            from .insertion_in_ssl import Linkedlist as cls
+        return cls.from_iterable(self)
+        # Time: O(n), Space: O(n)
+
+    def close(self):
+        # close() unmaps the file; the view cannot be used afterwards
+        if self.kind != KIND_OBJECT and LITTLE_ENDIAN:
+            self.values.release()
+        self.values = None
+        self.buffer.release()
+        self.mapping.close()
+        # memoryviews must be released before the mapping can close
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_mapped(path):
+    # open_mapped() opens a saved file lazily (see MappedList)
+    return MappedList(path)
+
+
+def load(path, cls):
+    # load() reads a saved file into a new linked list of class cls
+    # Values go from the mapped file straight into nodes,
+    # there is no temporary Python list of all values
+    # Time: O(n), Space: O(n) for the nodes only
+
+    with MappedList(path) as mapped:
+        return cls.from_iterable(mapped)
@@ -0,0 +1,117 @@
+'''Lazy views over a Linkedlist.
+
+    linked_list.view(1000, 11000).filter(is_even).map(square)
+
+builds NO new list. Every call only returns a small ListView object that
+remembers the base list, the start / stop positions and the steps to
+apply. The nodes are walked when the view is iterated, and all steps run
+in that ONE walk: each value goes through filter → map → ... before the
+walk moves to the next node.
+
+materialize() copies the result into a new Linkedlist when a real list
+is needed.
+
+A view reads the base list every time it is iterated, so it sees later
+changes to the list (like a dict view, not like a copy).
+
+map / filter here take a function of ONE value. Linkedlist.map_inplace
+and Linkedlist.filter are the eager NumPy versions: their function gets
+the whole array at once and they change or copy the list right away.'''
+
+
+MAP = 0
+FILTER = 1
+# kinds of steps in ListView.steps
+
+
+class ListView:
+    # ListView is a lazy, read-only window on a linked list
+    # map() / filter() return NEW views, the old view is unchanged
+
+    def __init__(self, base, start=0, stop=None, steps=()):
+        self.base = base        # the linked list that is read
+        self.start = start      # first position, like a slice start
+        self.stop = stop        # end position (exclusive), None → to the end
+        self.steps = steps      # tuple of (MAP / FILTER, function)
+
+    def map(self, function):
+        # map() returns a view whose values are function(value)
+        return ListView(self.base, self.start, self.stop, self.steps + ((MAP, function),))
+        # Time: O(1), Space: O(1)
+
+    def filter(self, predicate):
+        # filter() returns a view with only the values where predicate is true
+        # predicate is called with ONE value at a time, when the view is
+        # iterated (Linkedlist.filter is the eager NumPy version:
+        # it calls predicate once on the whole array and builds a new list)
+        return ListView(self.base, self.start, self.stop, self.steps + ((FILTER, predicate),))
+        # Time: O(1), Space: O(1)
+
+    def _bounds(self):
+        # _bounds() turns start / stop into positions for the current length
+        # (negative values count from the end, like a slice)
+        start, stop, _ = slice(self.start, self.stop).indices(self.base.length)
+        return start, stop
+
+    def _raw(self):
+        # _raw() yields the base values between start and stop
+        start, stop = self._bounds()
+        if start >= stop:
+            return
+
+        temp_node = self.base.get(start) if start else self.base.head
+        # get() uses the position index / checkpoints when they are enabled
+        for _ in range(stop - start):
+            yield temp_node.value
+            temp_node = temp_node.next
+        # Time: O(start) to reach start (less with an index), O(k) after
+
+    def __iter__(self):
+        # __iter__() walks the window once and applies every step per value
+
+        steps = self.steps
+        if not steps:
+            yield from self._raw()
+            return
+
+        for value in self._raw():
+            for kind, function in steps:
+                if kind == MAP:
+                    value = function(value)
+                elif not function(value):
+                    break
+            else:
+                yield value
+                # Only values that passed every filter get here
+        # Time: O(k * number of steps), Space: O(1)
+
+    def search(self, value):
+        # search() finds the position of value among the values of the view
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the view
+        for index, current in enumerate(self):
+            if current == value:
+                return index
+        return -1
+        # Stops at the first match, later steps are never computed
+        # Time: O(k), Space: O(1)
+
+    def __contains__(self, value):
+        return self.search(value) != -1
+
+    def materialize(self, cls=None):
+        # materialize() copies the values of the view into a new list
+        # cls defaults to the class of the base list
+        if cls is None:
+            cls = type(self.base)
+        return cls.from_iterable(self)
+        # Time: O(k), Space: O(k)
+
+    def __repr__(self):
+        bounds = f"{self.start}" if self.stop is None else f"{self.start}, {self.stop}"
+        names = "".join(
+            f".{'map' if kind == MAP else 'filter'}({getattr(function, '__name__', '?')})"
+            for kind, function in self.steps
+        )
+        return f"{type(self.base).__name__}.view({bounds}){names}"
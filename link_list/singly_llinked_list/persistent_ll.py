@@ -0,0 +1,264 @@
+'''Persistent (immutable) singly linked list with structural sharing.
+
+A PersistentList never changes. Every "update" returns a NEW list and the
+old one stays valid, so a snapshot is just another reference to the same
+object: O(1) time and O(1) memory.
+
+New versions reuse as many nodes of the old version as they can:
+
+old:              a -> b -> c -> d
+prepend(x):  x -> a -> b -> c -> d        (1 new node, a..d shared)
+rest():           b -> c -> d             (0 new nodes)
+set(1, y):        a'-> y -> c -> d        (copies a, c..d shared)
+
+Nodes are frozen, so sharing them between versions (and threads) is safe.
+Only the part in front of a changed position is ever copied.'''
+
+
+class PersistentNode:
+    # One immutable node, value and next can not be changed after creation
+    __slots__ = ("value", "next")
+    # __slots__ removes the per-object __dict__, shared nodes stay small
+
+    def __init__(self, value, next=None):
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "next", next)
+        # Normal assignment is blocked by __setattr__ below
+        # Time: O(1), Space: O(1)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PersistentNode is immutable")
+
+    def __reduce__(self):
+        # __reduce__() lets copy / deepcopy / pickle rebuild the node
+        # (the default way would set the slots with the blocked __setattr__)
+        # The chain from this node on is saved as a flat list of values,
+        # so a long chain does not hit the recursion limit of pickle
+        values = []
+        temp_node = self
+        while temp_node is not None:
+            values.append(temp_node.value)
+            temp_node = temp_node.next
+        return (_chain, (values,))
+        # Time: O(n), Space: O(n)
+
+
+def _chain(values):
+    # _chain() builds nodes for values and returns the first one
+    # (None for no values)
+    head = None
+    for value in reversed(values):
+        head = PersistentNode(value, head)
+    return head
+    # Build from the back, every new node points at the one built before
+    # Time: O(n), Space: O(n)
+
+
+REPR_LIMIT = 10
+# repr() shows at most this many values, so repr of a huge list stays short
+
+
+class PersistentList:
+    # PersistentList is an immutable linked list
+    # Every method that "changes" it returns a new PersistentList
+
+    __slots__ = ("head", "length")
+
+    def __init__(self, values=()):
+        # PersistentList(values) builds a list with the given values in order
+
+        values = list(values)
+        object.__setattr__(self, "head", _chain(values))
+        object.__setattr__(self, "length", len(values))
+
+    @classmethod
+    def _make(cls, head, length):
+        # _make() wraps an existing chain without copying it
+        new_list = object.__new__(cls)
+        object.__setattr__(new_list, "head", head)
+        object.__setattr__(new_list, "length", length)
+        return new_list
+        # Time: O(1), Space: O(1)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PersistentList is immutable")
+
+    def __reduce__(self):
+        # __reduce__() lets deepcopy / pickle rebuild the list from its values
+        return (PersistentList, (list(self),))
+        # Time: O(n), Space: O(n)
+
+    def __copy__(self):
+        # An immutable list can be shared, like copy.copy of a tuple
+        return self
+
+    def __str__(self):
+        return "->".join(map(str, self))
+        # Time: O(n), Space: O(n)
+
+    def __repr__(self):
+        # __repr__() shows at most REPR_LIMIT values
+        shown = []
+        for value in self:
+            if len(shown) == REPR_LIMIT:
+                break
+            shown.append(repr(value))
+
+        if self.length > REPR_LIMIT:
+            shown.append("...")
+            return f"PersistentList([{', '.join(shown)}], length={self.length})"
+        return f"PersistentList([{', '.join(shown)}])"
+
+    def __len__(self):
+        return self.length
+        # Time: O(1), Space: O(1)
+
+    def __iter__(self):
+        temp_node = self.head
+        while temp_node is not None:
+            yield temp_node.value
+            temp_node = temp_node.next
+        # Time: O(n), Space: O(1)
+
+    def __eq__(self, other):
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        if self.length != other.length:
+            return False
+
+        left = self.head
+        right = other.head
+        while left is not right:
+            if left.value != right.value:
+                return False
+            left = left.next
+            right = right.next
+        return True
+        # Stops early at the first shared node, the rest is the same
+        # Time: O(n) at most, Space: O(1)
+
+    __hash__ = None
+    # Values may be unhashable, so the list is not hashable either
+
+    def _node_at(self, index):
+        # _node_at() returns the node at index (0 <= index < length)
+        temp_node = self.head
+        for _ in range(index):
+            temp_node = temp_node.next
+        return temp_node
+        # Time: O(n), Space: O(1)
+
+    def _check_index(self, index, allow_end=False):
+        # _check_index() turns a negative index into a positive one and
+        # raises IndexError like a Python list for a bad index
+
+        limit = self.length + 1 if allow_end else self.length
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= limit:
+            raise IndexError("PersistentList index out of range")
+        return index
+
+    def __getitem__(self, index):
+        # __getitem__() allows persistent_list[i] (negative counts from the end)
+        return self._node_at(self._check_index(index)).value
+        # Time: O(n), Space: O(1)
+
+    def _rebuild(self, index, replace):
+        # _rebuild() copies the first `index` nodes in front of a new chain
+        # replace(node at index) returns the chain that should follow
+        # position index - 1 (the node is None when index == length)
+        # Prefix and node at index are found in ONE walk
+        # Everything after the copied part is shared with this list
+        # Time: O(index), Space: O(index)
+
+        prefix = []
+        temp_node = self.head
+        for _ in range(index):
+            prefix.append(temp_node.value)
+            temp_node = temp_node.next
+
+        head = replace(temp_node)
+        for value in reversed(prefix):
+            head = PersistentNode(value, head)
+        return head
+
+    def prepend(self, value):
+        # prepend() returns a new list with value in front
+        # The whole old list is shared
+        return PersistentList._make(PersistentNode(value, self.head), self.length + 1)
+        # Time: O(1), Space: O(1)
+
+    def first(self):
+        # first() returns the first value
+        # It returns:
+        #   value → if the list is not empty
+        #   None  → if the list is empty
+        return None if self.head is None else self.head.value
+        # Time: O(1), Space: O(1)
+
+    def rest(self):
+        # rest() returns the list without its first value
+        # No node is copied, the new list starts at the second node
+        if self.head is None:
+            return self
+        return PersistentList._make(self.head.next, self.length - 1)
+        # Time: O(1), Space: O(1)
+
+    def pop_first(self):
+        # pop_first() returns (first value, rest of the list)
+        # It returns:
+        #   (value, PersistentList) → if the list is not empty
+        #   (None, same list)       → if the list is empty
+        return self.first(), self.rest()
+        # Time: O(1), Space: O(1)
+
+    def set_value(self, index, value):
+        # set_value() returns a new list where position index holds value
+        # Only the nodes up to index are copied, the suffix is shared
+
+        index = self._check_index(index)
+        head = self._rebuild(index, lambda node: PersistentNode(value, node.next))
+        return PersistentList._make(head, self.length)
+        # Time: O(index), Space: O(index)
+
+    def insert(self, index, value):
+        # insert() returns a new list with value at position index
+        # index == length adds at the end (then the whole list is copied)
+
+        index = self._check_index(index, allow_end=True)
+        head = self._rebuild(index, lambda node: PersistentNode(value, node))
+        return PersistentList._make(head, self.length + 1)
+        # Time: O(index), Space: O(index)
+
+    def remove(self, index):
+        # remove() returns a new list without position index
+
+        index = self._check_index(index)
+        head = self._rebuild(index, lambda node: node.next)
+        return PersistentList._make(head, self.length - 1)
+        # Time: O(index), Space: O(index)
+
+    def append(self, value):
+        # append() returns a new list with value at the end
+        # Nothing can be shared in front of the end, so every node is copied
+        return self.insert(self.length, value)
+        # Time: O(n), Space: O(n)
+
+    def thaw(self, cls=None):
+        # thaw() copies the values into a new mutable linked list
+        # cls defaults to Linkedlist
+
+        if cls is None:
+            from .insertion_in_ssl import Linkedlist as cls
+            # Imported here so this module does not load Linkedlist
+            # (and NumPy helpers) unless thaw() is used
+        return cls.from_iterable(self)
+        # Time: O(n), Space: O(n)
+
+
+def freeze(linked_list):
+    # freeze() builds a PersistentList with the values of any linked list
+    # (anything that can be iterated in order)
+    return PersistentList(linked_list)
+    # Time: O(n), Space: O(n)
@@ -0,0 +1,431 @@
+'''Singly linked list stored in multiprocessing shared memory.
+
+Same idea as ArrayLinkedlist (slot indices instead of Node objects), but
+the columns live in ONE shared memory block that other processes can map:
+
+header  (64 bytes)
+    4 bytes  magic    b"LLSM"
+    1 byte   version  1
+    1 byte   typecode of the value column, b"q" (int64) or b"d" (float64)
+    2 bytes  zero (reserved)
+    8 bytes  capacity
+    8 bytes  each: length, head, tail, free slot, write counter
+    rest     zero (reserved)
+next    capacity * 8 bytes, next[slot] = index of the next slot (-1 = None)
+values  capacity * 8 bytes, values[slot] = raw int64 / float64
+
+The parent creates the list, a child attaches by name and reads the
+same memory: nothing is pickled or copied. Pickling a SharedLinkedlist
+(for example as an argument of a ProcessPoolExecutor task) only sends
+its name.
+
+Consistency rule: ONE writer, any number of readers.
+    - Only the process that created the list may change it.
+    - append / extend write the new slot completely before linking it,
+      and write length last. A reader walking the list during an append
+      sees either the old or the new list, never a broken one.
+    - Every other change (prepend, set_value, pop_first) can be seen half
+      done. The write counter is odd while any write is in progress and
+      goes up by 2 for every finished write. snapshot() uses it to retry
+      until it got a copy no write overlapped with; other readers should
+      only run while the writer is idle (for example behind an Event).
+
+The capacity is fixed when the block is created, shared memory can not
+grow in place.'''
+
+import struct
+from multiprocessing import shared_memory
+
+
+MAGIC = b"LLSM"
+VERSION = 1
+
+PREFIX = struct.Struct("<4sBcxxq")
+# magic, version, typecode, 2 padding bytes, capacity → 16 bytes
+HEADER_SIZE = 64
+# prefix + the changing int64 fields, rounded up to a cache line
+
+LENGTH, HEAD, TAIL, FREE, WRITES = range(5)
+# positions of the changing int64 fields in meta
+
+NO_SLOT = -1
+# Marker used instead of None inside the next column
+
+
+def _open(name=None, size=0):
+    # _open() creates (size > 0) or attaches to (size == 0) a block
+    # Python 3.13+ can attach without registering the block with the
+    # resource tracker; older versions share the creator's tracker when
+    # the reader was started by multiprocessing, which is the same thing
+    if size:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedLinkedlist:
+    # SharedLinkedlist has the read API of ArrayLinkedlist / MappedList
+    # (get / search / iteration return VALUES) plus a few writer methods
+    # Use create() in the writer and attach() in the readers
+
+    def __init__(self, memory, owner):
+        # Not called directly, see create() / attach()
+
+        magic, version, typecode, capacity = PREFIX.unpack_from(memory.buf)
+        if magic != MAGIC or version != VERSION:
+            memory.close()
+            raise ValueError(f"{memory.name}: not a shared linked list")
+
+        self.memory = memory
+        self.owner = owner
+        self.typecode = typecode.decode()
+        self.capacity = capacity
+        # Both are fixed for the lifetime of the block
+
+        self.meta = memory.buf[PREFIX.size:HEADER_SIZE].cast("q")
+        values_start = HEADER_SIZE + 8 * capacity
+        self.next_slot = memory.buf[HEADER_SIZE:values_start].cast("q")
+        self.values = memory.buf[values_start:values_start + 8 * capacity].cast(self.typecode)
+        # Zero-copy views into the shared block
+        # Time: O(1), Space: O(1)
+
+    @classmethod
+    def create(cls, capacity, typecode="q", name=None):
+        # create() makes a new empty list with room for capacity values
+        # The calling process becomes the (only) writer
+
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if typecode not in ("q", "d"):
+            raise ValueError("typecode must be 'q' (int64) or 'd' (float64)")
+
+        memory = _open(name, HEADER_SIZE + 16 * capacity)
+        PREFIX.pack_into(memory.buf, 0, MAGIC, VERSION, typecode.encode(), capacity)
+        shared_list = cls(memory, owner=True)
+
+        meta = shared_list.meta
+        meta[LENGTH] = 0
+        meta[HEAD] = NO_SLOT
+        meta[TAIL] = NO_SLOT
+        meta[WRITES] = 0
+
+        next_slot = shared_list.next_slot
+        for slot in range(capacity - 1):
+            next_slot[slot] = slot + 1
+        next_slot[capacity - 1] = NO_SLOT
+        meta[FREE] = 0
+        # Every slot starts on the free list
+        # Time: O(capacity), Space: O(1)
+
+        return shared_list
+
+    @classmethod
+    def attach(cls, name):
+        # attach() maps an existing list by name (read-only by the rule above)
+        return cls(_open(name), owner=False)
+        # Time: O(1), Space: O(1)
+
+    @classmethod
+    def from_iterable(cls, iterable, capacity=None, typecode="q", name=None):
+        # from_iterable() creates a shared list holding the given values
+        # capacity defaults to exactly the number of values
+        # It raises ValueError (and frees the new block) when the values
+        # do not fit into capacity
+        values = list(iterable) if capacity is None else iterable
+        shared_list = cls.create(capacity or max(1, len(values)), typecode, name)
+        try:
+            shared_list.extend(values)
+        except BaseException:
+            shared_list.close()
+            shared_list.memory.unlink()
+            raise
+            # Nobody else knows the block yet, so free it right away
+            # instead of leaving it in /dev/shm until the process exits
+        return shared_list
+        # Time: O(n), Space: O(n)
+
+    def __reduce__(self):
+        # pickle sends only the name, the receiver attaches as a reader
+        return (type(self).attach, (self.memory.name,))
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    @property
+    def length(self):
+        return self.meta[LENGTH]
+
+    @property
+    def writes(self):
+        # writes → write counter, odd while a write is in progress
+        return self.meta[WRITES]
+
+    def __len__(self):
+        return self.meta[LENGTH]
+
+    def __str__(self):
+        return "->".join(map(str, self))
+        # Time: O(n), Space: O(n)
+
+    # ---------- writer ----------
+
+    def _check_writer(self):
+        if not self.owner:
+            raise PermissionError("only the process that created the list may change it")
+
+    def _new_slot(self, value):
+        # _new_slot() takes a slot from the free list and fills it
+        # It raises ValueError when every slot is in use
+        meta = self.meta
+        slot = meta[FREE]
+        if slot == NO_SLOT:
+            raise ValueError(f"shared linked list is full (capacity {self.capacity})")
+        self.values[slot] = value
+        # Written first: a value of the wrong type raises TypeError here,
+        # before the slot is taken off the free list
+        meta[FREE] = self.next_slot[slot]
+        self.next_slot[slot] = NO_SLOT
+        return slot
+        # Time: O(1), Space: O(1)
+
+    def append(self, value):
+        # append() adds a value at the end (safe for concurrent readers)
+        self._check_writer()
+        slot = self._new_slot(value)
+        # The slot is complete before anybody can reach it
+        # (the free list is private to the writer, readers never follow it)
+
+        meta = self.meta
+        meta[WRITES] += 1
+        if meta[HEAD] == NO_SLOT:
+            meta[HEAD] = slot
+        else:
+            self.next_slot[meta[TAIL]] = slot
+        meta[TAIL] = slot
+        meta[LENGTH] += 1
+        # length is published last
+
+        meta[WRITES] += 1
+        # Time: O(1), Space: O(1)
+
+    def extend(self, values):
+        # extend() appends every value of an iterable
+        for value in values:
+            self.append(value)
+        # Time: O(k), Space: O(1)
+
+    def prepend(self, value):
+        # prepend() adds a value at the beginning
+        self._check_writer()
+        slot = self._new_slot(value)
+
+        meta = self.meta
+        meta[WRITES] += 1
+        self.next_slot[slot] = meta[HEAD]
+        if meta[HEAD] == NO_SLOT:
+            meta[TAIL] = slot
+        meta[HEAD] = slot
+        meta[LENGTH] += 1
+
+        meta[WRITES] += 1
+        # Time: O(1), Space: O(1)
+
+    def set_value(self, index, value):
+        # set_value() updates the value at a given index
+        # It returns:
+        #   True  → if update is successful
+        #   False → if index is invalid
+        self._check_writer()
+        slot = self._slot_at(index)
+        if slot == NO_SLOT:
+            return False
+
+        meta = self.meta
+        meta[WRITES] += 1
+        self.values[slot] = value
+        meta[WRITES] += 1
+        return True
+        # Time: O(n), Space: O(1)
+
+    def pop_first(self):
+        # pop_first() removes the first element and returns its value
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if the list is empty
+        self._check_writer()
+        meta = self.meta
+        slot = meta[HEAD]
+        if slot == NO_SLOT:
+            return None
+
+        meta[WRITES] += 1
+        value = self.values[slot]
+        meta[HEAD] = self.next_slot[slot]
+        if meta[HEAD] == NO_SLOT:
+            meta[TAIL] = NO_SLOT
+        meta[LENGTH] -= 1
+        self.next_slot[slot] = meta[FREE]
+        meta[FREE] = slot
+        # The slot goes back on the free list for the next append
+        meta[WRITES] += 1
+        return value
+        # Time: O(1), Space: O(1)
+
+    # ---------- readers ----------
+
+    def _slot_at(self, index):
+        # _slot_at() returns the slot of index (-1 counts from the end)
+        # or NO_SLOT if index is invalid
+        meta = self.meta
+        if index == -1:
+            return meta[TAIL]
+        if index < 0 or index >= meta[LENGTH]:
+            return NO_SLOT
+        slot = meta[HEAD]
+        next_slot = self.next_slot
+        for _ in range(index):
+            slot = next_slot[slot]
+        return slot
+        # Time: O(n), Space: O(1)
+
+    def __iter__(self):
+        # __iter__() yields every value in order
+        # At most `capacity` steps, so even a reader that races with a
+        # slot being reused can not loop forever
+        values = self.values
+        next_slot = self.next_slot
+        slot = self.meta[HEAD]
+        for _ in range(self.capacity):
+            if slot == NO_SLOT:
+                return
+            yield values[slot]
+            slot = next_slot[slot]
+        # Time: O(n), Space: O(1)
+
+    def get(self, index):
+        # get() returns the VALUE at index, like ArrayLinkedlist.get
+        # It returns:
+        #   value → if index is valid
+        #   None  → if index is invalid
+        slot = self._slot_at(index)
+        return None if slot == NO_SLOT else self.values[slot]
+        # Time: O(n), Space: O(1)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("SharedLinkedlist index out of range")
+        return self.values[self._slot_at(index)]
+        # Time: O(n), Space: O(1)
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+        for index, current in enumerate(self):
+            if current == value:
+                return index
+        return -1
+        # Time: O(n), Space: O(1)
+
+    def snapshot(self):
+        # snapshot() returns all values as a Python list that no write
+        # overlapped with (retries while the writer is busy)
+        meta = self.meta
+        while True:
+            before = meta[WRITES]
+            if before % 2:
+                continue
+            values = list(self)
+            if meta[WRITES] == before:
+                return values
+        # Time: O(n) per attempt, Space: O(n)
+
+    def to_linkedlist(self, cls=None):
+        # to_linkedlist() copies the values into a normal Linkedlist
+        if cls is None:
+            from .insertion_in_ssl import Linkedlist as cls
+        return cls.from_iterable(self.snapshot())
+        # Time: O(n), Space: O(n)
+
+    # ---------- lifetime ----------
+
+    def close(self):
+        # close() unmaps the block in this process
+        # The views must be released before the mapping can close
+        # Calling it again does nothing
+        if self.meta is None:
+            return
+        self.meta.release()
+        self.next_slot.release()
+        self.values.release()
+        self.meta = self.next_slot = self.values = None
+        self.memory.close()
+
+    def __del__(self):
+        # A reader that was unpickled in a worker is usually never closed
+        # explicitly; without this SharedMemory.__del__ would fail on the
+        # views that are still open
+        if getattr(self, "meta", None) is not None:
+            self.close()
+
+    def unlink(self):
+        # unlink() frees the block for good (writer only, after readers closed)
+        self._check_writer()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self.owner:
+            self.memory.unlink()
+
+
+def _sum_task(linked_list):
+    # Worker task of benchmark(): walk the list and add up the values
+    return sum(linked_list)
+
+
+def benchmark(size=200_000, tasks=8, workers=2):
+    # benchmark() sends the same list to `tasks` worker tasks twice:
+    #   1. as a Linkedlist   → pickled and unpickled for every task
+    #   2. as a SharedLinkedlist → only the name is pickled
+    # and prints the time per task and the bytes sent per task
+
+    import pickle
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from .insertion_in_ssl import Linkedlist
+
+    linked_list = Linkedlist.from_iterable(range(size))
+    shared_list = SharedLinkedlist.from_iterable(range(size))
+
+    try:
+        with ProcessPoolExecutor(workers) as pool:
+            pool.submit(sum, ()).result()
+            # Start the workers before timing
+
+            print(f"{size} int values, {tasks} tasks, {workers} workers")
+            print(f"{'sent as':<20}{'ms / task':>12}{'bytes / task':>14}")
+            for label, candidate in (("Linkedlist", linked_list), ("SharedLinkedlist", shared_list)):
+                start = time.perf_counter()
+                results = [pool.submit(_sum_task, candidate) for _ in range(tasks)]
+                assert all(future.result() == size * (size - 1) // 2 for future in results)
+                per_task = (time.perf_counter() - start) / tasks
+                sent = len(pickle.dumps(candidate))
+                print(f"{label:<20}{per_task * 1e3:>12.2f}{sent:>14}")
+    finally:
+        shared_list.close()
+        shared_list.unlink()
+
+
+if __name__ == "__main__":
+    # Run with: python -m link_list.singly_llinked_list.shared_ll
+    benchmark()
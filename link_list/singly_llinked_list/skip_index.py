@@ -0,0 +1,233 @@
+'''Indexable skip list used as a positional index for Linkedlist.
+
+The linked list itself is the bottom level (level 0). Nothing about it
+changes: head, tail and every node.next stay exactly as before.
+
+On top of it we keep a few "express lanes" made of IndexNode objects.
+
+level 2:  H ------------------------> c ----------------> ...
+level 1:  H --------> a ------------> c ------> d ------> ...
+level 0:  head -> . -> a -> . -> . -> c -> . -> d -> . -> ...   (the nodes)
+
+Every IndexNode points at one list node and stores span = how many
+positions we move forward when we follow its right link.
+
+To reach index i we start at the top lane, move right while the span does
+not jump past i, then drop one lane down. In the bottom lane only a few
+node.next steps are left.
+
+Each node gets an express lane with probability 1/4, the next lane with
+1/16 and so on. So the expected cost of get / insert / remove is O(log n)
+instead of O(n).'''
+
+import random
+# random decides how many lanes a new node joins
+# Time: O(1), Space: O(1)
+
+
+PROMOTE = 0.25
+# Probability that an IndexNode on one lane is also put on the lane above
+
+MAX_LEVEL = 32
+# 4**32 nodes is far more than memory can hold, so 32 lanes are enough
+
+
+class IndexNode:
+    # One stop of an express lane
+    __slots__ = ("node", "right", "down", "span")
+    # __slots__ removes the per-object __dict__, index nodes stay small
+
+    def __init__(self, node, right=None, down=None, span=0):
+        self.node = node      # list node this stop belongs to (None for the header)
+        self.right = right    # next stop on the same lane
+        self.down = down      # same stop one lane lower (None on lane 1)
+        self.span = span      # positions skipped by following right
+
+
+class SkipIndex:
+    # SkipIndex answers "which node is at position i?" in O(log n)
+    # Linkedlist tells it about every insertion and removal
+
+    def __init__(self, linked_list):
+        self.linked_list = linked_list
+        # Needed to start from head in the bottom lane
+        # Time: O(1), Space: O(1)
+
+        self.rebuild()
+
+    def _random_height(self):
+        # _random_height() returns on how many lanes a new node appears
+        # It returns 0 for most nodes (bottom level only)
+        height = 0
+        while height < MAX_LEVEL and random.random() < PROMOTE:
+            height += 1
+        return height
+
+    def rebuild(self):
+        # rebuild() throws away all lanes and builds them again
+        # from the current chain in ONE walk from head
+        # Time: O(n), Space: O(n)
+
+        self.heads = [IndexNode(None)]
+        # heads[0] is the header of lane 1, heads[-1] is the top lane
+        # The header sits at position -1 (before head)
+
+        last = [self.heads[0]]
+        last_position = [-1]
+        # Last stop added on every lane and its position
+
+        temp_node = self.linked_list.head
+        position = 0
+        while temp_node is not None:
+            height = self._random_height()
+            below = None
+            for level in range(height):
+                if level == len(self.heads):
+                    # First node that reaches this lane, add a header for it
+                    header = IndexNode(None, down=self.heads[-1])
+                    self.heads.append(header)
+                    last.append(header)
+                    last_position.append(-1)
+
+                stop = IndexNode(temp_node, down=below)
+                last[level].right = stop
+                last[level].span = position - last_position[level]
+                last[level] = stop
+                last_position[level] = position
+                below = stop
+
+            temp_node = temp_node.next
+            position += 1
+
+    def _path(self, index):
+        # _path() returns the last stop BEFORE index on every lane
+        # as (stop, position) pairs, lane 1 first
+        # Time: O(log n) expected, Space: O(log n)
+
+        path = []
+        current = self.heads[-1]
+        position = -1
+        while current is not None:
+            while current.right is not None and position + current.span < index:
+                position += current.span
+                current = current.right
+            path.append((current, position))
+            current = current.down
+        path.reverse()
+        return path
+
+    def node_at(self, index):
+        # node_at() returns the list node at index
+        # index must be between 0 and length - 1 (checked by the caller)
+        # Time: O(log n) expected, Space: O(1)
+
+        current = self.heads[-1]
+        position = -1
+        while True:
+            while current.right is not None and position + current.span <= index:
+                position += current.span
+                current = current.right
+                # Follow the express lane while we do not pass index
+
+            if current.down is None:
+                break
+            current = current.down
+            # Drop one lane lower
+
+        if position < 0:
+            temp_node = self.linked_list.head
+            position = 0
+            # No stop before index, finish the walk from head
+        else:
+            temp_node = current.node
+
+        for _ in range(index - position):
+            temp_node = temp_node.next
+            # Only a few steps are left on the bottom level
+        return temp_node
+
+    def inserted(self, index, node):
+        # inserted() is called after node was linked into the chain at index
+        # Every node that was at index or later moved one position right
+        # Time: O(log n) expected, Space: O(log n)
+
+        height = self._random_height()
+        while len(self.heads) < height:
+            self.heads.append(IndexNode(None, down=self.heads[-1]))
+            # New empty lane on top
+
+        below = None
+        for level, (before, position) in enumerate(self._path(index)):
+            if level < height:
+                # Node joins this lane right after the stop "before"
+                stop = IndexNode(node, before.right, below)
+                if before.right is not None:
+                    stop.span = position + before.span + 1 - index
+                    # Old right stop also moved one position right
+                before.right = stop
+                before.span = index - position
+                below = stop
+            elif before.right is not None:
+                before.span += 1
+                # Lane jumps over the new node, its span grows by one
+
+    def removed(self, index):
+        # removed() is called when the node at index leaves the chain
+        # Every node after it moves one position left
+        # Only the lanes are used here, so it does not matter
+        # whether the chain was already relinked or not
+        # Time: O(log n) expected, Space: O(log n)
+
+        for before, position in self._path(index):
+            right = before.right
+            if right is None:
+                continue
+
+            if position + before.span == index:
+                # The next stop belongs to the removed node, unlink it
+                if right.right is not None:
+                    before.span += right.span - 1
+                before.right = right.right
+            else:
+                before.span -= 1
+                # Lane jumps over the removed node, its span shrinks by one
+
+        while len(self.heads) > 1 and self.heads[-1].right is None:
+            self.heads.pop()
+            # Drop lanes that became empty
+
+
+def benchmark(sizes=(10**3, 10**4, 10**5, 10**6), operations=200):
+    # benchmark() times random get() and insert() calls
+    # on a plain Linkedlist (linear walk) and on one with a SkipIndex
+
+    import time
+    from .insertion_in_ssl import Linkedlist
+
+    print(f"{'size':>9}{'mode':>9}{'get us':>12}{'insert us':>12}")
+    for size in sizes:
+        for indexed in (False, True):
+            linked_list = Linkedlist()
+            for i in range(size):
+                linked_list.append(i)
+            if indexed:
+                linked_list.enable_position_index()
+
+            positions = [random.randrange(size) for _ in range(operations)]
+
+            start = time.perf_counter()
+            for index in positions:
+                linked_list.get(index)
+            get_time = (time.perf_counter() - start) / operations
+
+            start = time.perf_counter()
+            for index in positions:
+                linked_list.insert(index, -1)
+            insert_time = (time.perf_counter() - start) / operations
+
+            mode = "skip" if indexed else "linear"
+            print(f"{size:>9}{mode:>9}{get_time * 1e6:>12.1f}{insert_time * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -54,14 +54,17 @@ class LinkedList:
         self.length = 1
 
 
-# Creating a LinkedList object
-# This calls the __init__ function of LinkedList
-new_ll = LinkedList(17)
-
-# Accessing the value of the first node in the linked list
-# new_ll.head is the node object
-# .value is the data stored inside that node
-# print(new_ll.head.value)
+if __name__ == "__main__":
+    # Demo only runs with: python -m link_list.singly_llinked_list.sll_nodesnLL
+
+    # Creating a LinkedList object
+    # This calls the __init__ function of LinkedList
+    new_ll = LinkedList(17)
+
+    # Accessing the value of the first node in the linked list
+    # new_ll.head is the node object
+    # .value is the data stored inside that node
+    # print(new_ll.head.value)
 
 
 
@@ -1,2 +1,3 @@
-for i in range(1):
-    print(i)
\ No newline at end of file
+if __name__ == "__main__":
+    for i in range(1):
+        print(i)
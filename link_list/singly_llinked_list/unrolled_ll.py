@@ -0,0 +1,331 @@
+'''Unrolled linked list: a linked list of small arrays ("chunks").
+
+In Linkedlist every value has its own Node, so walking n values means
+n attribute loads and n pointer jumps.
+
+Here every node (Chunk) holds up to `capacity` values in a Python list:
+
+head → [10, 20, 30, 40] → [50, 60] → [70, 80, 90] → None
+
+Walking the list jumps once per CHUNK, and inside a chunk the values
+are read by fast C code (list iteration / list.index / ",".join).
+
+Insert into a full chunk → the chunk is split into two halves.
+
+Remove from a chunk that becomes less than half full → it borrows values
+from the next chunk, or merges with it when both fit in one chunk.
+
+So there are about n / (capacity / 2) .. n / capacity chunks instead of n nodes.'''
+
+
+class Chunk:
+    # Chunk is one node of the unrolled list
+    __slots__ = ("values", "next")
+    # __slots__ removes the per-object __dict__
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else []
+        # Up to capacity values stored next to each other
+        # Time: O(1), Space: O(1)
+
+        self.next = None
+        # Reference to the next chunk
+        # Time: O(1), Space: O(1)
+
+
+class UnrolledLinkedlist:
+    # UnrolledLinkedlist has the same public API as Linkedlist
+    # get / pop / pop_first / remove return VALUES (there is no Node per value)
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity  # max values per chunk    | Time: O(1), Space: O(1)
+        self.head = None          # first chunk             | Time: O(1), Space: O(1)
+        self.tail = None          # last chunk              | Time: O(1), Space: O(1)
+        self.length = 0           # number of VALUES        | Time: O(1), Space: O(1)
+
+    # for printing the linked list
+    def __str__(self):
+        parts = []
+        chunk = self.head
+        while chunk is not None:
+            parts.append("->".join(map(str, chunk.values)))
+            chunk = chunk.next
+        return "->".join(parts)
+        # One pointer jump per chunk, the values are joined in C
+        # Time: O(n), Space: O(n)
+
+    def _locate(self, index):
+        # _locate() finds the chunk holding position index
+        # It returns (chunk before it or None, chunk, offset inside chunk)
+        # index must be between 0 and length - 1
+        # Time: O(n / capacity), Space: O(1)
+
+        previous = None
+        chunk = self.head
+        while index >= len(chunk.values):
+            index -= len(chunk.values)
+            previous = chunk
+            chunk = chunk.next
+            # Skip a whole chunk with one subtraction
+        return previous, chunk, index
+
+    def _split(self, chunk):
+        # _split() moves the second half of a full chunk into a new chunk
+        # Time: O(capacity), Space: O(capacity)
+
+        half = len(chunk.values) // 2
+        new_chunk = Chunk(chunk.values[half:])
+        del chunk.values[half:]
+        new_chunk.next = chunk.next
+        chunk.next = new_chunk
+        if self.tail is chunk:
+            self.tail = new_chunk
+
+    def _unlink(self, previous, chunk):
+        # _unlink() removes an EMPTY chunk from the chain
+        # Time: O(1), Space: O(1)
+
+        if previous is None:
+            self.head = chunk.next
+        else:
+            previous.next = chunk.next
+        if self.tail is chunk:
+            self.tail = previous
+        chunk.next = None
+
+    def _rebalance(self, previous, chunk):
+        # _rebalance() fixes a chunk that became less than half full
+        # Time: O(capacity), Space: O(1)
+
+        if not chunk.values:
+            self._unlink(previous, chunk)
+            return
+
+        following = chunk.next
+        if following is None or len(chunk.values) >= self.capacity // 2:
+            return
+
+        if len(chunk.values) + len(following.values) <= self.capacity:
+            # Both fit in one chunk → merge the next chunk into this one
+            chunk.values.extend(following.values)
+            self._unlink(chunk, following)
+        else:
+            # Borrow values from the front of the next chunk
+            # The next chunk keeps at least half of capacity
+            borrow = self.capacity // 2 - len(chunk.values)
+            chunk.values.extend(following.values[:borrow])
+            del following.values[:borrow]
+
+    # for appending to the list
+    def append(self, value):
+        # append() adds a value at the end
+        # Time: O(1) amortized, Space: O(1)
+
+        if self.tail is None:
+            self.head = self.tail = Chunk([value])
+        elif len(self.tail.values) < self.capacity:
+            self.tail.values.append(value)
+            # Room left in the last chunk, no new node needed
+        else:
+            new_chunk = Chunk([value])
+            self.tail.next = new_chunk
+            self.tail = new_chunk
+        self.length += 1
+
+    # for prepending to the list
+    def prepend(self, value):
+        # prepend() adds a value at the beginning
+        # Time: O(capacity), Space: O(1)
+
+        if self.head is None:
+            self.head = self.tail = Chunk([value])
+        elif len(self.head.values) < self.capacity:
+            self.head.values.insert(0, value)
+            # Shifts at most capacity values, a small fixed cost
+        else:
+            new_chunk = Chunk([value])
+            new_chunk.next = self.head
+            self.head = new_chunk
+        self.length += 1
+
+    def insert(self, index, value):
+        # insert() adds a value at a given index
+        # It returns:
+        #   True  → if insertion is successful
+        #   False → if insertion fails (invalid index)
+
+        if index < 0 or index > self.length:
+            return False
+
+        if index == self.length:
+            self.append(value)
+            return True
+
+        _, chunk, offset = self._locate(index)
+        # Time: O(n / capacity), Space: O(1)
+
+        if len(chunk.values) >= self.capacity:
+            self._split(chunk)
+            if offset > len(chunk.values):
+                offset -= len(chunk.values)
+                chunk = chunk.next
+                # Position is now in the second half
+
+        chunk.values.insert(offset, value)
+        # Time: O(capacity), Space: O(1)
+
+        self.length += 1
+        return True
+
+    def traversal(self):
+        # traversal() prints all values from head to tail
+        chunk = self.head
+        while chunk is not None:
+            for value in chunk.values:
+                print(value)
+            chunk = chunk.next
+        # Time: O(n), Space: O(1)
+
+    def search(self, value):
+        # search() finds the position (index) of a given value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+
+        start = 0
+        chunk = self.head
+        while chunk is not None:
+            if value in chunk.values:
+                return start + chunk.values.index(value)
+                # The scan inside a chunk runs in C
+            start += len(chunk.values)
+            chunk = chunk.next
+        return -1
+        # Time: O(n), Space: O(1)
+
+    def get(self, index):
+        # get() returns the VALUE at a given index
+        # It returns:
+        #   value → if index is valid
+        #   None  → if index is invalid
+
+        if index == -1:
+            return self.tail.values[-1] if self.length else None
+
+        if index < 0 or index >= self.length:
+            return None
+
+        _, chunk, offset = self._locate(index)
+        return chunk.values[offset]
+        # Time: O(n / capacity), Space: O(1)
+
+    def set_value(self, index, value):
+        # set_value() updates the value at a given index
+        # It returns:
+        #   True  → if update is successful
+        #   False → if index is invalid
+
+        if index == -1 and self.length:
+            index = self.length - 1
+
+        if index < 0 or index >= self.length:
+            return False
+
+        _, chunk, offset = self._locate(index)
+        chunk.values[offset] = value
+        return True
+        # Time: O(n / capacity), Space: O(1)
+
+    def remove(self, index):
+        # remove() deletes the value at a given index
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if index is invalid or list is empty
+
+        if index == -1 and self.length:
+            index = self.length - 1
+
+        if index < 0 or index >= self.length:
+            return None
+
+        previous, chunk, offset = self._locate(index)
+        value = chunk.values.pop(offset)
+        self.length -= 1
+        self._rebalance(previous, chunk)
+        return value
+        # Time: O(n / capacity + capacity), Space: O(1)
+
+    def pop_first(self):
+        # pop_first() removes the first value and returns it
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if the list is empty
+
+        if self.length == 0:
+            return None
+        value = self.head.values.pop(0)
+        self.length -= 1
+        self._rebalance(None, self.head)
+        return value
+        # Time: O(capacity), Space: O(1)
+
+    def pop(self):
+        # pop() removes the last value and returns it
+        # It returns:
+        #   removed value → if deletion is successful
+        #   None          → if the list is empty
+
+        if self.length == 0:
+            return None
+
+        value = self.tail.values.pop()
+        self.length -= 1
+
+        if not self.tail.values:
+            # Last chunk is empty, walk the chunks to find the one before it
+            previous = None
+            chunk = self.head
+            while chunk is not self.tail:
+                previous = chunk
+                chunk = chunk.next
+            self._unlink(previous, chunk)
+            # Time: O(n / capacity), but only once every few pops
+        return value
+
+
+def benchmark(size=100_000, capacity=64):
+    # benchmark() compares the Node based Linkedlist with UnrolledLinkedlist
+    # for a full walk (str), a search for a missing value and middle inserts
+
+    import time
+    from .insertion_in_ssl import Linkedlist
+
+    def timed(function, repeat=1):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            function()
+        return (time.perf_counter() - start) / repeat
+
+    print(f"{size} elements, capacity {capacity}")
+    print(f"{'backend':<22}{'str ms':>10}{'search ms':>11}{'mid insert us':>15}{'nodes':>9}")
+    for name, linked_list in (("Node Linkedlist", Linkedlist()),
+                              ("UnrolledLinkedlist", UnrolledLinkedlist(capacity))):
+        for i in range(size):
+            linked_list.append(i)
+
+        str_time = timed(lambda: str(linked_list))
+        search_time = timed(lambda: linked_list.search(-1), 3)
+        insert_time = timed(lambda: linked_list.insert(linked_list.length // 2, -1), 20)
+
+        nodes = 0
+        node = linked_list.head
+        while node is not None:
+            nodes += 1
+            node = node.next
+
+        print(f"{name:<22}{str_time * 1e3:>10.1f}{search_time * 1e3:>11.2f}"
+              f"{insert_time * 1e6:>15.1f}{nodes:>9}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,158 @@
+'''Hash index from value to nodes, used by Linkedlist.search.
+
+Without it search() compares the value of every node from head: O(n).
+
+ValueIndex keeps a dictionary
+
+    value → list of nodes that currently hold this value
+
+so "is value in the list?" is one dictionary lookup: O(1).
+
+search() must still return the 0-based POSITION of the first match.
+Positions are cached in a second dictionary (node → position).
+
+append and pop at the tail do not move any other node,
+so the cache stays correct.
+
+prepend / insert / pop_first / remove shift the positions of the nodes
+after them, so the cache is only marked as stale. It is rebuilt in ONE
+walk the next time a position is asked for.
+
+So a loop of searches between two such changes pays O(n) once,
+and O(1) (times the number of duplicates) for every search.'''
+
+
+class ValueIndex:
+    # ValueIndex is told about every change by Linkedlist
+    # and answers search / contains / find_all without walking the list
+
+    def __init__(self, linked_list):
+        self.linked_list = linked_list
+        self.rebuild()
+
+    def rebuild(self):
+        # rebuild() fills both dictionaries from the current chain
+        # Time: O(n), Space: O(n)
+
+        self.nodes = {}
+        # value → list of nodes holding that value
+
+        self.unhashable = []
+        # nodes whose value cannot be a dictionary key (list, dict, set ...)
+        # while there are any, search falls back to the linear walk
+
+        self.positions = {}
+        # node → 0-based position (cache, valid only when stale is False)
+
+        temp_node = self.linked_list.head
+        position = 0
+        while temp_node is not None:
+            self._add(temp_node)
+            self.positions[temp_node] = position
+            temp_node = temp_node.next
+            position += 1
+        self.stale = False
+
+    def _refresh_positions(self):
+        # _refresh_positions() recomputes every position in one walk
+        # Time: O(n), Space: O(n)
+
+        positions = {}
+        temp_node = self.linked_list.head
+        position = 0
+        while temp_node is not None:
+            positions[temp_node] = position
+            temp_node = temp_node.next
+            position += 1
+        self.positions = positions
+        self.stale = False
+
+    def _add(self, node):
+        # _add() records node under its current value
+        try:
+            bucket = self.nodes.get(node.value)
+        except TypeError:
+            self.unhashable.append(node)
+            return
+        if bucket is None:
+            self.nodes[node.value] = [node]
+        else:
+            bucket.append(node)
+        # Time: O(1), Space: O(1)
+
+    def _discard(self, node, value):
+        # _discard() forgets that node was holding value
+        try:
+            bucket = self.nodes[value]
+        except TypeError:
+            self.unhashable.remove(node)
+            return
+        if len(bucket) == 1:
+            del self.nodes[value]
+        else:
+            bucket.remove(node)
+            # Only walks the duplicates of this one value
+        # Time: O(d), Space: O(1) where d = copies of value
+
+    @property
+    def usable(self):
+        # search can trust the index only if every value is hashable
+        return not self.unhashable
+
+    def inserted(self, node, index):
+        # inserted() is called after node was linked in at index
+        self._add(node)
+        if not self.stale:
+            if index == self.linked_list.length - 1:
+                self.positions[node] = index
+                # Appended at the tail, no other node moved
+            else:
+                self.stale = True
+                # Nodes after index moved one position right
+        # Time: O(1), Space: O(1)
+
+    def removed(self, node, index):
+        # removed() is called when node at index leaves the list
+        self._discard(node, node.value)
+        if not self.stale:
+            self.positions.pop(node, None)
+            if index != self.linked_list.length - 1:
+                self.stale = True
+                # Nodes after index moved one position left
+        # Time: O(d), Space: O(1)
+
+    def changed(self, node, old_value):
+        # changed() is called after set_value() replaced old_value
+        # The node did not move, so positions stay valid
+        self._discard(node, old_value)
+        self._add(node)
+        # Time: O(d), Space: O(1)
+
+    def contains(self, value):
+        # contains() returns True if at least one node holds value
+        return value in self.nodes
+        # Time: O(1), Space: O(1)
+
+    def find_all(self, value):
+        # find_all() returns the sorted positions of every node holding value
+        bucket = self.nodes.get(value)
+        if not bucket:
+            return []
+        if self.stale:
+            self._refresh_positions()
+        return sorted(self.positions[node] for node in bucket)
+        # Time: O(d log d), plus O(n) once after a shifting change
+
+    def search(self, value):
+        # search() returns the position of the FIRST node holding value
+        # It returns:
+        #   index (0-based) → if value is found
+        #   -1             → if value is not present in the list
+        bucket = self.nodes.get(value)
+        if not bucket:
+            return -1
+        if self.stale:
+            self._refresh_positions()
+        positions = self.positions
+        return min(positions[node] for node in bucket)
+        # Time: O(d), plus O(n) once after a shifting change
@@ -0,0 +1,117 @@
+import pytest
+
+from link_list import CSLinked_List, Linkedlist
+from link_list.singly_llinked_list.instrumentation import instrumented
+
+
+def _circular(values, capacity=None):
+    circular = CSLinked_List(capacity)
+    circular.extend(values)
+    return circular
+
+
+def _cyclic_chain(size, start):
+    # Linkedlist whose last node points back to the node at start
+    linked_list = Linkedlist.from_iterable(range(size))
+    linked_list.tail.next = linked_list.get(start)
+    return linked_list
+
+
+@pytest.mark.parametrize("size", range(12))
+def test_reverse(size):
+    linked_list = Linkedlist.from_iterable(range(size))
+    linked_list.reverse()
+    assert list(linked_list) == list(range(size))[::-1]
+    if size:
+        assert linked_list.tail.value == 0
+        assert linked_list.tail.next is None
+    linked_list.append("end")
+    assert list(linked_list)[-1] == "end"
+
+
+@pytest.mark.parametrize("size", range(12))
+@pytest.mark.parametrize("k", range(1, 6))
+def test_reverse_groups(size, k):
+    linked_list = Linkedlist.from_iterable(range(size))
+    linked_list.reverse_groups(k)
+
+    values = list(range(size))
+    full = size // k * k
+    expected = []
+    for start in range(0, full, k):
+        expected.extend(reversed(values[start:start + k]))
+    expected.extend(values[full:])
+
+    assert list(linked_list) == expected
+    if size:
+        assert linked_list.tail.value == expected[-1]
+        assert linked_list.tail.next is None
+
+
+def test_reverse_groups_rejects_zero():
+    with pytest.raises(ValueError):
+        Linkedlist.from_iterable(range(3)).reverse_groups(0)
+
+
+@pytest.mark.parametrize("size", range(10))
+@pytest.mark.parametrize("make", [Linkedlist.from_iterable, _circular, lambda values: _circular(values, 12)])
+def test_middle(size, make):
+    linked_list = make(range(size))
+    node = linked_list.middle()
+    if size == 0:
+        assert node is None
+    else:
+        assert node.value == size // 2
+
+
+@pytest.mark.parametrize("size", range(8))
+@pytest.mark.parametrize("make", [Linkedlist.from_iterable, _circular, lambda values: _circular(values, 12)])
+def test_nth_from_end(size, make):
+    linked_list = make(range(size))
+    for k in range(-1, size + 3):
+        node = linked_list.nth_from_end(k)
+        if 1 <= k <= size:
+            assert node.value == size - k
+        else:
+            assert node is None
+
+
+@pytest.mark.parametrize("size", range(1, 10))
+def test_cycle_detection_on_cyclic_chains(size):
+    for start in range(size):
+        linked_list = _cyclic_chain(size, start)
+        assert linked_list.has_cycle()
+        assert linked_list.cycle_start().value == start
+
+
+@pytest.mark.parametrize("size", range(6))
+def test_cycle_detection_without_cycle(size):
+    linked_list = Linkedlist.from_iterable(range(size))
+    assert not linked_list.has_cycle()
+    assert linked_list.cycle_start() is None
+
+
+@pytest.mark.parametrize("size", range(6))
+def test_cycle_detection_on_circular_list(size):
+    circular = _circular(range(size))
+    assert circular.has_cycle() == (size > 0)
+    if size:
+        assert circular.cycle_start() is circular.head
+
+
+def test_single_pass():
+    # One pass: each pointer moves at most n times
+    # (hops also count re-reading a node's next between two pointers,
+    # so two pointers stay below 2n)
+    size = 1_000
+    linked_list = Linkedlist.from_iterable(range(size))
+    with instrumented(linked_list) as recorder:
+        linked_list.reverse()
+        linked_list.middle()
+        linked_list.nth_from_end(10)
+        linked_list.has_cycle()
+    stats = recorder.stats()
+    assert stats["reverse"]["hops"] == size
+    assert stats["middle"]["hops"] <= 2 * size
+    assert stats["nth_from_end"]["hops"] <= 2 * size
+    assert stats["has_cycle"]["hops"] <= 2 * size
@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+
+from link_list.singly_llinked_list.async_queue import AsyncLinkedQueue, QueueClosed
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, 10))
+    # A lost wakeup hangs a waiter; wait_for turns that into a failure
+
+
+async def _settle():
+    # Let every ready task run until it blocks again
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_fifo_order():
+    async def main():
+        queue = AsyncLinkedQueue()
+        for value in range(5):
+            await queue.put(value)
+        return [await queue.get() for _ in range(5)]
+
+    assert run(main()) == [0, 1, 2, 3, 4]
+
+
+def test_put_waits_while_full():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=2)
+        put_done = []
+
+        async def producer():
+            for value in range(5):
+                await queue.put(value)
+                put_done.append(value)
+
+        task = asyncio.create_task(producer())
+        await _settle()
+        assert put_done == [0, 1]
+        assert queue.full() and len(queue) == 2
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait("extra")
+
+        received = []
+        for _ in range(5):
+            received.append(await queue.get())
+            await _settle()
+            assert len(queue) <= 2
+        await task
+        return received, put_done
+
+    assert run(main()) == ([0, 1, 2, 3, 4], [0, 1, 2, 3, 4])
+
+
+def test_get_many():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=5)
+        for value in range(5):
+            queue.put_nowait(value)
+        first = await queue.get_many(3)
+        rest = await queue.get_many(10)
+
+        waiting = asyncio.create_task(queue.get_many(4))
+        await _settle()
+        assert not waiting.done()
+        queue.put_nowait("late")
+        return first, rest, await waiting
+
+    assert run(main()) == ([0, 1, 2], [3, 4], ["late"])
+
+
+def test_get_many_wakes_one_putter_per_freed_slot():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=3)
+        for value in range(3):
+            queue.put_nowait(value)
+        putters = [asyncio.create_task(queue.put(value)) for value in range(3, 6)]
+        await _settle()
+        assert not any(task.done() for task in putters)
+
+        assert await queue.get_many(3) == [0, 1, 2]
+        await _settle()
+        assert all(task.done() for task in putters)
+        return [queue.get_nowait() for _ in range(3)]
+
+    assert run(main()) == [3, 4, 5]
+
+
+def test_close_ends_async_for():
+    async def main():
+        queue = AsyncLinkedQueue()
+        received = []
+
+        async def consumer():
+            async for item in queue:
+                received.append(item)
+
+        task = asyncio.create_task(consumer())
+        for value in range(3):
+            await queue.put(value)
+        await _settle()
+        queue.put_nowait(3)
+        queue.close()
+        await task
+        with pytest.raises(QueueClosed):
+            await queue.put(4)
+        with pytest.raises(QueueClosed):
+            await queue.get()
+        return received
+
+    assert run(main()) == [0, 1, 2, 3]
+
+
+def test_close_wakes_waiting_getters():
+    async def main():
+        queue = AsyncLinkedQueue()
+        getters = [asyncio.create_task(queue.get()) for _ in range(3)]
+        await _settle()
+        queue.close()
+        results = await asyncio.gather(*getters, return_exceptions=True)
+        return [type(result) for result in results]
+
+    assert run(main()) == [QueueClosed] * 3
+
+
+def test_cancelled_getter_is_skipped():
+    async def main():
+        queue = AsyncLinkedQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await _settle()
+        first.cancel()
+        await _settle()
+        queue.put_nowait("item")
+        assert await second == "item"
+        assert first.cancelled()
+        assert not queue.getters
+
+    run(main())
+
+
+def test_woken_then_cancelled_getter_passes_the_item_on():
+    async def main():
+        queue = AsyncLinkedQueue()
+        first = asyncio.create_task(queue.get())
+        second = asyncio.create_task(queue.get())
+        await _settle()
+        queue.put_nowait("item")
+        # put_nowait() woke first, but first is cancelled before it runs
+        first.cancel()
+        assert await second == "item"
+        assert first.cancelled()
+
+    run(main())
+
+
+def test_woken_then_cancelled_putter_passes_the_slot_on():
+    async def main():
+        queue = AsyncLinkedQueue(maxsize=1)
+        queue.put_nowait(0)
+        first = asyncio.create_task(queue.put(1))
+        second = asyncio.create_task(queue.put(2))
+        await _settle()
+        assert queue.get_nowait() == 0
+        # get_nowait() woke first, but first is cancelled before it runs
+        first.cancel()
+        await second
+        assert first.cancelled()
+        return queue.get_nowait()
+
+    assert run(main()) == 2
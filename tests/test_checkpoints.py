@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from link_list import Linkedlist
+
+
+def _check(linked_list, reference):
+    assert list(linked_list) == reference
+    assert len(linked_list) == len(reference)
+    for index, value in enumerate(reference):
+        assert linked_list.get(index).value == value
+    if reference:
+        assert linked_list.tail.value == reference[-1]
+        assert linked_list.tail.next is None
+
+
+def test_insert_at_end_keeps_checkpoints_in_place():
+    linked_list = Linkedlist.from_iterable(range(3))
+    linked_list.enable_checkpoints(3)
+    linked_list.get(0)
+    linked_list.insert(3, 3)
+    for value in range(4, 9):
+        linked_list.append(value)
+
+    assert linked_list.get(4).value == 4
+    _check(linked_list, list(range(9)))
+
+
+def test_insert_into_empty_list_with_checkpoints():
+    linked_list = Linkedlist()
+    linked_list.enable_checkpoints(2)
+    linked_list.get(0)
+    linked_list.insert(0, "a")
+    linked_list.append("b")
+    linked_list.append("c")
+    _check(linked_list, ["a", "b", "c"])
+
+
+def test_default_step_follows_length():
+    linked_list = Linkedlist()
+    linked_list.enable_checkpoints()
+    linked_list.append(0)
+    linked_list.get(0)
+    for value in range(1, 10_001):
+        linked_list.append(value)
+
+    assert linked_list.get(5_000).value == 5_000
+    assert linked_list.checkpoint_step >= 50
+    assert len(linked_list.checkpoints) <= 2 * 100 + 2
+
+
+@pytest.mark.parametrize("every", [0, 2])
+def test_insert_after_last_checkpoint(every):
+    # The old last node moves onto a checkpoint position the table lacks
+    linked_list = Linkedlist.from_iterable(range(4))
+    linked_list.enable_checkpoints(every)
+    linked_list.get(0)
+    linked_list.insert(3, "x")
+    linked_list.append(5)
+    linked_list.append(6)
+
+    assert linked_list.get(4).value == 3
+    _check(linked_list, [0, 1, 2, "x", 3, 5, 6])
+
+
+@pytest.mark.parametrize("every", [0, 1, 2, 3])
+@pytest.mark.parametrize("seed", range(20))
+def test_random_operations_match_list(every, seed):
+    rng = random.Random(seed)
+    linked_list = Linkedlist()
+    linked_list.enable_checkpoints(every)
+    reference = []
+
+    for step in range(300):
+        operation = rng.randrange(7)
+        length = len(reference)
+        if operation == 0:
+            linked_list.append(step)
+            reference.append(step)
+        elif operation == 1:
+            linked_list.prepend(step)
+            reference.insert(0, step)
+        elif operation == 2:
+            index = rng.choice([rng.randint(0, length), max(0, length - 1)])
+            # Inserts just before the last node move it onto new positions
+            assert linked_list.insert(index, step)
+            reference.insert(index, step)
+        elif operation == 3 and length:
+            index = rng.randrange(length)
+            assert linked_list.get(index).value == reference[index]
+        elif operation == 4 and length:
+            assert linked_list.pop().value == reference.pop()
+        elif operation == 5 and length:
+            assert linked_list.pop_first().value == reference.pop(0)
+        elif operation == 6:
+            values = list(range(rng.randrange(5)))
+            linked_list.extend(values)
+            reference.extend(values)
+
+    _check(linked_list, reference)
@@ -0,0 +1,240 @@
+import random
+from collections import deque
+
+import pytest
+
+from link_list import CSLinked_List
+
+
+CAPACITY = 5
+
+
+def _circular(values, capacity=None):
+    circular = CSLinked_List(capacity)
+    circular.extend(values)
+    return circular
+
+
+def _ring_size(circular):
+    # Number of nodes in the circle, counted from head
+    if circular.head is None:
+        return 0
+    count = 1
+    temp_node = circular.head.next
+    while temp_node is not circular.head:
+        count += 1
+        temp_node = temp_node.next
+    return count
+
+
+def _check(circular, reference):
+    assert list(circular) == list(reference)
+    assert len(circular) == len(reference)
+
+    if circular.capacity is not None:
+        assert _ring_size(circular) == circular.capacity
+        # The ring always holds exactly `capacity` nodes, used or free
+        temp_node = circular.head
+        for _ in range(len(reference)):
+            temp_node = temp_node.next
+        assert circular.tail.next is temp_node
+        # tail is the last used node: head moved length steps is tail.next
+    elif reference:
+        assert _ring_size(circular) == len(reference)
+        assert circular.tail.next is circular.head
+        assert circular.tail.value == reference[-1]
+    else:
+        assert circular.head is None and circular.tail is None
+
+
+def _value(result):
+    # Normal mode returns removed nodes, ring mode returns values
+    return getattr(result, "value", result)
+
+
+@pytest.mark.parametrize("count", range(13))
+def test_ring_keeps_last_capacity_values(count):
+    circular = CSLinked_List(CAPACITY)
+    nodes_before = _ring_size(circular)
+    for value in range(count):
+        circular.append(value)
+    _check(circular, list(range(count))[-CAPACITY:])
+    assert nodes_before == CAPACITY
+
+    extended = _circular(range(count), CAPACITY)
+    _check(extended, list(range(count))[-CAPACITY:])
+
+
+def test_ring_does_not_allocate():
+    circular = CSLinked_List(3)
+    nodes = set()
+    temp_node = circular.head
+    for _ in range(3):
+        nodes.add(id(temp_node))
+        temp_node = temp_node.next
+    for value in range(10):
+        circular.append(value)
+        assert id(circular.tail) in nodes
+
+
+def test_ring_rejects_front_and_middle_inserts():
+    circular = _circular(range(3), CAPACITY)
+    with pytest.raises(ValueError):
+        circular.prepend(0)
+    with pytest.raises(ValueError):
+        circular.insert(1, 0)
+    with pytest.raises(ValueError):
+        CSLinked_List(0)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ring_matches_bounded_deque(seed):
+    rng = random.Random(seed)
+    circular = CSLinked_List(CAPACITY)
+    reference = deque(maxlen=CAPACITY)
+
+    for step in range(300):
+        operation = rng.randrange(4)
+        if operation == 0:
+            circular.append(step)
+            reference.append(step)
+        elif operation == 1:
+            values = list(range(step, step + rng.randrange(8)))
+            circular.extend(values)
+            reference.extend(values)
+        elif operation == 2:
+            assert circular.pop_first() == (reference.popleft() if reference else None)
+        else:
+            assert circular.pop() == (reference.pop() if reference else None)
+        _check(circular, reference)
+
+
+def _make(mode, values):
+    # mode: None → normal list, "free" → ring with free nodes, "full" → full ring
+    values = list(values)
+    if mode is None:
+        return _circular(values)
+    capacity = len(values) + (2 if mode == "free" else 0)
+    return _circular(values, max(1, capacity))
+
+
+MODES = [None, "free", "full"]
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("size", range(5))
+@pytest.mark.parametrize("k", [-7, -1, 0, 1, 2, 3, 9])
+def test_rotate(mode, size, k):
+    circular = _make(mode, range(size))
+    circular.rotate(k)
+    expected = list(range(size))
+    if size:
+        expected = expected[k % size:] + expected[:k % size]
+    _check(circular, expected)
+
+    circular.append("end")
+    if mode == "full" and size:
+        expected = expected[1:]
+    _check(circular, expected + ["end"])
+
+
+def _josephus(values, k):
+    # Naive reference: walk the circle one removal at a time
+    values = list(values)
+    order = []
+    position = 0
+    while values:
+        position = (position + k - 1) % len(values)
+        order.append(values.pop(position))
+    return order
+
+
+def test_eliminate_every_example():
+    assert list(_circular([1, 2, 3, 4, 5]).eliminate_every(2)) == [2, 4, 1, 5, 3]
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("size", [0, 1, 2, 7, 16, 41])
+@pytest.mark.parametrize("k", [1, 2, 3, 5, 50])
+def test_eliminate_every(mode, size, k):
+    circular = _make(mode, range(size))
+    assert list(circular.eliminate_every(k)) == _josephus(range(size), k)
+    _check(circular, list(range(size)))
+    # The list itself is not changed
+
+
+def test_eliminate_every_rejects_k_below_one():
+    with pytest.raises(ValueError):
+        list(_circular(range(3)).eliminate_every(0))
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("size", range(5))
+def test_get_set_and_search_wrap_around(mode, size):
+    circular = _make(mode, range(size))
+    reference = list(range(size))
+
+    for index in range(-2 * size - 1, 2 * size + 1):
+        node = circular.get(index)
+        if not size:
+            assert node is None
+            assert circular.set_value(index, "x") is False
+            continue
+        assert node.value == reference[index % size]
+        assert circular.set_value(index, ("set", index))
+        reference[index % size] = ("set", index)
+        _check(circular, reference)
+
+    for position, value in enumerate(reference):
+        assert circular.search(value) == position
+    assert circular.search("missing") == -1
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("size", range(5))
+def test_getitem_and_slices(mode, size):
+    circular = _make(mode, range(size))
+    reference = list(range(size))
+    for index in range(-size, size):
+        assert circular[index] == reference[index]
+    for index in (size, -size - 1):
+        with pytest.raises(IndexError):
+            circular[index]
+    for piece in (slice(None), slice(1, None), slice(None, None, -1), slice(-3, None, 2), slice(4, 0, -2)):
+        _check(circular[piece], reference[piece])
+
+
+@pytest.mark.parametrize("capacity", [None, 8])
+@pytest.mark.parametrize("seed", range(20))
+def test_positional_operations_match_list(capacity, seed):
+    rng = random.Random(seed)
+    circular = CSLinked_List(capacity)
+    reference = []
+
+    for step in range(300):
+        operation = rng.randrange(6)
+        length = len(reference)
+        if operation == 0:
+            circular.append(step)
+            reference.append(step)
+            if capacity is not None and len(reference) > capacity:
+                reference.pop(0)
+        elif operation == 1 and capacity is None:
+            index = rng.randint(-2 * length - 1, 2 * length + 1)
+            assert circular.insert(index, step) is True
+            if index == length or not length:
+                reference.append(step)
+            else:
+                reference.insert(index % length, step)
+        elif operation == 2:
+            index = rng.randint(-2 * length - 1, 2 * length + 1)
+            removed = circular.remove(index)
+            assert _value(removed) == (reference.pop(index % length) if length else None)
+        elif operation == 3:
+            assert _value(circular.pop()) == (reference.pop() if length else None)
+        elif operation == 4:
+            assert _value(circular.pop_first()) == (reference.pop(0) if length else None)
+        elif operation == 5 and length:
+            index = rng.randint(-2 * length, 2 * length)
+            assert circular.get(index).value == reference[index % length]
+        _check(circular, reference)
@@ -0,0 +1,137 @@
+import sys
+import threading
+from collections import Counter
+
+import pytest
+
+from link_list.singly_llinked_list.concurrent_ll import ConcurrentLinkedlist
+
+
+TIMEOUT = 30
+# seconds; a deadlock shows up as a thread that is still alive
+
+
+@pytest.fixture
+def fast_switching():
+    # Switch threads very often so interleavings that break locking show up
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run(workers):
+    threads = [threading.Thread(target=work, daemon=True) for work in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT)
+    assert not any(thread.is_alive() for thread in threads), "threads did not finish (deadlock?)"
+
+
+def _check_structure(linked_list):
+    values = linked_list.snapshot()
+    assert len(linked_list) == len(values)
+    last = linked_list.sentinel
+    while last.next is not None:
+        last = last.next
+    assert linked_list.tail is last
+    assert not any(_held_locks(linked_list))
+    return values
+
+
+def _held_locks(linked_list):
+    temp_node = linked_list.sentinel
+    while temp_node is not None:
+        yield temp_node.lock.locked()
+        temp_node = temp_node.next
+    yield linked_list.tail_lock.locked()
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_no_lost_or_duplicated_values(fast_switching, seed):
+    linked_list = ConcurrentLinkedlist()
+    for value in range(50):
+        linked_list.append(("start", value))
+
+    producers = 3
+    per_producer = 1_000
+    inserts = 300
+    taken = []
+    inserted = []
+    # list.append is atomic, so workers can share these lists
+    producers_done = threading.Event()
+    finished = Counter()
+    finished_lock = threading.Lock()
+
+    def producer(number):
+        def work():
+            for value in range(per_producer):
+                linked_list.append((number, value))
+            with finished_lock:
+                finished["producers"] += 1
+                if finished["producers"] == producers:
+                    producers_done.set()
+        return work
+
+    def consumer():
+        while True:
+            value = linked_list.pop_first()
+            if value is not None:
+                taken.append(value)
+            elif producers_done.is_set():
+                return
+
+    def middle():
+        for value in range(inserts):
+            if linked_list.insert((value * 7 + seed) % 20, ("middle", value)):
+                inserted.append(("middle", value))
+                # insert() fails when the list is shorter than the index
+            if value % 3 == 0:
+                removed = linked_list.remove(value % 10)
+                if removed is not None:
+                    taken.append(removed)
+            if value % 5 == 0:
+                removed = linked_list.pop()
+                if removed is not None:
+                    taken.append(removed)
+
+    def reader():
+        while not producers_done.is_set():
+            linked_list.get(5)
+            linked_list.search(("never", 0))
+            linked_list.snapshot()
+
+    _run([producer(number) for number in range(producers)] + [consumer, consumer, middle, reader])
+
+    remaining = _check_structure(linked_list)
+    added = ([("start", value) for value in range(50)]
+             + [(number, value) for number in range(producers) for value in range(per_producer)]
+             + inserted)
+    seen = Counter(taken) + Counter(remaining)
+    assert max(seen.values()) == 1
+    assert set(seen) == set(added)
+
+
+def test_producer_order_is_kept(fast_switching):
+    linked_list = ConcurrentLinkedlist()
+    taken = []
+    done = threading.Event()
+
+    def producer():
+        for value in range(2_000):
+            linked_list.append(value)
+        done.set()
+
+    def consumer():
+        while True:
+            value = linked_list.pop_first()
+            if value is not None:
+                taken.append(value)
+            elif done.is_set() and len(linked_list) == 0:
+                return
+
+    _run([producer, consumer])
+    assert taken == list(range(2_000))
+    assert _check_structure(linked_list) == []
+    assert linked_list.tail is linked_list.sentinel
@@ -0,0 +1,22 @@
+import pytest
+
+from link_list import Linkedlist
+
+
+@pytest.mark.parametrize("enable", [
+    lambda linked_list: None,
+    Linkedlist.enable_position_index,
+    Linkedlist.enable_value_index,
+    lambda linked_list: linked_list.enable_checkpoints(2),
+])
+def test_extend_with_itself(enable):
+    linked_list = Linkedlist.from_iterable(range(5))
+    enable(linked_list)
+    linked_list.extend(linked_list)
+
+    assert list(linked_list) == [0, 1, 2, 3, 4] * 2
+    assert len(linked_list) == 10
+    assert linked_list.tail.value == 4
+    assert linked_list.tail.next is None
+    assert [linked_list.get(index).value for index in range(10)] == [0, 1, 2, 3, 4] * 2
+    assert linked_list.search(4) == 4
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from link_list.bench import IMPORT_TIME_BUDGET_MS, IMPORT_TIME_MODULES, measure_import_time
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_import_time_budget_and_no_side_effects():
+    # Runs python -X importtime in a fresh interpreter, like
+    # python -m link_list.bench --import-time
+    milliseconds, printed = measure_import_time()
+    assert printed == ""
+    assert milliseconds <= IMPORT_TIME_BUDGET_MS, (
+        f"importing {', '.join(IMPORT_TIME_MODULES)} took {milliseconds:.1f} ms, "
+        f"budget {IMPORT_TIME_BUDGET_MS:g} ms")
+
+
+def test_optional_modules_are_not_imported():
+    # numpy, process pools, tracemalloc and mmap are imported on first use only
+    code = ("import sys, " + ", ".join(IMPORT_TIME_MODULES) + "\n"
+            "print(' '.join(name for name in ('numpy', 'concurrent.futures', 'tracemalloc', 'mmap') "
+            "if name in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT, check=True)
+    assert result.stdout.strip() == ""
@@ -0,0 +1,70 @@
+import pickle
+
+from link_list import CSLinked_List, Linkedlist
+from link_list.singly_llinked_list.instrumentation import instrument, instrumented, uninstrument
+from link_list.singly_llinked_list.sll_nodesnLL import Node
+
+
+def test_hops_count_steps_not_reads():
+    linked_list = Linkedlist.from_iterable(range(100))
+    with instrumented(linked_list) as recorder:
+        linked_list.get(50)
+        linked_list.append(100)
+    stats = recorder.stats()
+    assert stats["get"]["hops"] == 50
+    assert stats["append"]["allocations"] == 1
+
+
+def test_other_lists_keep_plain_nodes():
+    linked_list = Linkedlist.from_iterable(range(5))
+    other = Linkedlist()
+    instrument(linked_list)
+    linked_list.append(5)
+    other.append(1)
+    assert type(other.head) is Node
+    assert type(Linkedlist.from_iterable([1]).head) is Node
+    uninstrument(linked_list)
+
+
+def test_derived_lists_are_plain():
+    linked_list = Linkedlist.from_iterable(range(10))
+    with instrumented(linked_list):
+        part = linked_list[2:5]
+        empty = linked_list[5:2]
+        copy = pickle.loads(pickle.dumps(linked_list))
+    for derived in (part, empty, copy):
+        assert type(derived) is Linkedlist
+        assert "_recorder" not in derived.__dict__
+    assert all(type(node) is Node for node in _nodes(part))
+    assert list(part) == [2, 3, 4]
+    assert list(copy) == list(range(10))
+
+
+def test_uninstrument_restores_everything():
+    linked_list = Linkedlist.from_iterable(range(3))
+    with instrumented(linked_list):
+        linked_list.append(3)
+        linked_list.insert(1, 9)
+    assert type(linked_list) is Linkedlist
+    assert "_node_class" not in linked_list.__dict__
+    assert all(type(node) is Node for node in _nodes(linked_list))
+    assert list(linked_list) == [0, 9, 1, 2, 3]
+
+
+def test_circular_list():
+    circular = CSLinked_List()
+    for value in range(4):
+        circular.append(value)
+    with instrumented(circular) as recorder:
+        circular.append(4)
+        assert circular.get(3).value == 3
+    assert recorder.stats()["append"]["allocations"] == 1
+    assert type(circular) is CSLinked_List
+    assert list(circular) == [0, 1, 2, 3, 4]
+
+
+def _nodes(linked_list):
+    temp_node = linked_list.head
+    while temp_node is not None:
+        yield temp_node
+        temp_node = temp_node.next
@@ -0,0 +1,41 @@
+import sys
+
+from link_list import Linkedlist
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def test_deep_follows_containers():
+    inner = [10**30, 10**31]
+    linked_list = Linkedlist.from_iterable([inner])
+    usage = linked_list.memory_usage()
+    expected = sys.getsizeof(inner) + sys.getsizeof(inner[0]) + sys.getsizeof(inner[1])
+    assert usage["value_bytes"] == expected
+    assert usage["total_bytes"] == usage["node_bytes"] + expected
+
+
+def test_deep_counts_shared_objects_once():
+    shared = "x" * 1000
+    values = [[shared], {"key": shared}, (shared,)]
+    linked_list = Linkedlist.from_iterable(values + [shared])
+    expected = sum(map(sys.getsizeof, values)) + sys.getsizeof("key") + sys.getsizeof(shared)
+    assert linked_list.memory_usage()["value_bytes"] == expected
+
+
+def test_deep_follows_attributes_and_cycles():
+    point = Point(10**40, [])
+    point.y.append(point)
+    linked_list = Linkedlist.from_iterable([point])
+    value_bytes = linked_list.memory_usage()["value_bytes"]
+    assert value_bytes >= sys.getsizeof(point) + sys.getsizeof(vars(point)) + sys.getsizeof(point.x)
+
+
+def test_shallow_skips_values():
+    linked_list = Linkedlist.from_iterable([[1, 2, 3]])
+    usage = linked_list.memory_usage(deep=False)
+    assert usage["value_bytes"] == 0
+    assert usage["nodes"] == 1
@@ -0,0 +1,55 @@
+import copy
+import pickle
+
+import pytest
+
+from link_list import PersistentList
+from link_list.singly_llinked_list.persistent_ll import PersistentNode
+
+
+def test_copy_shares_the_list():
+    persistent_list = PersistentList([1, 2, 3])
+    assert copy.copy(persistent_list) is persistent_list
+
+
+def test_deepcopy_copies_values():
+    persistent_list = PersistentList([[1], [2]])
+    copied = copy.deepcopy(persistent_list)
+    assert copied == persistent_list
+    assert copied.first() is not persistent_list.first()
+    assert copied.head is not persistent_list.head
+
+
+def test_pickle_round_trip():
+    persistent_list = PersistentList(range(50_000))
+    # Long enough to overflow the recursion limit if nodes were pickled one inside the other
+    loaded = pickle.loads(pickle.dumps(persistent_list))
+    assert type(loaded) is PersistentList
+    assert loaded == persistent_list
+    assert len(loaded) == 50_000
+    with pytest.raises(AttributeError):
+        loaded.length = 0
+
+
+def test_node_copy_and_pickle():
+    node = PersistentList(range(5)).head
+    for copied in (copy.copy(node), copy.deepcopy(node), pickle.loads(pickle.dumps(node))):
+        assert type(copied) is PersistentNode
+        values = []
+        while copied is not None:
+            values.append(copied.value)
+            copied = copied.next
+        assert values == [0, 1, 2, 3, 4]
+
+
+def test_updates_share_the_suffix():
+    persistent_list = PersistentList(range(6))
+    changed = persistent_list.set_value(2, "x")
+    assert list(changed) == [0, 1, "x", 3, 4, 5]
+    assert list(persistent_list) == [0, 1, 2, 3, 4, 5]
+    assert changed.head.next.next.next is persistent_list.head.next.next.next
+
+    assert list(persistent_list.insert(6, "end")) == [0, 1, 2, 3, 4, 5, "end"]
+    assert list(persistent_list.insert(0, "start")) == ["start", 0, 1, 2, 3, 4, 5]
+    assert list(persistent_list.remove(-1)) == [0, 1, 2, 3, 4]
+    assert persistent_list.remove(0).head is persistent_list.head.next
@@ -0,0 +1,47 @@
+import os
+import uuid
+import warnings
+
+import pytest
+
+from link_list import SharedLinkedlist
+
+
+def _name():
+    return f"llsm_test_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+
+
+def test_full_list_raises_value_error():
+    with SharedLinkedlist.create(2) as shared_list:
+        shared_list.append(1)
+        shared_list.append(2)
+        with pytest.raises(ValueError, match="full"):
+            shared_list.append(3)
+        with pytest.raises(ValueError, match="full"):
+            shared_list.prepend(0)
+        assert list(shared_list) == [1, 2]
+
+
+def test_wrong_type_does_not_lose_a_slot():
+    with SharedLinkedlist.create(1) as shared_list:
+        with pytest.raises(TypeError):
+            shared_list.append("text")
+        shared_list.append(7)
+        assert list(shared_list) == [7]
+
+
+def test_from_iterable_overflow_unlinks_the_block():
+    name = _name()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(ValueError, match="full"):
+            SharedLinkedlist.from_iterable(range(5), capacity=3, name=name)
+    with pytest.raises(FileNotFoundError):
+        SharedLinkedlist.attach(name)
+    # The block is gone already, not left for the resource tracker
+
+
+def test_from_iterable_round_trip():
+    with SharedLinkedlist.from_iterable(range(5), capacity=8) as shared_list:
+        assert list(shared_list) == [0, 1, 2, 3, 4]
+        assert len(shared_list) == 5
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from link_list import Linkedlist
+
+
+def _with_indexes(values):
+    linked_list = Linkedlist.from_iterable(values)
+    linked_list.enable_position_index()
+    linked_list.enable_value_index()
+    linked_list.enable_checkpoints(3)
+    linked_list.get(0)
+    # Build the checkpoint table so a stale one would show up
+    return linked_list
+
+
+def _check(linked_list, reference):
+    assert list(linked_list) == reference
+    assert len(linked_list) == len(reference)
+    for index, value in enumerate(reference):
+        assert linked_list.get(index).value == value
+    if reference:
+        assert linked_list.tail.value == reference[-1]
+        assert linked_list.tail.next is None
+    else:
+        assert linked_list.head is None and linked_list.tail is None
+    linked_list.append("end")
+    assert list(linked_list)[-1] == "end"
+    # append() relies on tail
+    linked_list.pop()
+
+
+def _records(size, seed):
+    # (key, original position) pairs with many equal keys, so stability shows
+    rng = random.Random(seed)
+    return [(rng.randrange(5), position) for position in range(size)]
+
+
+def _first(record):
+    return record[0]
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 7, 16, 33])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_sort_is_stable(size, reverse, seed):
+    records = _records(size, seed)
+    linked_list = _with_indexes(records)
+    linked_list.sort(key=_first, reverse=reverse)
+    expected = sorted(records, key=_first, reverse=reverse)
+    _check(linked_list, expected)
+    for position, record in enumerate(expected):
+        assert linked_list.search(record) == position
+
+
+def test_sort_without_key():
+    linked_list = Linkedlist.from_iterable([5, 3, 9, 1, 3])
+    linked_list.sort()
+    _check(linked_list, [1, 3, 3, 5, 9])
+    linked_list.sort(reverse=True)
+    _check(linked_list, [9, 5, 3, 3, 1])
+
+
+@pytest.mark.parametrize("left_size", [0, 1, 4, 9])
+@pytest.mark.parametrize("right_size", [0, 1, 5])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_merge_sorted(left_size, right_size, reverse):
+    left_records = sorted(_records(left_size, 1), key=_first, reverse=reverse)
+    right_records = sorted([(key, ("other", position)) for key, position in _records(right_size, 2)],
+                           key=_first, reverse=reverse)
+    left = _with_indexes(left_records)
+    right = _with_indexes(right_records)
+
+    left.merge_sorted(right, key=_first, reverse=reverse)
+
+    expected = sorted(left_records + right_records, key=_first, reverse=reverse)
+    # sorted() is stable, so equal keys from left come first, like merge_sorted
+    _check(left, expected)
+    for position, record in enumerate(expected):
+        assert left.search(record) == position
+
+    _check(right, [])
+    assert right.get(0) is None
+    for record in right_records:
+        assert right.search(record) == -1
+    right.append("new")
+    _check(right, ["new"])
+
+
+def test_merge_with_itself_is_rejected():
+    linked_list = Linkedlist.from_iterable([1, 2])
+    with pytest.raises(ValueError):
+        linked_list.merge_sorted(linked_list)
@@ -0,0 +1,38 @@
+import pytest
+
+from link_list import Linkedlist
+from link_list.singly_llinked_list.ll_storage import HEADER, MappedList, load, save
+
+
+@pytest.mark.parametrize("values", [[], list(range(100)), [0.5, 1.5], ["a", None, (1, 2), True]])
+def test_round_trip(tmp_path, values):
+    path = tmp_path / "list.llst"
+    save(Linkedlist.from_iterable(values), path)
+    assert list(load(path, Linkedlist)) == values
+    with MappedList(path) as mapped:
+        assert list(mapped) == values
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.llst"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="too short"):
+        MappedList(path)
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "other.llst"
+    path.write_bytes(b"NOPE" + bytes(HEADER.size))
+    with pytest.raises(ValueError, match="bad magic"):
+        MappedList(path)
+
+
+@pytest.mark.parametrize("values", [list(range(100)), [str(value) for value in range(100)]])
+@pytest.mark.parametrize("cut", [1, 8, 200])
+def test_truncated_file(tmp_path, values, cut):
+    path = tmp_path / "list.llst"
+    save(Linkedlist.from_iterable(values), path)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) - cut])
+    with pytest.raises(ValueError, match="truncated"):
+        MappedList(path)
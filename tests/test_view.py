@@ -0,0 +1,31 @@
+import pytest
+
+from link_list import Linkedlist
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+def test_view_is_lazy_and_per_value():
+    linked_list = Linkedlist.from_iterable(range(10))
+    calls = []
+
+    def predicate(value):
+        calls.append(value)
+        return is_even(value)
+
+    view = linked_list.view(2, 8).filter(predicate).map(lambda value: value * 10)
+    assert calls == []
+    assert list(view) == [20, 40, 60]
+    assert calls == [2, 3, 4, 5, 6, 7]
+    assert list(view.materialize()) == [20, 40, 60]
+
+
+def test_list_filter_is_eager_and_vectorized():
+    pytest.importorskip("numpy")
+    linked_list = Linkedlist.from_iterable(range(10))
+    filtered = linked_list.filter(is_even)
+    # is_even gets the whole array here and returns one bool per value
+    assert type(filtered) is Linkedlist
+    assert list(filtered) == list(linked_list.view().filter(is_even))